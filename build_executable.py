@@ -7,6 +7,7 @@ Build script for creating the immich-py executable using PyInstaller.
 This script is called by Poetry's build command to create the executable.
 """
 
+import argparse
 import logging
 import platform
 import shutil
@@ -19,24 +20,32 @@ logger = logging.getLogger(__name__)
 
 
 def build_executable():
-    """Build the immich-py executable using PyInstaller."""
+    """
+    Build the immich-py executable using PyInstaller.
+
+    By default a single-file executable is built. With --onedir, the
+    executable is built together with its libraries in a directory, which
+    avoids unpacking the bundle to a temporary directory on every launch;
+    the directory is also packed into a zip archive for distribution.
+    """
+    parser = argparse.ArgumentParser(description=build_executable.__doc__)
+    parser.add_argument(
+        "--onedir",
+        action="store_true",
+        help="Build a directory instead of a single-file executable.",
+    )
+    options = parser.parse_args()
+
     # Get the current directory
     current_dir = Path.cwd()
 
-    # Define PyInstaller arguments
+    # Build options (hidden imports, excludes, strip/UPX) live in the spec file
     pyinstaller_args = [
-        "build_entry.py",  # Entry point script
-        "--name=immich-py",
-        "--onefile",
+        str(current_dir / "immich-py.spec"),
         "--clean",
-        "--console",
-        "--hidden-import=immich_py.cli.commands",
-        "--hidden-import=immich_py.cli.commands.album",
-        "--hidden-import=immich_py.cli.commands.asset",
-        "--hidden-import=immich_py.cli.commands.job",
-        "--hidden-import=immich_py.cli.commands.server",
-        "--hidden-import=immich_py.cli.commands.tag",
     ]
+    if options.onedir:
+        pyinstaller_args += ["--", "--onedir"]
 
     # Build the executable
     try:
@@ -50,7 +59,9 @@ def build_executable():
     if platform.system() == "Windows":
         exe_name += ".exe"
 
-    exe_path = dist_dir / exe_name
+    exe_path = (
+        dist_dir / "immich-py" / exe_name if options.onedir else dist_dir / exe_name
+    )
 
     # Check if the executable was built
     if not exe_path.exists():
@@ -60,6 +71,14 @@ def build_executable():
     build_dir = current_dir / "build" / "executable"
     Path(build_dir).mkdir(parents=True, exist_ok=True)
 
+    if options.onedir:
+        # Copy the application directory and pack it for distribution
+        target_dir = build_dir / "immich-py"
+        shutil.rmtree(target_dir, ignore_errors=True)
+        shutil.copytree(exe_path.parent, target_dir)
+        shutil.make_archive(str(target_dir), "zip", build_dir, "immich-py")
+        return
+
     # Copy the executable to the build directory
     target_path = build_dir / exe_name
     shutil.copy2(exe_path, target_path)
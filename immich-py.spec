@@ -0,0 +1,105 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+PyInstaller spec for the immich-py executable.
+
+Build with `poetry run build-executable`, or directly with
+`pyinstaller immich-py.spec --clean`. Pass `-- --onedir` after the spec to
+build a directory instead of a single file: a onefile executable unpacks
+itself to a temporary directory on every launch, while a onedir build
+starts immediately.
+"""
+
+import argparse
+import sys
+
+parser = argparse.ArgumentParser()
+parser.add_argument("--onedir", action="store_true")
+options = parser.parse_args()
+
+# CLI command modules are registered dynamically, so PyInstaller cannot
+# discover them on its own
+hiddenimports = [
+    "immich_py.cli.commands",
+    "immich_py.cli.commands.album",
+    "immich_py.cli.commands.asset",
+    "immich_py.cli.commands.job",
+    "immich_py.cli.commands.server",
+    "immich_py.cli.commands.tag",
+]
+
+# Standard library and tooling modules the CLI never imports. Keeping them out
+# of the archive shrinks the executable and the amount of data the onefile
+# bootloader has to extract on every launch.
+excludes = [
+    "tkinter",
+    "_tkinter",
+    "turtle",
+    "turtledemo",
+    "idlelib",
+    "unittest",
+    "doctest",
+    "test",
+    "lib2to3",
+    "pydoc_data",
+    "distutils",
+    "setuptools",
+    "pkg_resources",
+    "pip",
+    "ensurepip",
+    "venv",
+    "xmlrpc",
+    "curses",
+]
+
+a = Analysis(
+    ["build_entry.py"],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+    optimize=0,
+)
+pyz = PYZ(a.pure)
+
+exe_contents = [a.scripts] if options.onedir else [a.scripts, a.binaries, a.datas]
+
+exe = EXE(
+    pyz,
+    *exe_contents,
+    [],
+    exclude_binaries=options.onedir,
+    name="immich-py",
+    debug=False,
+    bootloader_ignore_signals=False,
+    # strip is not supported for Windows binaries
+    strip=sys.platform != "win32",
+    # UPX-compressed binaries are slower to start and prone to corruption and
+    # antivirus false positives
+    upx=False,
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+
+if options.onedir:
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=sys.platform != "win32",
+        upx=False,
+        upx_exclude=[],
+        name="immich-py",
+    )
@@ -4,23 +4,53 @@
 Immich Python Client.
 
 This package provides a client for interacting with the Immich API.
+
+Public names are resolved lazily on first access (PEP 562) so that importing
+the package, e.g. for the CLI entry point, does not pull in every API module.
 """
 
-from .api.album import AlbumAPI
-from .api.asset import AssetAPI
-from .api.client import ImmichClient, ImmichClientError
-from .api.job import JobAPI
-from .api.server import ServerAPI
-from .api.tag import TagAPI
-from .api.user import UserAPI
-from .models.album import Album, AlbumInfo
-from .models.asset import Asset, AssetType, ExifInfo
-from .models.job import Job, JobCommand, JobName
-from .models.tag import Tag
-from .models.user import User
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api.album import AlbumAPI
+    from .api.asset import AssetAPI
+    from .api.client import ImmichClient, ImmichClientError
+    from .api.job import JobAPI
+    from .api.server import ServerAPI
+    from .api.tag import TagAPI
+    from .api.user import UserAPI
+    from .models.album import Album, AlbumInfo
+    from .models.asset import Asset, AssetType, ExifInfo
+    from .models.job import Job, JobCommand, JobName
+    from .models.tag import Tag
+    from .models.user import User
 
 __version__ = "0.1.0"
 
+# Maps each public name to the module that provides it. The API classes are
+# delegated to immich_py.api, which owns the lazy table for its submodules.
+_LAZY_IMPORTS: dict[str, str] = {
+    "AlbumAPI": "immich_py.api",
+    "AssetAPI": "immich_py.api",
+    "ImmichClient": "immich_py.api.client",
+    "ImmichClientError": "immich_py.api.client",
+    "JobAPI": "immich_py.api",
+    "ServerAPI": "immich_py.api",
+    "TagAPI": "immich_py.api",
+    "UserAPI": "immich_py.api",
+    "Album": "immich_py.models.album",
+    "AlbumInfo": "immich_py.models.album",
+    "Asset": "immich_py.models.asset",
+    "AssetType": "immich_py.models.asset",
+    "ExifInfo": "immich_py.models.asset",
+    "Job": "immich_py.models.job",
+    "JobCommand": "immich_py.models.job",
+    "JobName": "immich_py.models.job",
+    "Tag": "immich_py.models.tag",
+    "User": "immich_py.models.user",
+}
+
 __all__ = [
     "Album",
     "AlbumAPI",
@@ -41,3 +71,34 @@ __all__ = [
     "User",
     "UserAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a public name on first access.
+
+    Args:
+        name: The attribute name.
+
+    Returns
+    -------
+        The requested object.
+
+    Raises
+    ------
+        AttributeError: If the name is not a public attribute of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazily resolved names."""
+    return sorted(set(globals()) | set(__all__))
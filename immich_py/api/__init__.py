@@ -4,14 +4,31 @@
 API modules for the Immich API.
 
 This package contains API modules for interacting with the Immich API.
+
+The API classes are resolved lazily on first access (PEP 562) so that
+importing a single submodule does not import all of its siblings.
 """
 
-from .album import AlbumAPI
-from .asset import AssetAPI
-from .job import JobAPI
-from .server import ServerAPI
-from .tag import TagAPI
-from .user import UserAPI
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .album import AlbumAPI
+    from .asset import AssetAPI
+    from .job import JobAPI
+    from .server import ServerAPI
+    from .tag import TagAPI
+    from .user import UserAPI
+
+# Maps each public name to the module that defines it
+_LAZY_IMPORTS: dict[str, str] = {
+    "AlbumAPI": "immich_py.api.album",
+    "AssetAPI": "immich_py.api.asset",
+    "JobAPI": "immich_py.api.job",
+    "ServerAPI": "immich_py.api.server",
+    "TagAPI": "immich_py.api.tag",
+    "UserAPI": "immich_py.api.user",
+}
 
 __all__ = [
     "AlbumAPI",
@@ -21,3 +38,34 @@ __all__ = [
     "TagAPI",
     "UserAPI",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve a public name on first access.
+
+    Args:
+        name: The attribute name.
+
+    Returns
+    -------
+        The requested object.
+
+    Raises
+    ------
+        AttributeError: If the name is not a public attribute of the package.
+    """
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the module so later lookups bypass __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including lazily resolved names."""
+    return sorted(set(globals()) | set(__all__))
@@ -6,13 +6,23 @@ Album API for the Immich API.
 This module contains the AlbumAPI class for interacting with albums in the Immich API.
 """
 
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from immich_py.models.album import Album, AlbumInfo
 
+# Client methods AlbumAPI exposes unchanged, without a wrapper frame
+_PASSTHROUGH = frozenset({"add_assets_to_album", "delete_album"})
+
 
 class AlbumAPI:
-    """API for interacting with albums in the Immich API."""
+    """
+    API for interacting with albums in the Immich API.
+
+    Methods that need no post-processing are forwarded to the client as-is:
+    add_assets_to_album and delete_album. See ImmichClient for their
+    signatures.
+    """
 
     def __init__(self, client):
         """
@@ -23,6 +33,42 @@ class AlbumAPI:
         """
         self.client = client
 
+    def __getattr__(self, name: str) -> Any:
+        """
+        Forward pass-through methods to the client.
+
+        Args:
+            name: The attribute name.
+
+        Returns
+        -------
+            The client's bound method of the same name.
+
+        Raises
+        ------
+            AttributeError: If the name is not a pass-through method.
+        """
+        if name in _PASSTHROUGH:
+            return getattr(self.client, name)
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __dir__(self) -> list[str]:
+        """List the attributes, including the forwarded client methods."""
+        return sorted(set(super().__dir__()) | _PASSTHROUGH)
+
+    if TYPE_CHECKING:
+        # Signatures of the forwarded client methods for type checkers and
+        # IDEs; at runtime they are looked up by __getattr__
+
+        def add_assets_to_album(
+            self, album_id: str, asset_ids: list[str]
+        ) -> list[dict[str, Any]]:
+            """Add assets to an album. See ImmichClient.add_assets_to_album."""
+
+        def delete_album(self, album_id: str) -> dict[str, Any]:
+            """Delete an album. See ImmichClient.delete_album."""
+
     def get_all_albums(self) -> list[Album]:
         """
         Get all albums.
@@ -36,46 +82,44 @@ class AlbumAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.get_all_albums()
-        return [Album.from_dict(album) for album in data]
+        return Album.from_dicts(data)
 
-    def get_album_info(self, album_id: str, without_assets: bool = False) -> AlbumInfo:
+    def get_album_by_name(self, album_name: str) -> Album | None:
         """
-        Get information about an album.
+        Get an album by name.
 
         Args:
-            album_id: The ID of the album.
-            without_assets: Whether to exclude assets from the response.
+            album_name: The name of the album.
 
         Returns
         -------
-            Information about the album.
+            The first album with the given name, or None if there is none.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
-        data = self.client.get_album_info(album_id, without_assets)
-        return AlbumInfo.from_dict(data)
+        data = self.client.get_albums_by_name().get(album_name)
+        return Album.from_dict(data) if data is not None else None
 
-    def add_assets_to_album(
-        self, album_id: str, asset_ids: list[str]
-    ) -> list[dict[str, Any]]:
+    def get_album_info(self, album_id: str, without_assets: bool = False) -> AlbumInfo:
         """
-        Add assets to an album.
+        Get information about an album.
 
         Args:
             album_id: The ID of the album.
-            asset_ids: The IDs of the assets to add.
+            without_assets: Whether to exclude assets from the response.
 
         Returns
         -------
-            The response from the server.
+            Information about the album.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
-        return self.client.add_assets_to_album(album_id, asset_ids)
+        data = self.client.get_album_info(album_id, without_assets)
+        return AlbumInfo.from_dict(data)
 
     def create_album(
         self,
@@ -118,21 +162,37 @@ class AlbumAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.get_asset_albums(asset_id)
-        return [Album.from_dict(album) for album in data]
+        return Album.from_dicts(data)
 
-    def delete_album(self, album_id: str) -> dict[str, Any]:
+    def get_assets_albums(
+        self, asset_ids: list[str], max_workers: int = 16
+    ) -> dict[str, list[Album]]:
         """
-        Delete an album.
+        Get the albums of several assets concurrently.
 
         Args:
-            album_id: The ID of the album.
+            asset_ids: The IDs of the assets.
+            max_workers: Maximum number of concurrent requests.
 
         Returns
         -------
-            The response from the server.
+            A dictionary mapping each asset ID to its albums.
 
         Raises
         ------
-            ImmichClientError: If the request fails.
+            ImmichClientError: If any of the requests fails.
         """
-        return self.client.delete_album(album_id)
+        unique_ids = list(dict.fromkeys(asset_ids))
+        if not unique_ids:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(unique_ids))
+        ) as executor:
+            return dict(
+                zip(
+                    unique_ids,
+                    executor.map(self.get_asset_albums, unique_ids),
+                    strict=True,
+                )
+            )
@@ -6,12 +6,24 @@ Asset API for the Immich API.
 This module contains the AssetAPI class for interacting with assets in the Immich API.
 """
 
+import asyncio
+import functools
+import logging
+import os
+from collections.abc import Iterable, Iterator, Mapping
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import httpx
 
 import immich_py.api.upload_utils
-from immich_py.api.asset_hash import AssetHashDatabase, hash_file
+from immich_py.api.asset_hash import (
+    AssetHashDatabase,
+    hash_file,
+    new_hash,
+    server_checksum,
+)
 from immich_py.models.asset import Asset
 from immich_py.progress import (
     add_album,
@@ -21,9 +33,61 @@ from immich_py.progress import (
     set_max_workers,
 )
 
+logger = logging.getLogger(__name__)
+
+# Client methods AssetAPI exposes unchanged, without a wrapper frame
+_PASSTHROUGH = frozenset({
+    "download_asset",
+    "download_asset_to",
+    "delete_assets",
+    "update_assets",
+    "replace_asset",
+})
+
+# API field names accepted by update_asset, in parameter order
+_UPDATE_FIELDS = (
+    "isArchived",
+    "isFavorite",
+    "latitude",
+    "longitude",
+    "description",
+    "rating",
+    "dateTimeOriginal",
+)
+
+
+class _StreamingHash:
+    """
+    Hash a file from the data sent while uploading it.
+
+    If the upload did not read the whole file (for example in dry-run mode),
+    the file is hashed from disk instead.
+    """
+
+    def __init__(self, file_path: Path, file_size: int):
+        self._file_path = file_path
+        self._file_size = file_size
+        self._hash = new_hash()
+        self._hashed = 0
+
+    def update(self, data: bytes) -> None:
+        self._hash.update(data)
+        self._hashed += len(data)
+
+    def hexdigest(self) -> str:
+        if self._hashed != self._file_size:
+            return hash_file(self._file_path)
+        return self._hash.hexdigest()
+
 
 class AssetAPI:
-    """API for interacting with assets in the Immich API."""
+    """
+    API for interacting with assets in the Immich API.
+
+    Methods that need no post-processing are forwarded to the client as-is:
+    download_asset, download_asset_to, delete_assets, update_assets and
+    replace_asset. See ImmichClient for their signatures.
+    """
 
     # Initialize the hash database once at the class level
     _hash_db = AssetHashDatabase()
@@ -37,40 +101,94 @@ class AssetAPI:
         """
         self.client = client
 
-    def get_asset_info(self, asset_id: str) -> Asset:
+    def __getattr__(self, name: str) -> Any:
         """
-        Get information about an asset.
+        Forward pass-through methods to the client.
 
         Args:
-            asset_id: The ID of the asset.
+            name: The attribute name.
 
         Returns
         -------
-            Information about the asset.
+            The client's bound method of the same name.
 
         Raises
         ------
-            ImmichClientError: If the request fails.
+            AttributeError: If the name is not a pass-through method.
         """
-        data = self.client.get_asset_info(asset_id)
-        return Asset.from_dict(data)
+        if name in _PASSTHROUGH:
+            return getattr(self.client, name)
+        msg = f"{type(self).__name__!r} object has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    def __dir__(self) -> list[str]:
+        """List the attributes, including the forwarded client methods."""
+        return sorted(set(super().__dir__()) | _PASSTHROUGH)
+
+    if TYPE_CHECKING:
+        # Signatures of the forwarded client methods for type checkers and
+        # IDEs; at runtime they are looked up by __getattr__
+
+        def download_asset(
+            self, asset_id: str, destination: str | Path | BinaryIO | None = None
+        ) -> bytes | int:
+            """Download an asset. See ImmichClient.download_asset."""
+
+        def download_asset_to(
+            self,
+            asset_id: str,
+            destination: str | Path | BinaryIO,
+            *,
+            chunk_size: int = ...,
+        ) -> int:
+            """Download an asset to a file. See ImmichClient.download_asset_to."""
+
+        def delete_assets(
+            self, asset_ids: list[str], force_delete: bool = False
+        ) -> dict[str, Any]:
+            """Delete assets. See ImmichClient.delete_assets."""
+
+        def update_assets(
+            self,
+            asset_ids: list[str],
+            *,
+            is_archived: bool = False,
+            is_favorite: bool = False,
+            latitude: float = 0.0,
+            longitude: float = 0.0,
+            remove_parent: bool = False,
+            stack_parent_id: str | None = None,
+            **fields: Any,
+        ) -> dict[str, Any]:
+            """Update multiple assets. See ImmichClient.update_assets."""
+
+        def replace_asset(
+            self,
+            asset_id: str,
+            file_path: str | Path,
+            *,
+            sidecar_path: str | Path | None = None,
+            file: BinaryIO | None = None,
+        ) -> dict[str, Any]:
+            """Replace an asset. See ImmichClient.replace_asset."""
 
-    def download_asset(self, asset_id: str) -> bytes:
+    def get_asset_info(self, asset_id: str) -> Asset:
         """
-        Download an asset.
+        Get information about an asset.
 
         Args:
             asset_id: The ID of the asset.
 
         Returns
         -------
-            The asset data.
+            Information about the asset.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
-        return self.client.download_asset(asset_id)
+        data = self.client.get_asset_info(asset_id)
+        return Asset.from_dict(data)
 
     def update_asset(
         self,
@@ -105,67 +223,36 @@ class AssetAPI:
         ------
             ImmichClientError: If the request fails.
         """
-        fields = {}
-        if is_archived is not None:
-            fields["isArchived"] = is_archived
-        if is_favorite is not None:
-            fields["isFavorite"] = is_favorite
-        if latitude is not None:
-            fields["latitude"] = latitude
-        if longitude is not None:
-            fields["longitude"] = longitude
-        if description is not None:
-            fields["description"] = description
-        if rating is not None:
-            fields["rating"] = rating
-        if date_time_original is not None:
-            fields["dateTimeOriginal"] = date_time_original.isoformat()
+        values = (
+            is_archived,
+            is_favorite,
+            latitude,
+            longitude,
+            description,
+            rating,
+            date_time_original.isoformat() if date_time_original else None,
+        )
+        fields = {
+            name: value
+            for name, value in zip(_UPDATE_FIELDS, values, strict=True)
+            if value is not None
+        }
 
         data = self.client.update_asset(asset_id, **fields)
         return Asset.from_dict(data)
 
-    def delete_assets(
-        self, asset_ids: list[str], force_delete: bool = False
+    def update_assets_with_datetime(
+        self, asset_ids: list[str], date_time_original: datetime
     ) -> dict[str, Any]:
         """
-        Delete assets.
+        Set the original date and time of multiple assets.
 
-        Args:
-            asset_ids: The IDs of the assets to delete.
-            force_delete: If True, permanently delete the assets.
-
-        Returns
-        -------
-            The response from the server.
-
-        Raises
-        ------
-            ImmichClientError: If the request fails.
-        """
-        return self.client.delete_assets(asset_ids, force_delete)
-
-    def update_assets(
-        self,
-        asset_ids: list[str],
-        *,
-        is_archived: bool = False,
-        is_favorite: bool = False,
-        latitude: float = 0.0,
-        longitude: float = 0.0,
-        remove_parent: bool = False,
-        stack_parent_id: str | None = None,
-    ) -> dict[str, Any]:
-        """
-        Update multiple assets.
+        The timestamp is formatted once and sent with the bulk update
+        endpoint, and no other field of the assets is changed.
 
         Args:
             asset_ids: The IDs of the assets to update.
-            is_archived: Whether the assets are archived.
-            is_favorite: Whether the assets are favorites.
-            latitude: The latitude of the assets.
-            longitude: The longitude of the assets.
-            remove_parent: Whether to remove the parent stack.
-            stack_parent_id: The ID of the parent stack.
+            date_time_original: The original date and time to set.
 
         Returns
         -------
@@ -175,14 +262,8 @@ class AssetAPI:
         ------
             ImmichClientError: If the request fails.
         """
-        return self.client.update_assets(
-            asset_ids,
-            is_archived=is_archived,
-            is_favorite=is_favorite,
-            latitude=latitude,
-            longitude=longitude,
-            remove_parent=remove_parent,
-            stack_parent_id=stack_parent_id,
+        return self.client.update_assets_fields(
+            asset_ids, dateTimeOriginal=date_time_original.isoformat()
         )
 
     def upload_asset(
@@ -200,6 +281,9 @@ class AssetAPI:
         sidecar_path: str | Path | None = None,
         ignore_db: bool = False,
         show_progress: bool = True,
+        file_hash: str | None = None,
+        file_stat: os.stat_result | None = None,
+        file: BinaryIO | None = None,
     ) -> dict[str, Any]:
         """
         Upload an asset.
@@ -217,6 +301,11 @@ class AssetAPI:
             sidecar_path: The path to a sidecar file to upload.
             ignore_db: Whether to ignore the hash database check.
             show_progress: Whether to show a progress bar.
+            file_hash: The precomputed hash of the file, if already known.
+            file_stat: The result of stat() for the file, if already known, e.g.
+                from an os.DirEntry while walking a directory.
+            file: An open binary handle for the file to send instead of opening
+                file_path. It is read from the start and left open.
 
         Returns
         -------
@@ -228,25 +317,30 @@ class AssetAPI:
         """
         file_path = Path(file_path)
 
-        # Calculate the hash of the file
-        file_hash = hash_file(file_path)
+        # Stat the file once for both progress reporting and the upload form
+        if file_stat is None:
+            file_stat = file_path.stat()
+
+        # When the database check is skipped, the hash is only needed after
+        # the upload, so compute it from the data as it is sent rather than
+        # reading the file twice
+        streaming_hash = None
+        if file_hash is None:
+            if ignore_db:
+                streaming_hash = _StreamingHash(file_path, file_stat.st_size)
+            else:
+                file_hash = hash_file(file_path)
 
         # Check if the hash is already in the database
         if not ignore_db and self._hash_db.contains_hash(file_hash):
-            return {
-                "id": "skipped",
-                "status": "skipped",
-                "filename": file_path.name,
-                "message": f"Asset {file_path.name} already uploaded (hash: {file_hash})",
-            }
-
-        # Get file size for progress reporting
-        file_size = Path(file_path).stat().st_size
+            return self._skipped_result(file_path, file_hash)
 
         # Create progress callback
         progress_callback = None
         if show_progress:
-            progress_handle = get_progress_callback(True, file_size, file_path.name)
+            progress_handle = get_progress_callback(
+                True, file_stat.st_size, file_path.name
+            )
             progress_callback = progress_handle.update
 
         # Upload the asset
@@ -263,7 +357,12 @@ class AssetAPI:
                 is_read_only=is_read_only,
                 sidecar_path=sidecar_path,
                 progress_callback=progress_callback,
+                data_callback=streaming_hash.update if streaming_hash else None,
+                file_stat=file_stat,
+                file=file,
             )
+            if streaming_hash is not None:
+                file_hash = streaming_hash.hexdigest()
 
             # If upload was successful, add the hash to the database
             if result.get("status") in ["created", "replaced", "duplicate"]:
@@ -283,6 +382,294 @@ class AssetAPI:
         else:
             return result
 
+    async def upload_asset_async(
+        self,
+        http_client: httpx.AsyncClient,
+        file_path: str | Path,
+        *,
+        ignore_db: bool = False,
+        show_progress: bool = True,
+        file_hash: str | None = None,
+        file_stat: os.stat_result | None = None,
+        seen_hashes: set[str] | None = None,
+        **upload_kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Upload an asset using an async HTTP client.
+
+        The file is hashed, and if needed stat()ed, in a worker thread so the
+        disk work overlaps with the uploads that are already in flight.
+
+        Args:
+            http_client: The async client obtained from the client's async_client().
+            file_path: The path to the file to upload.
+            ignore_db: Whether to ignore the hash database check.
+            show_progress: Whether to show a progress bar.
+            file_hash: The precomputed hash of the file, if already known.
+            file_stat: The result of stat() for the file, if already known.
+            seen_hashes: The hashes of the files already taken by the same run.
+                A file whose hash is in it is skipped without contacting the
+                server, and otherwise its hash is added. When given, the file
+                is hashed before it is sent even with ignore_db.
+            **upload_kwargs: Additional arguments passed to the client's upload_asset_async.
+
+        Returns
+        -------
+            The response from the server.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        file_path = Path(file_path)
+        if file_stat is None:
+            file_stat = await asyncio.to_thread(file_path.stat)
+
+        # The hash is needed up front to check the database or the copies
+        # already seen in this run; otherwise it is computed while sending
+        streaming_hash = None
+        if file_hash is None:
+            if ignore_db and seen_hashes is None:
+                streaming_hash = _StreamingHash(file_path, file_stat.st_size)
+            else:
+                file_hash = await asyncio.to_thread(hash_file, file_path)
+
+        if not ignore_db and self._hash_db.contains_hash(file_hash):
+            return self._skipped_result(file_path, file_hash)
+
+        # Copies of a file in the same run are only sent once. The check and
+        # the add run on the event loop with no await between them, so two
+        # copies cannot both pass
+        if seen_hashes is not None and file_hash is not None:
+            if file_hash in seen_hashes:
+                return self._skipped_result(file_path, file_hash)
+            seen_hashes.add(file_hash)
+
+        progress_callback = None
+        if show_progress:
+            progress_handle = get_progress_callback(
+                True, file_stat.st_size, file_path.name
+            )
+            progress_callback = progress_handle.update
+
+        try:
+            result = await self.client.upload_asset_async(
+                http_client,
+                file_path,
+                progress_callback=progress_callback,
+                data_callback=streaming_hash.update if streaming_hash else None,
+                file_stat=file_stat,
+                **upload_kwargs,
+            )
+            if streaming_hash is not None:
+                file_hash = await asyncio.to_thread(streaming_hash.hexdigest)
+            if result.get("status") in ["created", "replaced", "duplicate"]:
+                self._hash_db.add_hash(file_hash)
+            result["filename"] = file_path.name
+            if show_progress and progress_callback:
+                progress_handle.done(True, file_hash)
+        except Exception:
+            if show_progress and progress_callback:
+                progress_handle.done(False)
+            # Let a later copy of the file try again
+            if seen_hashes is not None:
+                seen_hashes.discard(file_hash)
+            raise
+        else:
+            return result
+
+    async def upload_files_async(
+        self,
+        file_paths: Iterable[str | Path],
+        *,
+        ignore_db: bool = False,
+        show_progress: bool = True,
+        max_concurrency: int = 16,
+        check_server: bool = False,
+        **upload_kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Upload several files concurrently.
+
+        At most max_concurrency uploads are in flight at a time, all sharing
+        one async connection pool. Files are hashed in worker threads outside
+        that limit, so the next files are already hashed while earlier ones
+        upload. With ignore_db, files are instead hashed from the data sent.
+        Files that fail to upload are logged and left out of the results, as
+        with directory uploads.
+
+        Copies of the same file are uploaded once, and the others are
+        skipped without contacting the server.
+
+        With check_server, the server checksums of all files are computed
+        first and checked in bulk, and files the server already has are
+        skipped without being sent.
+
+        Args:
+            file_paths: The paths of the files to upload.
+            ignore_db: Whether to ignore the hash database check.
+            show_progress: Whether to show a progress bar.
+            max_concurrency: Maximum number of concurrent uploads.
+            check_server: Whether to skip files that already exist on the
+                server.
+            **upload_kwargs: Additional arguments passed to upload_asset_async.
+
+        Returns
+        -------
+            A list of responses from the server.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        file_paths = [Path(p) for p in file_paths]
+        seen_hashes: set[str] = set()
+        on_server = {}
+        if check_server:
+            on_server = await self._find_on_server(file_paths)
+        # Fetch the supported media types once up front, rather than have
+        # each upload find the cache cold and request them again
+        await asyncio.to_thread(self.client.get_supported_media_types)
+
+        async with self.client.async_client(
+            max_connections=max_concurrency
+        ) as http_client:
+
+            async def upload_one(path: Path) -> dict[str, Any] | None:
+                if path in on_server:
+                    return self._skipped_result(path, on_server[path])
+                try:
+                    file_hash = None
+                    if not ignore_db:
+                        file_hash = await asyncio.to_thread(hash_file, path)
+                    async with semaphore:
+                        return await self.upload_asset_async(
+                            http_client,
+                            path,
+                            ignore_db=ignore_db,
+                            show_progress=show_progress,
+                            file_hash=file_hash,
+                            seen_hashes=seen_hashes,
+                            **upload_kwargs,
+                        )
+                except Exception:
+                    logger.exception("Error uploading %s", path)
+                    return None
+
+            results = await asyncio.gather(*(upload_one(p) for p in file_paths))
+
+        return [result for result in results if result is not None]
+
+    async def _find_on_server(self, file_paths: list[Path]) -> dict[Path, str]:
+        """
+        Find the files whose contents already exist on the server.
+
+        A path listed more than once is hashed only once.
+
+        Args:
+            file_paths: The paths of the files to check.
+
+        Returns
+        -------
+            A dictionary mapping each file found on the server to its checksum.
+        """
+        unique_paths = list(dict.fromkeys(file_paths))
+        checksums = await asyncio.gather(
+            *(asyncio.to_thread(server_checksum, path) for path in unique_paths)
+        )
+        existing = await asyncio.to_thread(
+            self.client.check_existing_checksums, checksums
+        )
+        return {
+            path: checksum
+            for path, checksum in zip(unique_paths, checksums, strict=True)
+            if checksum in existing
+        }
+
+    def upload_files(
+        self,
+        file_paths: Iterable[str | Path],
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Upload several files concurrently from synchronous code.
+
+        Args:
+            file_paths: The paths of the files to upload.
+            **kwargs: Arguments passed to upload_files_async.
+
+        Returns
+        -------
+            A list of responses from the server.
+        """
+        try:
+            return asyncio.run(self.upload_files_async(file_paths, **kwargs))
+        finally:
+            if kwargs.get("show_progress", True):
+                clear_progress()
+
+    async def download_assets_async(
+        self,
+        downloads: Mapping[str, str | Path],
+        *,
+        max_concurrency: int = 16,
+    ) -> dict[str, int]:
+        """
+        Download several assets concurrently.
+
+        At most max_concurrency downloads are in flight at a time, all sharing
+        one async connection pool. Assets that fail to download are logged and
+        left out of the results.
+
+        Args:
+            downloads: A mapping of asset IDs to the file paths to write them to.
+            max_concurrency: Maximum number of concurrent downloads.
+
+        Returns
+        -------
+            A dictionary mapping each downloaded asset ID to its size in bytes.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async with self.client.async_client(
+            max_connections=max_concurrency
+        ) as http_client:
+
+            async def download_one(asset_id: str, destination: str | Path) -> int:
+                try:
+                    async with semaphore:
+                        return await self.client.download_asset_to_async(
+                            http_client, asset_id, destination
+                        )
+                except Exception:
+                    logger.exception("Error downloading asset %s", asset_id)
+                    return -1
+
+            sizes = await asyncio.gather(
+                *(download_one(a, d) for a, d in downloads.items())
+            )
+
+        return {
+            asset_id: size
+            for asset_id, size in zip(downloads, sizes, strict=True)
+            if size >= 0
+        }
+
+    def download_assets(
+        self,
+        downloads: Mapping[str, str | Path],
+        **kwargs: Any,
+    ) -> dict[str, int]:
+        """
+        Download several assets concurrently from synchronous code.
+
+        Args:
+            downloads: A mapping of asset IDs to the file paths to write them to.
+            **kwargs: Arguments passed to download_assets_async.
+
+        Returns
+        -------
+            A dictionary mapping each downloaded asset ID to its size in bytes.
+        """
+        return asyncio.run(self.download_assets_async(downloads, **kwargs))
+
     def upload_assets(
         self,
         file_path: str | Path,
@@ -299,6 +686,7 @@ class AssetAPI:
         ignore_db: bool = False,
         show_progress: bool = True,
         max_workers: int = 5,
+        media_only: bool = False,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """
         Upload assets from a file, directory, or archive.
@@ -321,6 +709,9 @@ class AssetAPI:
             ignore_db: Whether to ignore the hash database check.
             show_progress: Whether to show a progress bar.
             max_workers: Maximum number of concurrent uploads.
+            media_only: Whether to upload only the files of a directory or
+                archive whose extension the server supports as an image or
+                video, without hashing the rest.
 
         Returns
         -------
@@ -337,17 +728,17 @@ class AssetAPI:
         if show_progress:
             set_max_workers(max_workers)
 
-        # Create a wrapper function that matches the expected signature for process_upload_path
-        def upload_wrapper(path: str | Path, **upload_kwargs: Any) -> dict[str, Any]:
-            # Extract sidecar_path from kwargs if it exists
-            sidecar = upload_kwargs.pop("sidecar_path", None)
-            # Use the upload_asset method with hash checking
-            return self.upload_asset(
-                path,
-                sidecar_path=sidecar,
-                ignore_db=ignore_db,
-                show_progress=show_progress,
-                **upload_kwargs,
+        # Bind the options shared by every file; process_upload_path supplies
+        # the path and the per-upload keyword arguments
+        upload_wrapper = functools.partial(
+            self.upload_asset, ignore_db=ignore_db, show_progress=show_progress
+        )
+        options: dict[str, Any] = {"max_workers": max_workers}
+        if media_only:
+            options["allowed_suffixes"] = frozenset(
+                extension
+                for extension, media_type in self.client.get_supported_media_types().items()
+                if media_type in {"image", "video"}
             )
 
         # Prepare kwargs for the upload function
@@ -364,20 +755,42 @@ class AssetAPI:
 
         # Only include sidecar_path if it's not None and the file_path is not a directory or archive
         file_path_obj = Path(file_path)
-        if (
-            sidecar_path is not None
-            and file_path_obj.is_file()
-            and not file_path_obj.is_dir()
-        ):
+        is_dir = file_path_obj.is_dir()
+        if sidecar_path is not None and not is_dir and file_path_obj.is_file():
             kwargs["sidecar_path"] = sidecar_path
 
+        # Directories and archives are uploaded as tasks on one event loop,
+        # all sharing a single async connection pool, rather than in threads
+        if is_dir or immich_py.api.upload_utils.is_supported_archive(file_path_obj):
+            # Copies of a file within the directory or archive are sent once
+            seen_hashes: set[str] = set()
+            # Fetch the supported media types before the uploads start, so
+            # they are not each requested again by concurrent uploads
+            self.client.get_supported_media_types()
+
+            async def upload_wrapper(
+                path: Path, *, http_client: httpx.AsyncClient, **upload_kwargs: Any
+            ) -> dict[str, Any]:
+                return await self.upload_asset_async(
+                    http_client,
+                    path,
+                    ignore_db=ignore_db,
+                    show_progress=show_progress,
+                    seen_hashes=seen_hashes,
+                    **upload_kwargs,
+                )
+
+            options["session"] = functools.partial(
+                self.client.async_client, max_connections=max_workers
+            )
+
         # If it's a directory, add it as an album title for progress display
-        if file_path_obj.is_dir() and show_progress:
+        if is_dir and show_progress:
             album_name = file_path_obj.name
             add_album(album_name)
             try:
                 return immich_py.api.upload_utils.process_upload_path(
-                    file_path, upload_wrapper, **kwargs
+                    file_path, upload_wrapper, **options, **kwargs
                 )
             finally:
                 remove_album(album_name)
@@ -386,56 +799,76 @@ class AssetAPI:
         else:
             try:
                 return immich_py.api.upload_utils.process_upload_path(
-                    file_path, upload_wrapper, **kwargs
+                    file_path, upload_wrapper, **options, **kwargs
                 )
             finally:
                 if show_progress:
                     # Clean up progress display when done
                     clear_progress()
 
-    def replace_asset(
-        self,
-        asset_id: str,
-        file_path: str | Path,
-        *,
-        sidecar_path: str | Path | None = None,
-    ) -> dict[str, Any]:
+    @staticmethod
+    def _skipped_result(file_path: Path, file_hash: str) -> dict[str, Any]:
         """
-        Replace an asset.
+        Build the result returned for an asset that is already uploaded.
 
         Args:
-            asset_id: The ID of the asset to replace.
-            file_path: The path to the file to upload.
-            sidecar_path: The path to a sidecar file to upload.
+            file_path: The path to the file.
+            file_hash: The hash of the file.
 
         Returns
         -------
-            The response from the server.
+            The skipped upload result.
+        """
+        return {
+            "id": "skipped",
+            "status": "skipped",
+            "filename": file_path.name,
+            "message": f"Asset {file_path.name} already uploaded (hash: {file_hash})",
+        }
+
+    def get_all_assets(self) -> list[Asset]:
+        """
+        Get all assets.
+
+        Returns
+        -------
+            A list of assets.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
-        return self.client.replace_asset(
-            asset_id,
-            file_path,
-            sidecar_path=sidecar_path,
-        )
+        return list(self.iter_all_assets())
 
-    def get_all_assets(self) -> list[Asset]:
+    def iter_all_assets(
+        self, *, page_size: int = 1000, prefetch: int = 4
+    ) -> Iterator[Asset]:
         """
-        Get all assets.
+        Get all assets, yielding them as each page is received.
+
+        The next pages are requested concurrently while the current one is
+        consumed, and only the pages in flight are held in memory.
+
+        Args:
+            page_size: The number of assets per page.
+            prefetch: The number of pages to keep in flight at a time.
 
         Returns
         -------
-            A list of assets.
+            An iterator over all assets.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
-        data = self.client.get_all_assets()
-        return [Asset.from_dict(asset) for asset in data]
+        data = self.client.iter_search_assets(
+            page_size=page_size,
+            with_exif=True,
+            is_visible=True,
+            with_deleted=True,
+            prefetch=prefetch,
+        )
+        return map(Asset.from_dict, data)
 
     def search_assets(
         self,
@@ -492,7 +925,67 @@ class AssetAPI:
             checksum=checksum,
             original_file_name=original_file_name,
         )
-        return [Asset.from_dict(asset) for asset in data]
+        return Asset.from_dicts(data)
+
+    def iter_assets(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 1000,
+        with_exif: bool = True,
+        is_visible: bool = True,
+        with_deleted: bool = False,
+        with_archived: bool = False,
+        taken_before: str | None = None,
+        taken_after: str | None = None,
+        model: str | None = None,
+        make: str | None = None,
+        checksum: str | None = None,
+        original_file_name: str | None = None,
+    ) -> Iterator[Asset]:
+        """
+        Search for assets, yielding them as each page is received.
+
+        Unlike search_assets, results are not collected into a list, so
+        memory use stays bounded by the page size.
+
+        Args:
+            page: The page number.
+            page_size: The number of assets per page.
+            with_exif: Whether to include EXIF data.
+            is_visible: Whether to include visible assets.
+            with_deleted: Whether to include deleted assets.
+            with_archived: Whether to include archived assets.
+            taken_before: Only include assets taken before this date.
+            taken_after: Only include assets taken after this date.
+            model: Only include assets with this camera model.
+            make: Only include assets with this camera make.
+            checksum: Only include assets with this checksum.
+            original_file_name: Only include assets with this original file name.
+
+        Returns
+        -------
+            An iterator over the matching assets.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        data = self.client.iter_search_assets(
+            page=page,
+            page_size=page_size,
+            with_exif=with_exif,
+            is_visible=is_visible,
+            with_deleted=with_deleted,
+            with_archived=with_archived,
+            taken_before=taken_before,
+            taken_after=taken_after,
+            model=model,
+            make=make,
+            checksum=checksum,
+            original_file_name=original_file_name,
+        )
+        return map(Asset.from_dict, data)
 
     def get_assets_by_hash(self, checksum: str) -> list[Asset]:
         """
@@ -510,7 +1003,25 @@ class AssetAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.get_assets_by_hash(checksum)
-        return [Asset.from_dict(asset) for asset in data]
+        return Asset.from_dicts(data)
+
+    def get_assets_by_hashes(self, checksums: Iterable[str]) -> dict[str, list[Asset]]:
+        """
+        Get assets for many checksums at once.
+
+        Args:
+            checksums: The checksums to search for.
+
+        Returns
+        -------
+            A dictionary mapping each checksum to the assets with that checksum.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        data = self.client.get_assets_by_hashes(checksums)
+        return {checksum: Asset.from_dicts(assets) for checksum, assets in data.items()}
 
     def get_assets_by_name(self, name: str) -> list[Asset]:
         """
@@ -528,7 +1039,7 @@ class AssetAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.get_assets_by_name(name)
-        return [Asset.from_dict(asset) for asset in data]
+        return Asset.from_dicts(data)
 
     def search_assets_by_filename_pattern(self, pattern: str) -> list[dict[str, Any]]:
         """
@@ -546,4 +1057,4 @@ class AssetAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.search_assets_by_filename_pattern(pattern)
-        return [Asset.from_dict(asset) for asset in data]
+        return Asset.from_dicts(data)
@@ -6,21 +6,52 @@ Asset hashing utilities for the Immich API.
 This module contains utilities for hashing assets and tracking them in a database.
 """
 
+import atexit
+import base64
+import contextlib
+import functools
 import hashlib
+import math
+import mmap
+import os
+import sqlite3
 import threading
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
-# Default chunk size for file reading
-CHUNK_SIZE = 4096
+# Files larger than this are memory-mapped for hashing instead of read
+MMAP_THRESHOLD = 16 << 20
 
+# The first bytes of every SQLite database file, used to tell the database
+# apart from the older text format
+SQLITE_HEADER = b"SQLite format 3\x00"
 
-def _create_hash_function(hash_obj) -> Callable[[Path], str]:
+# Number of hashes checked per query, kept below SQLite's parameter limit
+QUERY_BATCH_SIZE = 500
+
+# Added hashes are committed in groups: once this many are pending, or
+# FLUSH_INTERVAL seconds after the first pending hash was added
+FLUSH_THRESHOLD = 256
+FLUSH_INTERVAL = 1.0
+
+# Minimum capacity and false positive rate of the Bloom filter that answers
+# lookups for hashes that are not in the database
+BLOOM_MIN_CAPACITY = 1 << 16
+BLOOM_ERROR_RATE = 0.01
+
+
+def _create_hash_function(
+    hash_factory: Callable[[], Any],
+) -> Callable[[Path], str]:
     """
-    Create a file hashing function using the provided hash object.
+    Create a file hashing function using the provided hash object factory.
 
     Args:
-        hash_obj: A hash object with update() and hexdigest() methods
+        hash_factory: A callable returning a new hash object with update() and
+            hexdigest() methods. It is called once per file, so the returned
+            function can be reused and shared between threads.
 
     Returns
     -------
@@ -28,16 +59,22 @@ def _create_hash_function(hash_obj) -> Callable[[Path], str]:
     """
 
     def hasher(file_path: Path) -> str:
-        if not file_path.exists():
-            msg = f"File not found: {file_path}"
-            raise FileNotFoundError(msg)
-
+        # Opening the file raises FileNotFoundError itself, so no separate
+        # exists() check is needed
         with file_path.open("rb") as f:
-            # Read and update hash in chunks to avoid loading large files into memory
-            for byte_block in iter(lambda: f.read(CHUNK_SIZE), b""):
-                hash_obj.update(byte_block)
-
-        return hash_obj.hexdigest()
+            fd = f.fileno()
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            if os.fstat(fd).st_size > MMAP_THRESHOLD:
+                # Hash large files straight from the page cache in one call,
+                # which releases the GIL for the whole file
+                hash_obj = hash_factory()
+                with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                    hash_obj.update(mm)
+                return hash_obj.hexdigest()
+            # file_digest reads into a reusable buffer in large blocks without
+            # loading the whole file into memory
+            return hashlib.file_digest(f, hash_factory).hexdigest()
 
     return hasher
 
@@ -46,6 +83,16 @@ def _create_hash_function(hash_obj) -> Callable[[Path], str]:
 try:
     import xxhash
 
+    def new_hash() -> "xxhash.xxh3_64":
+        """
+        Create an empty hash object of the kind used by hash_file.
+
+        Returns
+        -------
+            A new xxHash3_64 hash object.
+        """
+        return xxhash.xxh3_64()
+
     def hash_file(file_path: str | Path) -> str:
         """
         Calculate the xxHash3_64 hash of a file.
@@ -65,10 +112,20 @@ try:
         ------
             FileNotFoundError: If the file does not exist.
         """
-        return _create_hash_function(xxhash.xxh3_64())(Path(file_path))
+        return _hash_path(Path(file_path))
 
 except ImportError:
 
+    def new_hash() -> "hashlib._Hash":
+        """
+        Create an empty hash object of the kind used by hash_file.
+
+        Returns
+        -------
+            A new SHA256 hash object.
+        """
+        return hashlib.sha256()
+
     def hash_file(file_path: str | Path) -> str:
         """
         Calculate the SHA256 hash of a file.
@@ -86,11 +143,154 @@ except ImportError:
         ------
             FileNotFoundError: If the file does not exist.
         """
-        return _create_hash_function(hashlib.sha256())(Path(file_path))
+        return _hash_path(Path(file_path))
+
+
+_hash_path = _create_hash_function(new_hash)
+
+
+_sha1_path = _create_hash_function(hashlib.sha1)
+
+
+def server_checksum(file_path: str | Path) -> str:
+    """
+    Calculate the checksum the Immich server stores for a file.
+
+    Immich identifies assets by the base64 encoded SHA-1 of their contents,
+    so this checksum can be looked up on the server before uploading. It is
+    slower than hash_file, which remains the key of the local database.
+
+    Args:
+        file_path: The path to the file.
+
+    Returns
+    -------
+        The base64 encoded SHA-1 of the file.
+
+    Raises
+    ------
+        FileNotFoundError: If the file does not exist.
+    """
+    digest = bytes.fromhex(_sha1_path(Path(file_path)))
+    return base64.b64encode(digest).decode("ascii")
+
+
+def hash_files(
+    file_paths: Iterable[str | Path], max_workers: int | None = None
+) -> dict[Path, str]:
+    """
+    Calculate the hashes of several files in parallel.
+
+    The hash functions release the GIL while hashing, so the files are
+    hashed concurrently in a thread pool.
+
+    Args:
+        file_paths: The paths of the files to hash.
+        max_workers: Maximum number of worker threads, or None to use one per
+            CPU.
+
+    Returns
+    -------
+        A dictionary mapping each file path to its hash.
+
+    Raises
+    ------
+        FileNotFoundError: If one of the files does not exist.
+    """
+    paths = list(dict.fromkeys(map(Path, file_paths)))
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(paths, executor.map(hash_file, paths), strict=True))
+
+
+@functools.cache
+def _default_db_path() -> Path:
+    """
+    Get the default database path, creating its directory once per process.
+
+    Returns
+    -------
+        The path ~/.immich-py/uploaded_assets.db.
+    """
+    db_dir = Path.home() / ".immich-py"
+    db_dir.mkdir(exist_ok=True)
+    return db_dir / "uploaded_assets.db"
+
+
+class _BloomFilter:
+    """
+    Bloom filter over strings, used as a fast negative cache.
+
+    Membership tests have no false negatives, and false positives occur at
+    about the configured rate while no more than capacity items are added.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE):
+        """
+        Initialize an empty Bloom filter.
+
+        Args:
+            capacity: The number of items the filter is sized for.
+            error_rate: The false positive rate at capacity.
+        """
+        self.capacity = capacity
+        self.count = 0
+        self._num_bits = max(
+            8, int(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._num_hashes = max(1, round(self._num_bits / capacity * math.log(2)))
+        self._bits = bytearray((self._num_bits + 7) // 8)
+
+    def _positions(self, item: str) -> range:
+        # Double hashing derives every bit position from the string's own
+        # hash, which Python caches on the string. The filter is never
+        # persisted, so the per-process hash seed does not matter.
+        h = hash(item) & 0xFFFFFFFFFFFFFFFF
+        step = (h >> 32) | 1
+        start = h & 0xFFFFFFFF
+        return range(start, start + step * self._num_hashes, step)
+
+    def add(self, item: str) -> None:
+        """
+        Add an item to the filter.
+
+        Args:
+            item: The item to add.
+        """
+        bits, num_bits = self._bits, self._num_bits
+        for value in self._positions(item):
+            position = value % num_bits
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added to the filter."""
+        bits, num_bits = self._bits, self._num_bits
+        for value in self._positions(item):
+            position = value % num_bits
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
 
 
 class AssetHashDatabase:
-    """Thread-safe database for tracking uploaded asset hashes."""
+    """
+    Thread-safe database for tracking uploaded asset hashes.
+
+    Hashes are stored in an SQLite table keyed by hash, so lookups use the
+    primary key index instead of holding every hash in memory. Databases in
+    the older one-hash-per-line text format are migrated on first open.
+
+    Hashes added one at a time are buffered and committed together, which
+    turns thousands of small transactions into a few large ones. Pending
+    hashes are visible to lookups right away, and they are flushed on close()
+    and at interpreter exit.
+
+    A Bloom filter of the stored hashes answers most lookups for new files
+    without querying SQLite. It is rebuilt with twice the capacity when it
+    fills up.
+    """
 
     def __init__(self, db_path: str | Path | None = None):
         """
@@ -100,43 +300,131 @@ class AssetHashDatabase:
             db_path: The path to the database file. If None, defaults to ~/.immich-py/uploaded_assets.db
         """
         if db_path is None:
-            # Use the default path
-            home_dir = Path.home()
-            db_dir = home_dir / ".immich-py"
-            db_dir.mkdir(exist_ok=True)
-            self.db_path = db_dir / "uploaded_assets.db"
+            self.db_path = _default_db_path()
         else:
             self.db_path = Path(db_path)
             # Ensure the directory exists
             self.db_path.parent.mkdir(exist_ok=True)
 
-        # Create the file if it doesn't exist
-        if not self.db_path.exists():
-            self.db_path.touch()
+        # Initialize lock for thread-safety. The connection is shared by the
+        # upload worker threads, and the lock serializes its use.
+        self._lock = threading.Lock()
+        self._pending: set[str] = set()
+        self._flush_timer: threading.Timer | None = None
+        self._closed = False
+
+        legacy_path = self._move_legacy_file()
+        self._conn = sqlite3.connect(
+            self.db_path, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS hashes (h TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._bloom = self._build_bloom()
+        with contextlib.suppress(FileNotFoundError):
+            self._import_legacy_file(legacy_path)
+        atexit.register(self.close)
+
+    def _move_legacy_file(self) -> Path:
+        """
+        Move a text format database out of the way of the SQLite database.
 
-        # Initialize in-memory cache
-        self._hash_cache = set()
+        Returns
+        -------
+            The path the text database is moved to, whether or not one exists.
+        """
+        legacy_path = self.db_path.with_name(self.db_path.name + ".migrating")
+        try:
+            with self.db_path.open("rb") as f:
+                header = f.read(len(SQLITE_HEADER))
+        except FileNotFoundError:
+            return legacy_path
+        if header != SQLITE_HEADER:
+            self.db_path.replace(legacy_path)
+        return legacy_path
+
+    def _build_bloom(self, min_capacity: int = BLOOM_MIN_CAPACITY) -> _BloomFilter:
+        """
+        Build a Bloom filter of the stored hashes.
 
-        # Initialize lock for thread-safety
-        self._lock = threading.Lock()
+        Args:
+            min_capacity: The minimum capacity of the filter.
 
-        self._load_cache()
+        Returns
+        -------
+            A Bloom filter with room for at least twice the stored hashes.
+        """
+        (count,) = self._conn.execute("SELECT COUNT(*) FROM hashes").fetchone()
+        bloom = _BloomFilter(max(min_capacity, 2 * count))
+        for (file_hash,) in self._conn.execute("SELECT h FROM hashes"):
+            bloom.add(file_hash)
+        return bloom
 
-    def _load_cache(self) -> None:
-        """Load all hashes from the database file into memory."""
-        with self._lock:
-            if not self.db_path.exists():
-                self._hash_cache.clear()
-                return
+    def _bloom_add_locked(self, file_hashes: Iterable[str]) -> None:
+        """
+        Add hashes to the Bloom filter. The caller must hold the lock.
+
+        Args:
+            file_hashes: The hashes to add.
+        """
+        for file_hash in file_hashes:
+            self._bloom.add(file_hash)
+        if self._bloom.count > self._bloom.capacity:
+            self._flush_locked()
+            self._bloom = self._build_bloom(2 * self._bloom.capacity)
+
+    def _import_legacy_file(self, legacy_path: Path) -> None:
+        """
+        Import the hashes of a text format database and remove it.
+
+        Args:
+            legacy_path: The path of the text database.
 
-            # Clear the cache before reloading
-            self._hash_cache.clear()
+        Raises
+        ------
+            FileNotFoundError: If there is no text database to import.
+        """
+        with legacy_path.open("r") as f:
+            self.add_hashes(line.strip() for line in f if line.strip())
+        legacy_path.unlink()
+
+    def _flush_locked(self) -> None:
+        """Commit the pending hashes. The caller must hold the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO hashes (h) VALUES (?)",
+                ((file_hash,) for file_hash in self._pending),
+            )
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        self._pending.clear()
+
+    def flush(self) -> None:
+        """Commit the hashes that were added but not yet written."""
+        with self._lock:
+            if not self._closed:
+                self._flush_locked()
 
-            with self.db_path.open("r") as f:
-                for line in f:
-                    hash_value = line.strip()
-                    if hash_value:
-                        self._hash_cache.add(hash_value)
+    def close(self) -> None:
+        """Commit the pending hashes and close the database connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._conn.close()
+            self._closed = True
+        atexit.unregister(self.close)
 
     def contains_hash(self, file_hash: str) -> bool:
         """
@@ -150,24 +438,71 @@ class AssetHashDatabase:
             True if the hash is in the database, False otherwise.
         """
         with self._lock:
-            if not self.db_path.exists():
+            if file_hash not in self._bloom:
                 return False
-            return file_hash in self._hash_cache
+            if file_hash in self._pending:
+                return True
+            row = self._conn.execute(
+                "SELECT 1 FROM hashes WHERE h = ? LIMIT 1", (file_hash,)
+            ).fetchone()
+        return row is not None
+
+    def contains_hashes(self, file_hashes: Iterable[str]) -> set[str]:
+        """
+        Check which of several hashes are in the database.
+
+        Args:
+            file_hashes: The hashes to check.
+
+        Returns
+        -------
+            The subset of the given hashes that are in the database.
+        """
+        with self._lock:
+            unique = [h for h in dict.fromkeys(file_hashes) if h in self._bloom]
+            found = self._pending.intersection(unique)
+            for start in range(0, len(unique), QUERY_BATCH_SIZE):
+                batch = unique[start : start + QUERY_BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT h FROM hashes WHERE h IN ({placeholders})",  # noqa: S608
+                    batch,
+                )
+                found.update(row[0] for row in rows)
+        return found
 
     def add_hash(self, file_hash: str) -> None:
         """
         Add a hash to the database.
 
+        The hash is committed with the next group of pending hashes.
+
         Args:
             file_hash: The hash to add.
         """
         with self._lock:
-            if file_hash in self._hash_cache:
+            if file_hash in self._pending:
                 return
+            self._pending.add(file_hash)
+            self._bloom_add_locked((file_hash,))
+            if len(self._pending) >= FLUSH_THRESHOLD:
+                self._flush_locked()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def add_hashes(self, file_hashes: Iterable[str]) -> None:
+        """
+        Add several hashes to the database in a single transaction.
 
-            # Add to in-memory cache
-            self._hash_cache.add(file_hash)
+        The hashes are committed immediately, together with any pending ones.
 
-            # Write to file
-            with self.db_path.open("a") as f:
-                f.write(f"{file_hash}\n")
+        Args:
+            file_hashes: The hashes to add.
+        """
+        with self._lock:
+            new_hashes = set(file_hashes) - self._pending
+            self._pending.update(new_hashes)
+            self._bloom_add_locked(new_hashes)
+            self._flush_locked()
@@ -0,0 +1,246 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Response caching for the Immich API client.
+
+This module contains a small thread-safe cache used by the client to avoid
+repeating idempotent read requests within a single process, and an ETag
+store used to revalidate rarely changing responses across processes.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Sentinel returned by ResponseCache.get on a miss, so None can be cached
+MISSING = object()
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with a per-entry time to live.
+
+    Keys are tuples whose first element is the API path the value was read
+    from, which lets writes invalidate every entry under a path prefix.
+    """
+
+    def __init__(self, ttl: float = 60.0, maxsize: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            ttl: The number of seconds an entry stays valid.
+            maxsize: The maximum number of entries to keep.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[tuple[Hashable, ...], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Hashable, ...]) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: The cache key.
+
+        Returns
+        -------
+            The cached value, or MISSING if the key is absent or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: tuple[Hashable, ...], value: Any) -> None:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: The cache key.
+            value: The value to store.
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, *prefixes: str) -> None:
+        """
+        Remove all entries whose path starts with one of the given prefixes.
+
+        Args:
+            *prefixes: The API path prefixes to invalidate.
+        """
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if isinstance(key[0], str) and key[0].startswith(prefixes)
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+def default_etag_cache_path() -> Path:
+    """
+    Get the default path of the persistent ETag cache.
+
+    Returns
+    -------
+        The path ~/.immich-py/etags.json.
+    """
+    return Path.home() / ".immich-py" / "etags.json"
+
+
+def api_key_scope(api_key: str) -> str:
+    """
+    Get the ETag cache scope of an API key.
+
+    Args:
+        api_key: The API key.
+
+    Returns
+    -------
+        A short hash of the API key, so the key itself is never stored.
+    """
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+class ETagCache:
+    """
+    Thread-safe store of response bodies and their ETags, keyed by URL.
+
+    A stored ETag is sent back as If-None-Match, and the stored body is reused
+    when the server answers 304 Not Modified. With a path, entries are loaded
+    from and saved to a JSON file, readable only by its owner, so they survive
+    between CLI runs. Entries are also keyed by the scope, so responses read
+    with one API key are never returned for another.
+    """
+
+    def __init__(self, path: str | Path | None = None, scope: str = ""):
+        """
+        Initialize the ETag cache.
+
+        Args:
+            path: The JSON file to persist entries to, or None to keep them
+                in memory only.
+            scope: An identifier of the credentials the responses are read
+                with, such as the result of api_key_scope().
+        """
+        self.path = Path(path) if path is not None else None
+        self.scope = scope
+        self._entries: dict[str, tuple[str, Any]] | None = None
+        self._lock = threading.Lock()
+
+    def _load_locked(self) -> dict[str, tuple[str, Any]]:
+        """
+        Get the entries, reading the file on first use.
+
+        Returns
+        -------
+            The cached entries.
+        """
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    with self.path.open("rb") as f:
+                        stored = json.load(f)
+                    self._entries = {
+                        url: (etag, value) for url, (etag, value) in stored.items()
+                    }
+                except (OSError, ValueError, TypeError, AttributeError):
+                    logger.debug("Ignoring unreadable ETag cache %s", self.path)
+        return self._entries
+
+    def _key(self, url: str) -> str:
+        """
+        Get the key a URL is stored under in the current scope.
+
+        Args:
+            url: The request URL.
+
+        Returns
+        -------
+            The scope and the URL, or the URL alone without a scope.
+        """
+        return f"{self.scope} {url}" if self.scope else url
+
+    def get(self, url: str) -> tuple[str, Any] | None:
+        """
+        Get the cached ETag and body for a URL.
+
+        Args:
+            url: The request URL.
+
+        Returns
+        -------
+            The (etag, body) pair, or None if the URL is not cached.
+        """
+        with self._lock:
+            return self._load_locked().get(self._key(url))
+
+    def set(self, url: str, etag: str, value: Any) -> None:
+        """
+        Store the ETag and body of a response, saving the file if persistent.
+
+        Args:
+            url: The request URL.
+            etag: The ETag header of the response.
+            value: The parsed response body.
+        """
+        key = self._key(url)
+        with self._lock:
+            entries = self._load_locked()
+            if entries.get(key) == (etag, value):
+                return
+            entries[key] = (etag, value)
+            if self.path is not None:
+                _save_entries(self.path, entries)
+
+
+def _save_entries(path: Path, entries: dict[str, tuple[str, Any]]) -> None:
+    """
+    Write ETag cache entries to a file, replacing it atomically.
+
+    Args:
+        path: The cache file.
+        entries: The entries to write.
+    """
+    temp_path = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # The cached bodies include user details, so only the owner may
+        # read the file
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.fchmod(fd, 0o600)
+        with open(fd, "w", encoding="utf-8") as f:  # noqa: PTH123
+            json.dump({url: list(entry) for url, entry in entries.items()}, f)
+        temp_path.replace(path)
+    except OSError:
+        logger.debug("Could not save ETag cache %s", path)
@@ -2,22 +2,294 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Provide a client for interacting with the Immich API."""
 
+import asyncio
+import dataclasses
+import enum
+import functools
+import importlib.util
+import inspect
 import json
 import logging
-import mimetypes
-import platform
+import os
+import time
 import types
 import uuid
-from collections.abc import AsyncIterator, Callable
-from contextlib import asynccontextmanager
-from datetime import datetime
-from pathlib import Path
-from typing import Any, TypeVar
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+)
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack, asynccontextmanager, contextmanager
+from datetime import date, datetime
+from datetime import time as dt_time
+from pathlib import Path, PurePath
+from typing import Any, BinaryIO, TypeVar
 
 import httpx
 
+from immich_py.api.cache import MISSING, ETagCache, ResponseCache, api_key_scope
+
 T = TypeVar("T")
 
+# Connection pool sizing for the shared HTTP client. Concurrent uploads use
+# one connection per worker, so the pool is sized well above the default
+# number of upload workers.
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+
+# Seconds an idle pooled connection is kept open. The httpx default of five
+# seconds drops connections between slow pages or uploads, so each one pays
+# for a new TCP and TLS handshake.
+KEEPALIVE_EXPIRY = 30.0
+
+# Connection limits of an async client opened without an explicit cap, the
+# same as the httpx defaults. Without them the pool would be unbounded and
+# a large fan-out of uploads could exhaust the server's connections.
+ASYNC_MAX_CONNECTIONS = 100
+ASYNC_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# HTTP/2 needs the optional h2 package. When it is installed, concurrent
+# requests share multiplexed connections instead of one connection each.
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# JSON bodies are parsed and serialized with the optional orjson package
+# when it is installed, which works on UTF-8 bytes directly and is several
+# times faster than the json module on large search pages. Its decode error
+# is a subclass of json.JSONDecodeError.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert a value the json module cannot serialize, as orjson does.
+
+    Args:
+        obj: The value to convert.
+
+    Returns
+    -------
+        The JSON-serializable form of the value.
+
+    Raises
+    ------
+        TypeError: If the value has no JSON form.
+    """
+    if isinstance(obj, date | dt_time):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)
+        }
+    msg = f"Type is not JSON serializable: {type(obj).__name__}"
+    raise TypeError(msg)
+
+
+def _stdlib_json_dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 encoded JSON with the json module.
+
+    Dates, times, UUIDs, enums and dataclasses are encoded the way orjson
+    encodes them, so a payload serializes the same with or without orjson.
+
+    Args:
+        obj: The object to serialize.
+
+    Returns
+    -------
+        The JSON document as bytes.
+    """
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_json_default
+    ).encode()
+
+
+if orjson is not None:
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+else:
+    _json_loads = json.loads
+    _json_dumps = _stdlib_json_dumps
+
+
+# Chunk size used when streaming downloads to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Idempotent requests and async uploads are retried on these responses,
+# waiting retry_delay seconds before the first retry and doubling after each
+# one. Async uploads are also retried on timeouts.
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE"})
+
+# Default expected status codes, shared rather than rebuilt per request
+_OK_STATUS = frozenset({200})
+_POST_OK_STATUS = frozenset({200, 201})
+_DELETE_OK_STATUS = frozenset({200, 204})
+
+# Request headers shared by every call that needs no others. They are
+# read-only so a shared instance cannot be changed by one request.
+_BINARY_HEADERS = types.MappingProxyType({"Accept": "application/octet-stream"})
+_JSON_HEADERS = types.MappingProxyType({"Accept": "application/json"})
+_JSON_CONTENT_HEADERS = types.MappingProxyType({"Content-Type": "application/json"})
+_JSON_BODY_HEADERS = types.MappingProxyType({
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+})
+
+# Optional search filters, in the order of the search method arguments
+_SEARCH_FILTERS = (
+    "takenBefore",
+    "takenAfter",
+    "model",
+    "make",
+    "checksum",
+    "originalFileName",
+    "id",
+)
+
+# Longest non-JSON error body kept as an error message
+MAX_ERROR_TEXT_LENGTH = 512
+
+# Number of checksums sent per bulk upload check request
+HASH_BATCH_SIZE = 500
+
+# Number of assets updated per bulk update request
+UPDATE_BATCH_SIZE = 500
+
+# Number of assets added per add-to-album request
+ALBUM_BATCH_SIZE = 500
+
+# Number of assets tagged per bulk tag request
+TAG_BATCH_SIZE = 500
+
+# Number of batched write requests in flight at a time
+BATCH_CONCURRENCY = 4
+
+# Rarely changing GET endpoints that are revalidated with If-None-Match, so
+# an unchanged response costs a 304 instead of a full body
+CONDITIONAL_GET_PATHS = frozenset({
+    "/server/ping",
+    "/server/about",
+    "/server/media-types",
+    "/server/statistics",
+    "/users/me",
+})
+
+# Cached path prefixes affected by a write under each top-level resource.
+# Album responses embed their assets and asset responses embed their tags,
+# so writes to those resources invalidate the embedding resource as well.
+CACHE_INVALIDATION = {
+    "/assets": ("/assets", "/albums"),
+    "/tags": ("/tags", "/assets"),
+    "/stacks": ("/assets",),
+}
+
+
+def _search_query(
+    *,
+    page: int,
+    page_size: int,
+    with_exif: bool,
+    is_visible: bool,
+    with_deleted: bool,
+    with_archived: bool,
+    filters: tuple[Any, ...],
+) -> dict[str, Any]:
+    """
+    Build the request body for a metadata search.
+
+    Args:
+        page: The page number.
+        page_size: The number of assets per page.
+        with_exif: Whether to include EXIF data.
+        is_visible: Whether to include visible assets.
+        with_deleted: Whether to include deleted assets.
+        with_archived: Whether to include archived assets.
+        filters: The optional filter values, in the order of _SEARCH_FILTERS.
+
+    Returns
+    -------
+        The search query.
+    """
+    query = {
+        "page": page,
+        "size": page_size,
+        "withExif": with_exif,
+        "isVisible": is_visible,
+        "withDeleted": with_deleted,
+        "withArchived": with_archived,
+    }
+    query.update(
+        (name, value)
+        for name, value in zip(_SEARCH_FILTERS, filters, strict=True)
+        if value
+    )
+    return query
+
+
+@functools.cache
+def _default_device_id() -> str:
+    """
+    Get the default device ID sent with uploads.
+
+    The host name is looked up once per process rather than each time a
+    client is created, and platform is only imported when it is needed.
+
+    Returns
+    -------
+        The host name of this machine.
+    """
+    import platform
+
+    return platform.node()
+
+
+@functools.lru_cache(maxsize=256)
+def _mime_type_for_extension(extension: str) -> str:
+    """
+    Get the MIME type for a file extension.
+
+    Uploads only ever see a handful of extensions, so the mimetypes lookup
+    is cached per extension rather than repeated for every file.
+
+    Args:
+        extension: The lowercase file extension, including the leading dot.
+
+    Returns
+    -------
+        The MIME type, or application/octet-stream if it is unknown.
+    """
+    import mimetypes
+
+    mime_type, _ = mimetypes.guess_type(f"file{extension}")
+    return mime_type or "application/octet-stream"
+
+
+def _paged_json(query: dict[str, Any]) -> Callable[[int], bytes]:
+    """
+    Serialize a paged query once, for sending with varying page numbers.
+
+    Args:
+        query: The query. Its "page" entry, if any, is left out.
+
+    Returns
+    -------
+        A function that returns the JSON body of the query for a page number.
+    """
+    body = _json_dumps({k: v for k, v in query.items() if k != "page"})
+    prefix = body[:-1] + (b',"page":' if len(body) > 2 else b'"page":')
+    return lambda page: b"%s%d}" % (prefix, page)
+
 
 class ImmichClientError(Exception):
     """Base exception for Immich client errors."""
@@ -49,6 +321,177 @@ class ImmichClientError(Exception):
         return ", ".join(parts)
 
 
+def _copy_response(response: httpx.Response, sink: BinaryIO, chunk_size: int) -> int:
+    """
+    Copy a streaming response body to a binary file object.
+
+    Args:
+        response: The streaming HTTP response.
+        sink: The file object to write to.
+        chunk_size: The number of bytes to read and write at a time.
+
+    Returns
+    -------
+        The number of bytes written.
+    """
+    written = 0
+    for chunk in response.iter_bytes(chunk_size):
+        sink.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def _format_timestamp(value: datetime) -> str:
+    """
+    Format a datetime for the upload form, to whole seconds with a Z suffix.
+
+    This gives the same result as strftime("%Y-%m-%dT%H:%M:%SZ") at about
+    twice the speed. Any timezone is dropped without converting the time.
+
+    Args:
+        value: The datetime to format.
+
+    Returns
+    -------
+        The formatted timestamp.
+    """
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return value.isoformat(timespec="seconds") + "Z"
+
+
+def _open_upload_file(path: Path, description: str = "File") -> BinaryIO:
+    """
+    Open a file to upload, reporting a missing file as a client error.
+
+    Opening directly instead of checking exists() first saves a stat call
+    per file.
+
+    Args:
+        path: The path to the file.
+        description: How the file is described in the error message.
+
+    Returns
+    -------
+        The file, opened for binary reading.
+
+    Raises
+    ------
+        ImmichClientError: If the file does not exist.
+    """
+    try:
+        return path.open("rb")
+    except FileNotFoundError as e:
+        msg = f"{description} not found: {path}"
+        raise ImmichClientError(msg) from e
+
+
+def _partial_path(destination: str | Path) -> Path:
+    """
+    Get the temporary path a download is written to before it completes.
+
+    Args:
+        destination: The final path of the download.
+
+    Returns
+    -------
+        The destination path with a ".part" suffix appended.
+    """
+    destination = Path(destination)
+    return destination.with_name(destination.name + ".part")
+
+
+def _dry_run_returns(
+    stub: Callable[..., Any],
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Make a client method return a stub result instead of running in dry run.
+
+    Args:
+        stub: Called with the method's arguments by name, defaults included,
+            to build the result returned in dry run mode.
+
+    Returns
+    -------
+        A decorator for synchronous and asynchronous client methods.
+    """
+
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        signature = inspect.signature(method)
+
+        def dry_run_result(self: "ImmichClient", *args: Any, **kwargs: Any) -> Any:
+            self.logger.info("DRY RUN: %s", method.__name__)
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            return stub(**bound.arguments)
+
+        if inspect.iscoroutinefunction(method):
+
+            @functools.wraps(method)
+            async def async_wrapper(self: "ImmichClient", *args: Any, **kwargs: Any):
+                if self.dry_run:
+                    return dry_run_result(self, *args, **kwargs)
+                return await method(self, *args, **kwargs)
+
+            return async_wrapper
+
+        @functools.wraps(method)
+        def wrapper(self: "ImmichClient", *args: Any, **kwargs: Any):
+            if self.dry_run:
+                return dry_run_result(self, *args, **kwargs)
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+class _ProgressFileWrapper:
+    """
+    Wrap a file object and report the data read from it.
+
+    The progress callback receives the number of bytes read past the
+    furthest point reached so far, so a retried request that re-sends the
+    file does not count it twice. The data callback receives each block of
+    the file exactly once and in order, even if the HTTP client seeks back
+    and re-reads part of the file.
+    """
+
+    def __init__(
+        self,
+        file: Any,
+        callback: Callable[[int], None] | None = None,
+        data_callback: Callable[[bytes], None] | None = None,
+    ):
+        self.file = file
+        self.callback = callback or (lambda _: None)
+        self.data_callback = data_callback
+        self._data_offset = 0
+        self._progress_offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        offset = self.file.tell()
+        data = self.file.read(size)
+        if data:
+            end = offset + len(data)
+            if end > self._progress_offset:
+                self.callback(end - max(offset, self._progress_offset))
+                self._progress_offset = end
+            if self.data_callback and offset == self._data_offset:
+                self.data_callback(data)
+                self._data_offset += len(data)
+        return data
+
+    def seek(self, *args: Any, **kwargs: Any) -> int:
+        return self.file.seek(*args, **kwargs)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def close(self) -> None:
+        return self.file.close()
+
+
 class ImmichClient:
     """
     Client for interacting with the Immich API.
@@ -65,6 +508,12 @@ class ImmichClient:
         verify_ssl: bool = True,
         timeout: float = 60.0,
         dry_run: bool = False,
+        cache_reads: bool = True,
+        cache_ttl: float = 60.0,
+        http2: bool | None = None,
+        etag_cache_path: str | Path | None = None,
+        retries: int = 1,
+        retry_delay: float = 1.0,
     ):
         """
         Initialize the Immich client.
@@ -75,27 +524,61 @@ class ImmichClient:
             verify_ssl: Whether to verify SSL certificates.
             timeout: The timeout for API requests in seconds.
             dry_run: If True, don't send any data to the server.
+            cache_reads: Whether to cache idempotent reads such as asset and
+                album info. Writes made through this client invalidate the
+                affected entries.
+            cache_ttl: The number of seconds a cached read stays valid.
+            http2: Whether to negotiate HTTP/2 with the server. If None, HTTP/2
+                is used when the optional h2 package is installed.
+            etag_cache_path: A JSON file to keep the ETags of rarely changing
+                responses in between runs. If None, they are kept in memory.
+                Entries are kept apart per API key.
+            retries: How many times failed connection attempts are retried by
+                the transport, and idempotent requests and async uploads are
+                retried on RETRY_STATUS_CODES.
+            retry_delay: The number of seconds to wait before the first status
+                code retry, doubling after each one.
         """
         self.endpoint = endpoint.rstrip("/") + "/api"
         self.api_key = api_key
         self.verify_ssl = verify_ssl
         self.timeout = timeout
         self.dry_run = dry_run
-        self.device_uuid = platform.node()
-        self.retries = 1
-        self.retry_delay = 1.0
+        self.device_uuid = _default_device_id()
+        self.retries = retries
+        self.retry_delay = retry_delay
         self.logger = logging.getLogger("immich_client")
         self._supported_media_types: dict[str, str] = {}
         self._client: httpx.Client | None = None
+        self._cache = ResponseCache(ttl=cache_ttl) if cache_reads else None
+        self._etags = ETagCache(etag_cache_path, scope=api_key_scope(api_key))
+        self.http2 = HTTP2_AVAILABLE if http2 is None else http2
 
     @property
     def client(self) -> httpx.Client:
-        """Get the HTTP client."""
+        """
+        Get the HTTP client.
+
+        The client is created on first use and reused for every request, so
+        consecutive calls share pooled keep-alive connections. Failed
+        connection attempts are retried up to `retries` times, and _request
+        also retries idempotent requests on RETRY_STATUS_CODES.
+        """
         if self._client is None:
             self._client = httpx.Client(
                 timeout=self.timeout,
                 verify=self.verify_ssl,
-                headers={"x-api-key": self.api_key},
+                headers={"x-api-key": self.api_key, "Accept": "application/json"},
+                transport=httpx.HTTPTransport(
+                    verify=self.verify_ssl,
+                    http2=self.http2,
+                    retries=self.retries,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY,
+                    ),
+                ),
             )
         return self._client
 
@@ -119,12 +602,40 @@ class ImmichClient:
         self.close()
 
     @asynccontextmanager
-    async def async_client(self) -> AsyncIterator[httpx.AsyncClient]:
-        """Get an async HTTP client as a context manager."""
+    async def async_client(
+        self, max_connections: int | None = None
+    ) -> AsyncIterator[httpx.AsyncClient]:
+        """
+        Get an async HTTP client as a context manager.
+
+        Args:
+            max_connections: Maximum number of concurrent connections, or None
+                to allow ASYNC_MAX_CONNECTIONS connections, of which
+                ASYNC_MAX_KEEPALIVE_CONNECTIONS are kept alive, as httpx does
+                by default.
+        """
+        limits = (
+            httpx.Limits(
+                max_connections=ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=ASYNC_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            )
+            if max_connections is None
+            else httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            )
+        )
         client = httpx.AsyncClient(
             timeout=self.timeout,
-            verify=self.verify_ssl,
-            headers={"x-api-key": self.api_key},
+            headers={"x-api-key": self.api_key, "Accept": "application/json"},
+            transport=httpx.AsyncHTTPTransport(
+                verify=self.verify_ssl,
+                http2=self.http2,
+                retries=self.retries,
+                limits=limits,
+            ),
         )
         try:
             yield client
@@ -148,7 +659,7 @@ class ImmichClient:
         self,
         response: httpx.Response,
         endpoint: str,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
     ) -> dict[str, Any]:
         """
         Handle an API response.
@@ -156,7 +667,7 @@ class ImmichClient:
         Args:
             response: The HTTP response.
             endpoint: The API endpoint for error reporting.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
 
         Returns
         -------
@@ -167,25 +678,28 @@ class ImmichClient:
             ImmichClientError: If the response status is not in expected_status.
         """
         if expected_status is None:
-            expected_status = [200]
+            expected_status = _OK_STATUS
         if response.status_code in expected_status:
             if response.status_code == 204:  # No content
                 return {}
             try:
-                return response.json()
+                return _json_loads(response.content)
             except json.JSONDecodeError:
                 return {"text": response.text}
         else:
             error_msg = f"HTTP {response.status_code}"
             try:
-                error_data = response.json()
-                if "message" in error_data:
-                    error_msg = error_data["message"]
-                elif "error" in error_data:
-                    error_msg = error_data["error"]
-            except (json.JSONDecodeError, KeyError):
-                if response.text:
-                    error_msg = response.text
+                error_data = _json_loads(response.content)
+            except json.JSONDecodeError:
+                # Not JSON, e.g. an HTML error page from a reverse proxy
+                if response.content:
+                    error_msg = response.text[:MAX_ERROR_TEXT_LENGTH]
+            else:
+                if isinstance(error_data, dict):
+                    if "message" in error_data:
+                        error_msg = error_data["message"]
+                    elif "error" in error_data:
+                        error_msg = error_data["error"]
 
             raise ImmichClientError(
                 message=error_msg,
@@ -202,10 +716,11 @@ class ImmichClient:
         *,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        json_content: bytes | None = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
         endpoint_name: str | None = None,
     ) -> dict[str, Any]:
         """
@@ -216,10 +731,12 @@ class ImmichClient:
             path: The API path.
             params: Query parameters.
             json_data: JSON data for the request body.
+            json_content: An already serialized JSON request body, used
+                instead of json_data.
             data: Form data for the request body.
             files: Files to upload.
             headers: Additional headers.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
             endpoint_name: Name of the endpoint for error reporting.
 
         Returns
@@ -231,28 +748,55 @@ class ImmichClient:
             ImmichClientError: If the request fails.
         """
         if expected_status is None:
-            expected_status = [200]
-        if self.dry_run and method.upper() not in ["GET", "HEAD"]:
-            msg = f"DRY RUN: {method} {path}"
-            self.logger.info(msg)
-            return {}
+            expected_status = _OK_STATUS
+        if method.upper() not in ["GET", "HEAD"]:
+            if self.dry_run:
+                msg = f"DRY RUN: {method} {path}"
+                self.logger.info(msg)
+                return {}
+            self._invalidate_cache(path)
 
         url = self._make_url(path)
-        request_headers = {"Accept": "application/json"}
-        if headers:
-            request_headers.update(headers)
-
+        # Accept: application/json is a default header of the HTTP client, so a
+        # headers dict is only built when this request needs extra ones
+        request_headers = dict(headers) if headers else None
+        conditional = (
+            method.upper() == "GET" and params is None and path in CONDITIONAL_GET_PATHS
+        )
+        cached = self._etags.get(url) if conditional else None
+        if cached is not None:
+            request_headers = request_headers or {}
+            request_headers.setdefault("If-None-Match", cached[0])
+        content = json_content
+        if json_data is not None:
+            content = _json_dumps(json_data)
+        if content is not None:
+            if request_headers is None:
+                request_headers = _JSON_CONTENT_HEADERS
+            else:
+                request_headers.setdefault("Content-Type", "application/json")
+
+        attempts = self.retries + 1 if method.upper() in IDEMPOTENT_METHODS else 1
         try:
-            response = self.client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json_data,
-                data=data,
-                files=files,
-                headers=request_headers,
-            )
-            return self._handle_response(
+            for attempt in range(attempts):
+                response = self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    content=content,
+                    data=data,
+                    files=files,
+                    headers=request_headers,
+                )
+                if (
+                    response.status_code not in RETRY_STATUS_CODES
+                    or attempt == attempts - 1
+                ):
+                    break
+                time.sleep(self.retry_delay * 2**attempt)
+            if cached is not None and response.status_code == 304:
+                return cached[1]
+            result = self._handle_response(
                 response, endpoint_name or path, expected_status
             )
         except httpx.RequestError as e:
@@ -263,13 +807,122 @@ class ImmichClient:
                 url=url,
             ) from e
 
+        etag = response.headers.get("ETag") if conditional else None
+        if etag:
+            self._etags.set(url, etag, result)
+        return result
+
+    def _cached_get(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        endpoint_name: str | None = None,
+    ) -> Any:
+        """
+        Make a GET request, reusing a cached response when one is available.
+
+        Cached responses are shared between callers and must not be mutated.
+
+        Args:
+            path: The API path.
+            params: Query parameters.
+            endpoint_name: Name of the endpoint for error reporting.
+
+        Returns
+        -------
+            The parsed JSON response.
+        """
+        get_kwargs: dict[str, Any] = {"endpoint_name": endpoint_name}
+        if params is not None:
+            get_kwargs["params"] = params
+
+        key = (path, tuple(sorted(params.items())) if params else ())
+        return self._cached_call(key, lambda: self.get(path, **get_kwargs))
+
+    def _cached_call(self, key: tuple[Any, ...], fetch: Callable[[], T]) -> T:
+        """
+        Call a read function, reusing a cached result when one is available.
+
+        Args:
+            key: The cache key. Its first element is the API path the result
+                belongs to, which decides which writes invalidate it.
+            fetch: The function that reads the result on a cache miss.
+
+        Returns
+        -------
+            The cached or freshly read result.
+        """
+        if self._cache is None:
+            return fetch()
+
+        data = self._cache.get(key)
+        if data is MISSING:
+            data = fetch()
+            self._cache.set(key, data)
+        return data
+
+    def _invalidate_cache(self, path: str) -> None:
+        """
+        Drop cached reads that a write to the given path may have changed.
+
+        Args:
+            path: The API path being written to.
+        """
+        if self._cache is None:
+            return
+        resource = "/" + path.lstrip("/").split("/", 1)[0].split("?", 1)[0]
+        self._cache.invalidate(*CACHE_INVALIDATION.get(resource, (resource,)))
+
+    def clear_cache(self) -> None:
+        """Remove all cached responses."""
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _put_batches(
+        self,
+        path: str,
+        bodies: list[dict[str, Any]],
+        *,
+        endpoint_name: str,
+        max_concurrency: int = BATCH_CONCURRENCY,
+    ) -> list[Any]:
+        """
+        Make one PUT request per body, several at a time.
+
+        Args:
+            path: The API path.
+            bodies: The JSON bodies to send.
+            endpoint_name: Name of the endpoint for error reporting.
+            max_concurrency: The number of requests in flight at a time.
+
+        Returns
+        -------
+            The parsed JSON responses, in the order of the bodies.
+
+        Raises
+        ------
+            ImmichClientError: If a request fails.
+        """
+
+        def put(body: dict[str, Any]) -> Any:
+            return self.put(path, json_data=body, endpoint_name=endpoint_name)
+
+        if len(bodies) == 1 or max_concurrency <= 1:
+            return [put(body) for body in bodies]
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(bodies))
+        ) as executor:
+            return list(executor.map(put, bodies))
+
     def get(
         self,
         path: str,
         *,
         params: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
         endpoint_name: str | None = None,
     ) -> dict[str, Any]:
         """
@@ -279,7 +932,7 @@ class ImmichClient:
             path: The API path.
             params: Query parameters.
             headers: Additional headers.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
             endpoint_name: Name of the endpoint for error reporting.
 
         Returns
@@ -287,7 +940,7 @@ class ImmichClient:
             The parsed JSON response.
         """
         if expected_status is None:
-            expected_status = [200]
+            expected_status = _OK_STATUS
         return self._request(
             "GET",
             path,
@@ -303,10 +956,11 @@ class ImmichClient:
         *,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        json_content: bytes | None = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
         endpoint_name: str | None = None,
     ) -> dict[str, Any]:
         """
@@ -316,10 +970,12 @@ class ImmichClient:
             path: The API path.
             params: Query parameters.
             json_data: JSON data for the request body.
+            json_content: An already serialized JSON request body, used
+                instead of json_data.
             data: Form data for the request body.
             files: Files to upload.
             headers: Additional headers.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
             endpoint_name: Name of the endpoint for error reporting.
 
         Returns
@@ -327,12 +983,13 @@ class ImmichClient:
             The parsed JSON response.
         """
         if expected_status is None:
-            expected_status = [200, 201]
+            expected_status = _POST_OK_STATUS
         return self._request(
             "POST",
             path,
             params=params,
             json_data=json_data,
+            json_content=json_content,
             data=data,
             files=files,
             headers=headers,
@@ -346,10 +1003,11 @@ class ImmichClient:
         *,
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
+        json_content: bytes | None = None,
         data: dict[str, Any] | None = None,
         files: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
         endpoint_name: str | None = None,
     ) -> dict[str, Any]:
         """
@@ -359,10 +1017,12 @@ class ImmichClient:
             path: The API path.
             params: Query parameters.
             json_data: JSON data for the request body.
+            json_content: An already serialized JSON request body, used
+                instead of json_data.
             data: Form data for the request body.
             files: Files to upload.
             headers: Additional headers.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
             endpoint_name: Name of the endpoint for error reporting.
 
         Returns
@@ -370,12 +1030,13 @@ class ImmichClient:
             The parsed JSON response.
         """
         if expected_status is None:
-            expected_status = [200]
+            expected_status = _OK_STATUS
         return self._request(
             "PUT",
             path,
             params=params,
             json_data=json_data,
+            json_content=json_content,
             data=data,
             files=files,
             headers=headers,
@@ -390,7 +1051,7 @@ class ImmichClient:
         params: dict[str, Any] | None = None,
         json_data: dict[str, Any] | None = None,
         headers: dict[str, str] | None = None,
-        expected_status: list[int] | None = None,
+        expected_status: Collection[int] | None = None,
         endpoint_name: str | None = None,
     ) -> dict[str, Any]:
         """
@@ -401,7 +1062,7 @@ class ImmichClient:
             params: Query parameters.
             json_data: JSON data for the request body.
             headers: Additional headers.
-            expected_status: List of expected HTTP status codes.
+            expected_status: The expected HTTP status codes.
             endpoint_name: Name of the endpoint for error reporting.
 
         Returns
@@ -409,7 +1070,7 @@ class ImmichClient:
             The parsed JSON response.
         """
         if expected_status is None:
-            expected_status = [200, 204]
+            expected_status = _DELETE_OK_STATUS
         return self._request(
             "DELETE",
             path,
@@ -446,9 +1107,7 @@ class ImmichClient:
             ImmichClientError: If the request fails.
         """
         url = self._make_url(path)
-        request_headers = {"Accept": "application/octet-stream"}
-        if headers:
-            request_headers.update(headers)
+        request_headers = {**_BINARY_HEADERS, **headers} if headers else _BINARY_HEADERS
 
         try:
             response = self.client.request(
@@ -470,6 +1129,54 @@ class ImmichClient:
         else:
             return b""  # This line will never be reached
 
+    @contextmanager
+    def stream_binary(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        endpoint_name: str | None = None,
+    ) -> Iterator[httpx.Response]:
+        """
+        Make a streaming GET request to the Immich API.
+
+        The response body is not read into memory; iterate over it with
+        response.iter_bytes() inside the context.
+
+        Args:
+            path: The API path.
+            params: Query parameters.
+            headers: Additional headers.
+            endpoint_name: Name of the endpoint for error reporting.
+
+        Yields
+        ------
+            The streaming HTTP response.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        url = self._make_url(path)
+        request_headers = {**_BINARY_HEADERS, **headers} if headers else _BINARY_HEADERS
+
+        try:
+            with self.client.stream(
+                "GET", url, params=params, headers=request_headers
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
+                    self._handle_response(response, endpoint_name or path)
+                yield response
+        except httpx.RequestError as e:
+            raise ImmichClientError(
+                message=f"Request failed: {e!s}",
+                endpoint=endpoint_name or path,
+                method="GET",
+                url=url,
+            ) from e
+
     # Server API methods
 
     def ping_server(self) -> bool:
@@ -538,6 +1245,9 @@ class ImmichClient:
         """
         Get the media types supported by the server.
 
+        The list is fetched once per client and reused afterwards. The
+        returned dictionary is shared and must not be mutated.
+
         Returns
         -------
             A dictionary mapping file extensions to media types.
@@ -546,20 +1256,21 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        response = self.get(
-            "/server/media-types", endpoint_name="GetSupportedMediaTypes"
-        )
-        media_types: dict[str, str] = {}
-        for media_type, extensions in response.items():
-            for ext in extensions:
-                media_types[ext] = media_type
+        if not self._supported_media_types:
+            response = self.get(
+                "/server/media-types", endpoint_name="GetSupportedMediaTypes"
+            )
+            media_types = {
+                ext: media_type
+                for media_type, extensions in response.items()
+                for ext in extensions
+            }
 
-        # Add some additional types
-        media_types[".mp"] = "useless"
-        media_types[".json"] = "sidecar"
-        media_types[".csv"] = "meta"
+            # Add some additional types
+            media_types |= {".mp": "useless", ".json": "sidecar", ".csv": "meta"}
 
-        return media_types
+            self._supported_media_types = media_types
+        return self._supported_media_types
 
     def get_about_info(self) -> dict[str, Any]:
         """
@@ -592,27 +1303,135 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        return self.get(f"/assets/{asset_id}", endpoint_name="GetAssetInfo")
+        return self._cached_get(f"/assets/{asset_id}", endpoint_name="GetAssetInfo")
 
-    def download_asset(self, asset_id: str) -> bytes:
+    def download_asset(
+        self, asset_id: str, destination: str | Path | BinaryIO | None = None
+    ) -> bytes | int:
         """
         Download an asset.
 
+        Without a destination the whole asset is read into memory. With one,
+        it is streamed there in chunks by download_asset_to instead, which
+        keeps memory use flat for large videos.
+
         Args:
             asset_id: The ID of the asset.
+            destination: A file path or a binary file object to write to.
 
         Returns
         -------
-            The asset data.
+            The asset data, or the number of bytes written if a destination
+            was given.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
+        if destination is not None:
+            return self.download_asset_to(asset_id, destination)
         return self.get_binary(
             f"/assets/{asset_id}/original", endpoint_name="DownloadAsset"
         )
 
+    def download_asset_to(
+        self,
+        asset_id: str,
+        destination: str | Path | BinaryIO,
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download an asset, streaming it to a file.
+
+        A file path destination is written through a temporary ".part" file
+        that replaces it once the download completes, so a failed download
+        never leaves a truncated file behind.
+
+        Args:
+            asset_id: The ID of the asset.
+            destination: A file path or a binary file object to write to.
+            chunk_size: The number of bytes to read and write at a time.
+
+        Returns
+        -------
+            The number of bytes written.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        with self.stream_binary(
+            f"/assets/{asset_id}/original", endpoint_name="DownloadAsset"
+        ) as response:
+            if isinstance(destination, str | Path):
+                partial_path = _partial_path(destination)
+                try:
+                    with partial_path.open("wb") as f:
+                        written = _copy_response(response, f, chunk_size)
+                    partial_path.replace(destination)
+                except BaseException:
+                    partial_path.unlink(missing_ok=True)
+                    raise
+                return written
+            return _copy_response(response, destination, chunk_size)
+
+    async def download_asset_to_async(
+        self,
+        http_client: httpx.AsyncClient,
+        asset_id: str,
+        destination: str | Path,
+        *,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE,
+    ) -> int:
+        """
+        Download an asset asynchronously, streaming it to a file.
+
+        Like download_asset_to, the file is written through a temporary
+        ".part" file that replaces the destination once the download completes.
+
+        Args:
+            http_client: The async HTTP client from async_client().
+            asset_id: The ID of the asset.
+            destination: The file path to write to.
+            chunk_size: The number of bytes to read and write at a time.
+
+        Returns
+        -------
+            The number of bytes written.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        url = self._make_url(f"/assets/{asset_id}/original")
+        try:
+            async with http_client.stream(
+                "GET", url, headers=_BINARY_HEADERS
+            ) as response:
+                if response.status_code != 200:
+                    await response.aread()
+                    self._handle_response(response, "DownloadAsset")
+                partial_path = _partial_path(destination)
+                try:
+                    with await asyncio.to_thread(partial_path.open, "wb") as f:
+                        written = 0
+                        async for chunk in response.aiter_bytes(chunk_size):
+                            await asyncio.to_thread(f.write, chunk)
+                            written += len(chunk)
+                    await asyncio.to_thread(partial_path.replace, destination)
+                except BaseException:
+                    await asyncio.to_thread(partial_path.unlink, missing_ok=True)
+                    raise
+                return written
+        except httpx.RequestError as e:
+            raise ImmichClientError(
+                message=f"Request failed: {e!s}",
+                endpoint="DownloadAsset",
+                method="GET",
+                url=url,
+            ) from e
+
     def update_asset(self, asset_id: str, **fields) -> dict[str, Any]:
         """
         Update an asset.
@@ -669,10 +1488,15 @@ class ImmichClient:
         longitude: float = 0.0,
         remove_parent: bool = False,
         stack_parent_id: str | None = None,
+        **fields: Any,
     ) -> dict[str, Any]:
         """
         Update multiple assets.
 
+        All assets are updated by the bulk endpoint, one request per
+        UPDATE_BATCH_SIZE assets, which is much faster than calling
+        update_asset for each asset.
+
         Args:
             asset_ids: The IDs of the assets to update.
             is_archived: Whether the assets are archived.
@@ -681,46 +1505,92 @@ class ImmichClient:
             longitude: The longitude of the assets.
             remove_parent: Whether to remove the parent stack.
             stack_parent_id: The ID of the parent stack.
+            **fields: Additional fields to update, using the API's field names,
+                e.g. rating or dateTimeOriginal.
 
         Returns
         -------
-            The response from the server.
+            The merged responses from the server.
 
         Raises
         ------
             ImmichClientError: If the request fails.
         """
         data = {
-            "ids": asset_ids,
             "isArchived": is_archived,
             "isFavorite": is_favorite,
             "latitude": latitude,
             "longitude": longitude,
             "removeParent": remove_parent,
+            **fields,
         }
         if stack_parent_id:
             data["stackParentId"] = stack_parent_id
 
-        return self.put("/assets", json_data=data, endpoint_name="UpdateAssets")
+        return self.update_assets_fields(asset_ids, **data)
 
-    def upload_asset(
-        self,
-        file_path: str | Path,
-        *,
-        device_asset_id: str | None = None,
-        device_id: str | None = None,
-        is_favorite: bool = False,
-        is_archived: bool = False,
-        file_created_at: datetime | None = None,
+    def update_assets_fields(
+        self, asset_ids: list[str], **fields: Any
+    ) -> dict[str, Any]:
+        """
+        Set only the given fields on multiple assets.
+
+        Unlike update_assets, fields that are not given are left unchanged.
+        The fields are serialized once and shared by every batch, so only
+        the IDs are encoded per request.
+
+        Args:
+            asset_ids: The IDs of the assets to update.
+            **fields: The fields to update, using the API's field names.
+
+        Returns
+        -------
+            The merged responses from the server.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        body = _json_dumps(fields)
+        suffix = b"," + body[1:] if len(body) > 2 else b"}"
+        result: dict[str, Any] = {}
+        for start in range(0, len(asset_ids), UPDATE_BATCH_SIZE):
+            batch = asset_ids[start : start + UPDATE_BATCH_SIZE]
+            result.update(
+                self.put(
+                    "/assets",
+                    json_content=b'{"ids":' + _json_dumps(batch) + suffix,
+                    endpoint_name="UpdateAssets",
+                )
+            )
+        return result
+
+    @_dry_run_returns(lambda **_: {"id": "dry-run-id", "status": "created"})
+    def upload_asset(
+        self,
+        file_path: str | Path,
+        *,
+        device_asset_id: str | None = None,
+        device_id: str | None = None,
+        is_favorite: bool = False,
+        is_archived: bool = False,
+        file_created_at: datetime | None = None,
         file_modified_at: datetime | None = None,
         duration: str = "00:00:00.000000",
         is_read_only: bool = False,
         sidecar_path: str | Path | None = None,
         progress_callback: Callable[[int], None] | None = None,
+        data_callback: Callable[[bytes], None] | None = None,
+        file_stat: os.stat_result | None = None,
+        file: BinaryIO | None = None,
     ) -> dict[str, Any]:
         """
         Upload an asset.
 
+        The file is streamed from disk, so memory use does not grow with its
+        size. Immich accepts each asset in a single request and has no
+        multipart upload API, so large files are not split into parts.
+
         Args:
             file_path: The path to the file to upload.
             device_asset_id: The device asset ID.
@@ -733,6 +1603,11 @@ class ImmichClient:
             is_read_only: Whether the asset is read-only.
             sidecar_path: The path to a sidecar file to upload.
             progress_callback: Optional callback function to report upload progress.
+            data_callback: Optional callback receiving each block of the file as
+                it is sent, e.g. to hash the file in the same pass.
+            file_stat: The result of stat() for the file, if already known.
+            file: An open binary handle for the file to send instead of opening
+                file_path. It is read from the start and left open.
 
         Returns
         -------
@@ -742,120 +1617,259 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return {"id": "dry-run-id", "status": "created"}
-
         file_path = Path(file_path)
-        if not file_path.exists():
-            msg = f"File not found: {file_path}"
-            raise ImmichClientError(msg)
-
-        file_stat = file_path.stat()
-        file_size = file_stat.st_size
+        form_data = self._build_upload_form(
+            file_path,
+            device_asset_id=device_asset_id,
+            device_id=device_id,
+            is_favorite=is_favorite,
+            is_archived=is_archived,
+            file_created_at=file_created_at,
+            file_modified_at=file_modified_at,
+            duration=duration,
+            is_read_only=is_read_only,
+            file_stat=file_stat,
+        )
         file_name = file_path.name
-        file_ext = file_path.suffix.lower()
-
-        # Determine asset type from extension
-        asset_type = self._get_asset_type(file_ext)
-        if asset_type not in ["image", "video"]:
-            msg = f"Unsupported file type: {file_ext}"
-            raise ImmichClientError(msg)
 
-        # Prepare form data
-        form_data = {
-            "deviceAssetId": device_asset_id or f"{file_name}-{file_size}",
-            "deviceId": device_id or self.device_uuid,
-            "assetType": asset_type,
-            "fileCreatedAt": (
-                file_created_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-                if file_created_at
-                else datetime.fromtimestamp(file_stat.st_ctime).strftime(  # noqa: DTZ006
-                    "%Y-%m-%dT%H:%M:%SZ"
-                )
-            ),
-            "fileModifiedAt": (
-                file_modified_at.strftime("%Y-%m-%dT%H:%M:%SZ")
-                if file_modified_at
-                else datetime.fromtimestamp(file_stat.st_mtime).strftime(  # noqa: DTZ006
-                    "%Y-%m-%dT%H:%M:%SZ"
+        # A caller-supplied handle stays open for the caller to close
+        with ExitStack() as stack:
+            asset_file = (
+                file
+                if file is not None
+                else stack.enter_context(_open_upload_file(file_path))
+            )
+            files = {
+                "assetData": (
+                    file_name,
+                    _ProgressFileWrapper(asset_file, progress_callback, data_callback),
+                    self._get_mime_type(file_path),
                 )
-            ),
-            "isFavorite": str(is_favorite).lower(),
-            "isArchived": str(is_archived).lower(),
-            "fileExtension": file_ext,
-            "duration": duration,
-            "isReadOnly": str(is_read_only).lower(),
-        }
+            }
 
-        # Create a custom file-like object that reports progress
-        class ProgressFileWrapper:
-            def __init__(self, file, callback=None):
-                self.file = file
-                self.callback = callback or (lambda _: None)
+            # Add sidecar if provided; progress is not tracked for sidecars
+            if sidecar_path:
+                sidecar_path = Path(sidecar_path)
+                files["sidecarData"] = (
+                    sidecar_path.name,
+                    stack.enter_context(
+                        _open_upload_file(sidecar_path, "Sidecar file")
+                    ),
+                    self._get_mime_type(sidecar_path),
+                )
 
-            def read(self, size=-1):
-                data = self.file.read(size)
-                if data:
-                    self.callback(len(data))
-                return data
+            return self.post(
+                "/assets",
+                data=form_data,
+                files=files,
+                endpoint_name="AssetUpload",
+            )
 
-            def seek(self, *args, **kwargs):
-                return self.file.seek(*args, **kwargs)
+    @_dry_run_returns(lambda **_: {"id": "dry-run-id", "status": "created"})
+    async def upload_asset_async(
+        self,
+        http_client: httpx.AsyncClient,
+        file_path: str | Path,
+        *,
+        device_asset_id: str | None = None,
+        device_id: str | None = None,
+        is_favorite: bool = False,
+        is_archived: bool = False,
+        file_created_at: datetime | None = None,
+        file_modified_at: datetime | None = None,
+        duration: str = "00:00:00.000000",
+        is_read_only: bool = False,
+        sidecar_path: str | Path | None = None,
+        progress_callback: Callable[[int], None] | None = None,
+        data_callback: Callable[[bytes], None] | None = None,
+        file_stat: os.stat_result | None = None,
+    ) -> dict[str, Any]:
+        """
+        Upload an asset using an async HTTP client.
 
-            def tell(self):
-                return self.file.tell()
+        Args:
+            http_client: The async client obtained from async_client().
+            file_path: The path to the file to upload.
+            device_asset_id: The device asset ID.
+            device_id: The device ID.
+            is_favorite: Whether the asset is a favorite.
+            is_archived: Whether the asset is archived.
+            file_created_at: The creation date of the file.
+            file_modified_at: The modification date of the file.
+            duration: The duration of the asset (for videos).
+            is_read_only: Whether the asset is read-only.
+            sidecar_path: The path to a sidecar file to upload.
+            progress_callback: Optional callback function to report upload progress.
+            data_callback: Optional callback receiving each block of the file as
+                it is sent, e.g. to hash the file in the same pass.
+            file_stat: The result of stat() for the file, if already known.
 
-            def close(self):
-                return self.file.close()
+        Returns
+        -------
+            The response from the server.
 
-        # Use context managers for file resources
-        with Path.open(file_path, "rb") as asset_file:
-            wrapped_file = ProgressFileWrapper(asset_file, progress_callback)
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        file_path = Path(file_path)
+        # Building the form may stat the file and, on first use, fetch the
+        # supported media types with the sync client, so it runs in a worker
+        # thread rather than stalling the other uploads on the event loop
+        form_data = await asyncio.to_thread(
+            self._build_upload_form,
+            file_path,
+            device_asset_id=device_asset_id,
+            device_id=device_id,
+            is_favorite=is_favorite,
+            is_archived=is_archived,
+            file_created_at=file_created_at,
+            file_modified_at=file_modified_at,
+            duration=duration,
+            is_read_only=is_read_only,
+            file_stat=file_stat,
+        )
+        if sidecar_path:
+            sidecar_path = Path(sidecar_path)
+            if not await asyncio.to_thread(sidecar_path.exists):
+                msg = f"Sidecar file not found: {sidecar_path}"
+                raise ImmichClientError(msg)
+
+        self._invalidate_cache("/assets")
+        url = self._make_url("/assets")
+        with ExitStack() as stack:
+            asset_file = stack.enter_context(
+                await asyncio.to_thread(file_path.open, "rb")
+            )
             files = {
                 "assetData": (
-                    file_name,
-                    wrapped_file,
+                    file_path.name,
+                    _ProgressFileWrapper(asset_file, progress_callback, data_callback),
                     self._get_mime_type(file_path),
                 )
             }
-
-            # Add sidecar if provided
             if sidecar_path:
-                sidecar_path = Path(sidecar_path)
-                if not sidecar_path.exists():
-                    msg = f"Sidecar file not found: {sidecar_path}"
-                    raise ImmichClientError(msg)
-
-                with Path.open(sidecar_path, "rb") as sidecar_file:
-                    # We don't track progress for sidecar files
-                    files["sidecarData"] = (
-                        sidecar_path.name,
-                        sidecar_file,
-                        self._get_mime_type(sidecar_path),
-                    )
+                files["sidecarData"] = (
+                    sidecar_path.name,
+                    stack.enter_context(
+                        await asyncio.to_thread(sidecar_path.open, "rb")
+                    ),
+                    self._get_mime_type(sidecar_path),
+                )
 
-                    # Make the API request with all files now properly managed
-                    return self.post(
-                        "/assets",
+            for attempt in range(self.retries + 1):
+                for _, file, _ in files.values():
+                    file.seek(0)
+                try:
+                    response = await http_client.post(
+                        url,
                         data=form_data,
                         files=files,
-                        endpoint_name="AssetUpload",
+                        headers=_JSON_HEADERS,
                     )
+                except httpx.TimeoutException as e:
+                    if attempt < self.retries:
+                        await asyncio.sleep(self.retry_delay * 2**attempt)
+                        continue
+                    raise ImmichClientError(
+                        message=f"Request failed: {e!s}",
+                        endpoint="AssetUpload",
+                        method="POST",
+                        url=url,
+                    ) from e
+                except httpx.RequestError as e:
+                    raise ImmichClientError(
+                        message=f"Request failed: {e!s}",
+                        endpoint="AssetUpload",
+                        method="POST",
+                        url=url,
+                    ) from e
+                if response.status_code not in RETRY_STATUS_CODES:
+                    break
+                if attempt < self.retries:
+                    await asyncio.sleep(self.retry_delay * 2**attempt)
+
+        return self._handle_response(response, "AssetUpload", _POST_OK_STATUS)
+
+    def _build_upload_form(
+        self,
+        file_path: Path,
+        *,
+        device_asset_id: str | None = None,
+        device_id: str | None = None,
+        is_favorite: bool = False,
+        is_archived: bool = False,
+        file_created_at: datetime | None = None,
+        file_modified_at: datetime | None = None,
+        duration: str = "00:00:00.000000",
+        is_read_only: bool = False,
+        file_stat: os.stat_result | None = None,
+    ) -> dict[str, str]:
+        """
+        Build the multipart form fields for an asset upload.
 
-            # If no sidecar, just make the request with the asset file
-            return self.post(
-                "/assets",
-                data=form_data,
-                files=files,
-                endpoint_name="AssetUpload",
-            )
+        Args:
+            file_path: The path to the file to upload.
+            device_asset_id: The device asset ID.
+            device_id: The device ID.
+            is_favorite: Whether the asset is a favorite.
+            is_archived: Whether the asset is archived.
+            file_created_at: The creation date of the file.
+            file_modified_at: The modification date of the file.
+            duration: The duration of the asset (for videos).
+            is_read_only: Whether the asset is read-only.
+            file_stat: The result of stat() for the file, if already known.
+
+        Returns
+        -------
+            The form fields for the upload request.
+
+        Raises
+        ------
+            ImmichClientError: If the file does not exist or is not supported.
+        """
+        if file_stat is None:
+            try:
+                file_stat = file_path.stat()
+            except FileNotFoundError as e:
+                msg = f"File not found: {file_path}"
+                raise ImmichClientError(msg) from e
 
+        file_size = file_stat.st_size
+        file_name = file_path.name
+        file_ext = file_path.suffix.lower()
+
+        # Determine asset type from extension
+        asset_type = self._get_asset_type(file_ext)
+        if asset_type not in ["image", "video"]:
+            msg = f"Unsupported file type: {file_ext}"
+            raise ImmichClientError(msg)
+
+        return {
+            "deviceAssetId": device_asset_id or f"{file_name}-{file_size}",
+            "deviceId": device_id or self.device_uuid,
+            "assetType": asset_type,
+            "fileCreatedAt": _format_timestamp(
+                file_created_at or datetime.fromtimestamp(file_stat.st_ctime)  # noqa: DTZ006
+            ),
+            "fileModifiedAt": _format_timestamp(
+                file_modified_at or datetime.fromtimestamp(file_stat.st_mtime)  # noqa: DTZ006
+            ),
+            "isFavorite": "true" if is_favorite else "false",
+            "isArchived": "true" if is_archived else "false",
+            "fileExtension": file_ext,
+            "duration": duration,
+            "isReadOnly": "true" if is_read_only else "false",
+        }
+
+    @_dry_run_returns(lambda asset_id, **_: {"id": asset_id, "status": "replaced"})
     def replace_asset(
         self,
         asset_id: str,
         file_path: str | Path,
         *,
         sidecar_path: str | Path | None = None,
+        file: BinaryIO | None = None,
     ) -> dict[str, Any]:
         """
         Replace an asset.
@@ -864,6 +1878,8 @@ class ImmichClient:
             asset_id: The ID of the asset to replace.
             file_path: The path to the file to upload.
             sidecar_path: The path to a sidecar file to upload.
+            file: An open binary handle for the file to send instead of opening
+                file_path. It is read from the start and left open.
 
         Returns
         -------
@@ -873,16 +1889,15 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return {"id": asset_id, "status": "replaced"}
-
         file_path = Path(file_path)
-        if not file_path.exists():
-            msg = f"File not found: {file_path}"
-            raise ImmichClientError(msg)
 
-        # Use context managers with Path.open
-        with file_path.open("rb") as asset_file:
+        # A caller-supplied handle stays open for the caller to close
+        with ExitStack() as stack:
+            asset_file = (
+                file
+                if file is not None
+                else stack.enter_context(_open_upload_file(file_path))
+            )
             files = {
                 "assetData": (
                     file_path.name,
@@ -894,25 +1909,14 @@ class ImmichClient:
             # Add sidecar if provided
             if sidecar_path:
                 sidecar_path = Path(sidecar_path)
-                if not sidecar_path.exists():
-                    msg = f"Sidecar file not found: {sidecar_path}"
-                    raise ImmichClientError(msg)
-
-                with sidecar_path.open("rb") as sidecar_file:
-                    files["sidecarData"] = (
-                        sidecar_path.name,
-                        sidecar_file,
-                        self._get_mime_type(sidecar_path),
-                    )
-
-                    # Make API request with both files properly managed
-                    return self.put(
-                        f"/assets/{asset_id}/original",
-                        files=files,
-                        endpoint_name="AssetReplace",
-                    )
+                files["sidecarData"] = (
+                    sidecar_path.name,
+                    stack.enter_context(
+                        _open_upload_file(sidecar_path, "Sidecar file")
+                    ),
+                    self._get_mime_type(sidecar_path),
+                )
 
-            # If no sidecar, just make the request with the asset file
             return self.put(
                 f"/assets/{asset_id}/original",
                 files=files,
@@ -948,7 +1952,7 @@ class ImmichClient:
         make: str | None = None,
         checksum: str | None = None,
         original_file_name: str | None = None,
-        id: uuid.UUID | None = None,
+        id: "uuid.UUID | None" = None,
     ) -> list[dict[str, Any]]:
         """
         Search for assets.
@@ -975,47 +1979,272 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        query = {
-            "page": page,
-            "size": page_size,
-            "withExif": with_exif,
-            "isVisible": is_visible,
-            "withDeleted": with_deleted,
-            "withArchived": with_archived,
-        }
+        return list(
+            self.iter_search_assets(
+                page=page,
+                page_size=page_size,
+                with_exif=with_exif,
+                is_visible=is_visible,
+                with_deleted=with_deleted,
+                with_archived=with_archived,
+                taken_before=taken_before,
+                taken_after=taken_after,
+                model=model,
+                make=make,
+                checksum=checksum,
+                original_file_name=original_file_name,
+                id=id,
+            )
+        )
+
+    def iter_search_assets(
+        self,
+        *,
+        page: int = 1,
+        page_size: int = 1000,
+        with_exif: bool = True,
+        is_visible: bool = True,
+        with_deleted: bool = False,
+        with_archived: bool = False,
+        taken_before: str | None = None,
+        taken_after: str | None = None,
+        model: str | None = None,
+        make: str | None = None,
+        checksum: str | None = None,
+        original_file_name: str | None = None,
+        id: "uuid.UUID | None" = None,
+        prefetch: int = 1,
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Search for assets, yielding them one page at a time.
 
-        if taken_before:
-            query["takenBefore"] = taken_before
-        if taken_after:
-            query["takenAfter"] = taken_after
-        if model:
-            query["model"] = model
-        if make:
-            query["make"] = make
-        if checksum:
-            query["checksum"] = checksum
-        if original_file_name:
-            query["originalFileName"] = original_file_name
-        if id:
-            query["id"] = id
+        Pages are requested lazily as the iterator is consumed, so only one
+        page of results is held in memory at a time. With prefetch above 1,
+        that many pages are requested concurrently ahead of the consumer,
+        which may request up to prefetch - 1 pages past the last one.
 
-        assets = []
+        Args:
+            page: The page number.
+            page_size: The number of assets per page.
+            with_exif: Whether to include EXIF data.
+            is_visible: Whether to include visible assets.
+            with_deleted: Whether to include deleted assets.
+            with_archived: Whether to include archived assets.
+            taken_before: Only include assets taken before this date.
+            taken_after: Only include assets taken after this date.
+            model: Only include assets with this camera model.
+            make: Only include assets with this camera make.
+            checksum: Only include assets with this checksum.
+            original_file_name: Only include assets with this original file name.
+            prefetch: The number of pages to keep in flight at a time.
+
+        Yields
+        ------
+            The matching assets.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        query = _search_query(
+            page=page,
+            page_size=page_size,
+            with_exif=with_exif,
+            is_visible=is_visible,
+            with_deleted=with_deleted,
+            with_archived=with_archived,
+            filters=(
+                taken_before,
+                taken_after,
+                model,
+                make,
+                checksum,
+                original_file_name,
+                id,
+            ),
+        )
+
+        if prefetch > 1:
+            yield from self._iter_search_pages_prefetched(query, prefetch)
+            return
+
+        # Only the page number changes between requests, so the rest of the
+        # query is serialized once
+        body = _paged_json(query)
+        page = query["page"]
         while True:
             response = self.post(
                 "/search/metadata",
-                json_data=query,
+                json_content=body(page),
                 endpoint_name="SearchMetadata",
             )
-            items = response.get("assets", {}).get("items", [])
-            assets.extend(items)
+            yield from response.get("assets", {}).get("items", [])
 
             next_page = response.get("assets", {}).get("nextPage")
             if not next_page:
                 break
-            query["page"] = int(next_page)
+            page = int(next_page)
+
+    def _iter_search_pages_prefetched(
+        self, query: dict[str, Any], prefetch: int
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Search for assets, keeping several page requests in flight.
 
+        Args:
+            query: The search query, including the first page number.
+            prefetch: The number of pages to keep in flight at a time.
+
+        Yields
+        ------
+            The matching assets, in page order.
+        """
+        body = _paged_json(query)
+
+        def fetch(page: int) -> dict[str, Any]:
+            return self.post(
+                "/search/metadata",
+                json_content=body(page),
+                endpoint_name="SearchMetadata",
+            )
+
+        next_page = query["page"]
+        with ThreadPoolExecutor(max_workers=prefetch) as executor:
+            pending: deque[Future[dict[str, Any]]] = deque()
+            try:
+                while True:
+                    while len(pending) < prefetch:
+                        pending.append(executor.submit(fetch, next_page))
+                        next_page += 1
+                    response = pending.popleft().result()
+                    yield from response.get("assets", {}).get("items", [])
+                    if not response.get("assets", {}).get("nextPage"):
+                        break
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    async def search_assets_async(
+        self,
+        http_client: httpx.AsyncClient,
+        *,
+        page: int = 1,
+        page_size: int = 1000,
+        with_exif: bool = True,
+        is_visible: bool = True,
+        with_deleted: bool = False,
+        with_archived: bool = False,
+        taken_before: str | None = None,
+        taken_after: str | None = None,
+        model: str | None = None,
+        make: str | None = None,
+        checksum: str | None = None,
+        original_file_name: str | None = None,
+        id: "uuid.UUID | None" = None,
+        max_concurrency: int = 8,
+    ) -> list[dict[str, Any]]:
+        """
+        Search for assets asynchronously, fetching pages concurrently.
+
+        The first page is fetched on its own. If there are more, the
+        following pages are requested max_concurrency at a time, which may
+        request up to max_concurrency - 1 pages past the last one.
+
+        Args:
+            http_client: The async HTTP client to use, see async_client.
+            page: The page number.
+            page_size: The number of assets per page.
+            with_exif: Whether to include EXIF data.
+            is_visible: Whether to include visible assets.
+            with_deleted: Whether to include deleted assets.
+            with_archived: Whether to include archived assets.
+            taken_before: Only include assets taken before this date.
+            taken_after: Only include assets taken after this date.
+            model: Only include assets with this camera model.
+            make: Only include assets with this camera make.
+            checksum: Only include assets with this checksum.
+            original_file_name: Only include assets with this original file name.
+            max_concurrency: The number of pages requested at a time.
+
+        Returns
+        -------
+            A list of assets.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        query = _search_query(
+            page=page,
+            page_size=page_size,
+            with_exif=with_exif,
+            is_visible=is_visible,
+            with_deleted=with_deleted,
+            with_archived=with_archived,
+            filters=(
+                taken_before,
+                taken_after,
+                model,
+                make,
+                checksum,
+                original_file_name,
+                id,
+            ),
+        )
+
+        body = _paged_json(query)
+        response = await self._search_page_async(http_client, body(page))
+        assets = list(response.get("assets", {}).get("items", []))
+        next_page = response.get("assets", {}).get("nextPage")
+        while next_page:
+            first = int(next_page)
+            responses = await asyncio.gather(
+                *(
+                    self._search_page_async(http_client, body(number))
+                    for number in range(first, first + max_concurrency)
+                )
+            )
+            for response in responses:
+                assets.extend(response.get("assets", {}).get("items", []))
+                next_page = response.get("assets", {}).get("nextPage")
+                if not next_page:
+                    break
         return assets
 
+    async def _search_page_async(
+        self, http_client: httpx.AsyncClient, body: bytes
+    ) -> dict[str, Any]:
+        """
+        Fetch one page of search results asynchronously.
+
+        Args:
+            http_client: The async HTTP client to use.
+            body: The JSON search query, including the page number.
+
+        Returns
+        -------
+            The search response.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        url = self._make_url("/search/metadata")
+        try:
+            response = await http_client.post(
+                url,
+                content=body,
+                headers=_JSON_BODY_HEADERS,
+            )
+        except httpx.RequestError as e:
+            raise ImmichClientError(
+                message=f"Request failed: {e!s}",
+                endpoint="SearchMetadata",
+                method="POST",
+                url=url,
+            ) from e
+        return self._handle_response(response, "SearchMetadata")
+
     def get_assets_by_hash(self, checksum: str) -> list[dict[str, Any]]:
         """
         Get assets by hash.
@@ -1031,8 +2260,114 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        assets = self.search_assets(checksum=checksum)
-        return [asset for asset in assets if asset.get("checksum") == checksum]
+
+        def fetch() -> list[dict[str, Any]]:
+            assets = self.search_assets(checksum=checksum)
+            return [asset for asset in assets if asset.get("checksum") == checksum]
+
+        return self._cached_call(("/assets", "checksum", checksum), fetch)
+
+    def _check_bulk_upload(
+        self, checksums: list[str], batch_size: int
+    ) -> dict[str, str] | None:
+        """
+        Ask the server which checksums belong to existing assets.
+
+        Args:
+            checksums: The unique checksums to check.
+            batch_size: The number of checksums sent per request.
+
+        Returns
+        -------
+            A dictionary mapping each existing checksum to its asset ID, or
+            None if the server has no bulk upload check endpoint.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        existing: dict[str, str] = {}
+        for start in range(0, len(checksums), batch_size):
+            batch = checksums[start : start + batch_size]
+            try:
+                response = self.post(
+                    "/assets/bulk-upload-check",
+                    json_data={"assets": [{"id": c, "checksum": c} for c in batch]},
+                    endpoint_name="CheckBulkUpload",
+                )
+            except ImmichClientError as e:
+                if e.status_code != 404:
+                    raise
+                return None
+
+            for item in response.get("results", []):
+                asset_id = item.get("assetId")
+                if item.get("action") == "reject" and asset_id:
+                    existing[item["id"]] = asset_id
+        return existing
+
+    def check_existing_checksums(
+        self, checksums: Iterable[str], *, batch_size: int = HASH_BATCH_SIZE
+    ) -> dict[str, str]:
+        """
+        Find which checksums belong to assets already on the server.
+
+        Unlike get_assets_by_hashes, the matching assets are not fetched.
+
+        Args:
+            checksums: The checksums to check, as computed by server_checksum.
+            batch_size: The number of checksums sent per request.
+
+        Returns
+        -------
+            A dictionary mapping each existing checksum to its asset ID.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        unique = list(dict.fromkeys(checksums))
+        existing = self._check_bulk_upload(unique, batch_size)
+        if existing is None:
+            existing = {
+                checksum: assets[0]["id"]
+                for checksum in unique
+                if (assets := self.get_assets_by_hash(checksum))
+            }
+        return existing
+
+    def get_assets_by_hashes(
+        self, checksums: Iterable[str], *, batch_size: int = HASH_BATCH_SIZE
+    ) -> dict[str, list[dict[str, Any]]]:
+        """
+        Get assets for many checksums at once.
+
+        The checksums are sent to the bulk upload check endpoint in batches, so
+        only the assets the server reports as existing are fetched. Servers
+        without the endpoint fall back to one search per checksum.
+
+        Args:
+            checksums: The checksums to search for.
+            batch_size: The number of checksums sent per request.
+
+        Returns
+        -------
+            A dictionary mapping each checksum to the assets with that checksum.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+        unique = list(dict.fromkeys(checksums))
+        existing = self._check_bulk_upload(unique, batch_size)
+        if existing is None:
+            return {checksum: self.get_assets_by_hash(checksum) for checksum in unique}
+        return {
+            checksum: [self.get_asset_info(existing[checksum])]
+            if checksum in existing
+            else []
+            for checksum in unique
+        }
 
     def get_assets_by_name(self, name: str) -> list[dict[str, Any]]:
         """
@@ -1049,8 +2384,12 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        assets = self.search_assets(original_file_name=name)
-        return [asset for asset in assets if asset.get("originalFileName") == name]
+
+        def fetch() -> list[dict[str, Any]]:
+            assets = self.search_assets(original_file_name=name)
+            return [asset for asset in assets if asset.get("originalFileName") == name]
+
+        return self._cached_call(("/assets", "originalFileName", name), fetch)
 
     def search_assets_by_filename_pattern(self, pattern: str) -> list[dict[str, Any]]:
         """
@@ -1068,13 +2407,14 @@ class ImmichClient:
             ImmichClientError: If the request fails.
         """
         # Use the metadata search endpoint with `originalFileName` parameter.
-        query = {"originalFileName": pattern, "size": 999, "page": 1}
+        body = _paged_json({"originalFileName": pattern, "size": 999})
 
         assets = []
+        page = 1
         while True:
             response = self.post(
                 "/search/metadata",
-                json_data=query,
+                json_content=body(page),
                 endpoint_name="SearchAssetsByFilename",
             )
             assets_result = response.get("assets", {})
@@ -1089,7 +2429,7 @@ class ImmichClient:
                 break
 
             # Update the page number for the next request
-            query["page"] = int(next_page)
+            page = int(next_page)
 
         return assets
 
@@ -1107,7 +2447,32 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        return self.get("/albums", endpoint_name="GetAllAlbums")
+        return self._cached_get("/albums", endpoint_name="GetAllAlbums")
+
+    def get_albums_by_name(self) -> dict[str, dict[str, Any]]:
+        """
+        Get all albums, indexed by name.
+
+        The index is cached along with the album list, so looking albums up
+        by name makes no further requests until an album is written. If
+        several albums share a name, the first one listed is kept.
+
+        Returns
+        -------
+            A dictionary mapping album names to albums.
+
+        Raises
+        ------
+            ImmichClientError: If the request fails.
+        """
+
+        def build() -> dict[str, dict[str, Any]]:
+            albums: dict[str, dict[str, Any]] = {}
+            for album in self.get_all_albums():
+                albums.setdefault(album.get("albumName", ""), album)
+            return albums
+
+        return self._cached_call(("/albums", "albumName"), build)
 
     def get_album_info(
         self, album_id: str, without_assets: bool = False
@@ -1127,39 +2492,62 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        return self.get(
+        return self._cached_get(
             f"/albums/{album_id}",
-            params={"withoutAssets": str(without_assets).lower()},
+            params={"withoutAssets": "true" if without_assets else "false"},
             endpoint_name="GetAlbumInfo",
         )
 
+    @_dry_run_returns(lambda **_: [])
     def add_assets_to_album(
         self, album_id: str, asset_ids: list[str]
     ) -> list[dict[str, Any]]:
         """
         Add assets to an album.
 
+        The assets are sent ALBUM_BATCH_SIZE at a time, with up to
+        BATCH_CONCURRENCY requests in flight, so adding a large upload to an
+        album stays within request size limits.
+
         Args:
             album_id: The ID of the album.
             asset_ids: The IDs of the assets to add.
 
         Returns
         -------
-            The response from the server.
+            The combined responses from the server, one entry per asset.
 
         Raises
         ------
-            ImmichClientError: If the request fails.
+            ImmichClientError: If a request fails.
         """
-        if self.dry_run:
+        if not asset_ids:
             return []
 
-        return self.put(
+        if len(asset_ids) <= ALBUM_BATCH_SIZE:
+            return self.put(
+                f"/albums/{album_id}/assets",
+                json_data={"ids": asset_ids},
+                endpoint_name="AddAssetToAlbum",
+            )
+
+        responses = self._put_batches(
             f"/albums/{album_id}/assets",
-            json_data={"ids": asset_ids},
+            [
+                {"ids": asset_ids[start : start + ALBUM_BATCH_SIZE]}
+                for start in range(0, len(asset_ids), ALBUM_BATCH_SIZE)
+            ],
             endpoint_name="AddAssetToAlbum",
         )
+        return [item for response in responses for item in response]
 
+    @_dry_run_returns(
+        lambda album_name, description, **_: {
+            "id": "dry-run-id",
+            "albumName": album_name,
+            "description": description,
+        }
+    )
     def create_album(
         self,
         album_name: str,
@@ -1169,6 +2557,10 @@ class ImmichClient:
         """
         Create an album.
 
+        The album is created with the first ALBUM_BATCH_SIZE assets, and any
+        remaining assets are added with add_assets_to_album, so creating an
+        album from a large search stays within request size limits.
+
         Args:
             album_name: The name of the album.
             description: The description of the album.
@@ -1176,31 +2568,28 @@ class ImmichClient:
 
         Returns
         -------
-            The created album.
+            The created album, as returned when it was created with the first
+            batch of assets.
 
         Raises
         ------
-            ImmichClientError: If the request fails.
+            ImmichClientError: If a request fails.
         """
-        if self.dry_run:
-            return {
-                "id": "dry-run-id",
-                "albumName": album_name,
-                "description": description,
-            }
-
         data = {
             "albumName": album_name,
             "description": description,
         }
         if asset_ids:
-            data["assetIds"] = asset_ids
+            data["assetIds"] = asset_ids[:ALBUM_BATCH_SIZE]
 
-        return self.post(
+        album = self.post(
             "/albums",
             json_data=data,
             endpoint_name="CreateAlbum",
         )
+        if asset_ids and len(asset_ids) > ALBUM_BATCH_SIZE:
+            self.add_assets_to_album(album["id"], asset_ids[ALBUM_BATCH_SIZE:])
+        return album
 
     def get_asset_albums(self, asset_id: str) -> list[dict[str, Any]]:
         """
@@ -1223,6 +2612,7 @@ class ImmichClient:
             endpoint_name="GetAssetAlbums",
         )
 
+    @_dry_run_returns(lambda **_: {})
     def delete_album(self, album_id: str) -> dict[str, Any]:
         """
         Delete an album.
@@ -1238,9 +2628,6 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return {}
-
         return self.delete(
             f"/albums/{album_id}",
             endpoint_name="DeleteAlbum",
@@ -1260,8 +2647,14 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        return self.get("/tags", endpoint_name="GetAllTags")
+        return self._cached_get("/tags", endpoint_name="GetAllTags")
 
+    @_dry_run_returns(
+        lambda tags, **_: [
+            {"id": f"dry-run-id-{i}", "name": tag, "value": tag}
+            for i, tag in enumerate(tags)
+        ]
+    )
     def upsert_tags(self, tags: list[str]) -> list[dict[str, Any]]:
         """
         Create or update tags.
@@ -1277,11 +2670,8 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return [
-                {"id": f"dry-run-id-{i}", "name": tag, "value": tag}
-                for i, tag in enumerate(tags)
-            ]
+        if not tags:
+            return []
 
         return self.put(
             "/tags",
@@ -1289,6 +2679,11 @@ class ImmichClient:
             endpoint_name="UpsertTags",
         )
 
+    @_dry_run_returns(
+        lambda asset_ids, **_: [
+            {"id": asset_id, "success": True} for asset_id in asset_ids
+        ]
+    )
     def tag_assets(self, tag_id: str, asset_ids: list[str]) -> list[dict[str, Any]]:
         """
         Tag assets.
@@ -1305,8 +2700,8 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return [{"id": asset_id, "success": True} for asset_id in asset_ids]
+        if not asset_ids:
+            return []
 
         return self.put(
             f"/tags/{tag_id}/assets",
@@ -1314,12 +2709,18 @@ class ImmichClient:
             endpoint_name="TagAssets",
         )
 
+    @_dry_run_returns(
+        lambda tag_ids, asset_ids, **_: {"count": len(asset_ids) if tag_ids else 0}
+    )
     def bulk_tag_assets(
         self, tag_ids: list[str], asset_ids: list[str]
     ) -> dict[str, Any]:
         """
         Tag multiple assets with multiple tags.
 
+        The assets are sent TAG_BATCH_SIZE at a time, with up to
+        BATCH_CONCURRENCY requests in flight.
+
         Args:
             tag_ids: The IDs of the tags.
             asset_ids: The IDs of the assets to tag.
@@ -1332,14 +2733,28 @@ class ImmichClient:
         ------
             ImmichClientError: If the request fails.
         """
-        if self.dry_run:
-            return {"count": len(asset_ids)}
+        if not tag_ids or not asset_ids:
+            return {"count": 0}
 
-        return self.put(
+        if len(asset_ids) <= TAG_BATCH_SIZE:
+            return self.put(
+                "/tags/assets",
+                json_data={"tagIds": tag_ids, "assetIds": asset_ids},
+                endpoint_name="BulkTagAssets",
+            )
+
+        responses = self._put_batches(
             "/tags/assets",
-            json_data={"tagIds": tag_ids, "assetIds": asset_ids},
+            [
+                {
+                    "tagIds": tag_ids,
+                    "assetIds": asset_ids[start : start + TAG_BATCH_SIZE],
+                }
+                for start in range(0, len(asset_ids), TAG_BATCH_SIZE)
+            ],
             endpoint_name="BulkTagAssets",
         )
+        return {"count": sum(response.get("count", 0) for response in responses)}
 
     # Stack API methods
 
@@ -1456,13 +2871,15 @@ class ImmichClient:
 
     def _load_supported_media_types(self) -> None:
         # Lazily populate supported media types if empty
-        if not self._supported_media_types:
-            self._supported_media_types = self.get_supported_media_types()
+        self.get_supported_media_types()
 
     def _get_mime_type(self, file_path: str | Path) -> str:
         """
         Get the MIME type of a file.
 
+        A path that is already a Path is not rebuilt, which costs more than
+        the cached MIME lookup itself.
+
         Args:
             file_path: The path to the file.
 
@@ -1470,12 +2887,9 @@ class ImmichClient:
         -------
             The MIME type.
         """
-        file_path = str(file_path)
-        mime_type, _ = mimetypes.guess_type(file_path)
-        if mime_type is None:
-            # Default to binary
-            mime_type = "application/octet-stream"
-        return mime_type
+        if not isinstance(file_path, PurePath):
+            file_path = Path(file_path)
+        return _mime_type_for_extension(file_path.suffix.lower())
 
     def is_extension_supported(self, extension: str) -> bool:
         """
@@ -6,6 +6,7 @@ Tag API for the Immich API.
 This module contains the TagAPI class for interacting with tags in the Immich API.
 """
 
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from immich_py.models.tag import Tag
@@ -36,7 +37,7 @@ class TagAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.get_all_tags()
-        return [Tag.from_dict(tag) for tag in data]
+        return Tag.from_dicts(data)
 
     def upsert_tags(self, tags: list[str]) -> list[Tag]:
         """
@@ -54,7 +55,7 @@ class TagAPI:
             ImmichClientError: If the request fails.
         """
         data = self.client.upsert_tags(tags)
-        return [Tag.from_dict(tag) for tag in data]
+        return Tag.from_dicts(data)
 
     def tag_assets(self, tag_id: str, asset_ids: list[str]) -> list[dict[str, Any]]:
         """
@@ -93,3 +94,36 @@ class TagAPI:
             ImmichClientError: If the request fails.
         """
         return self.client.bulk_tag_assets(tag_ids, asset_ids)
+
+    def tag_assets_many(
+        self, assignments: Mapping[str, Iterable[str]]
+    ) -> list[dict[str, Any]]:
+        """
+        Tag several sets of assets, one request per distinct set of assets.
+
+        Tags assigned the same assets are grouped and sent in a single bulk
+        request, instead of one request per tag.
+
+        Args:
+            assignments: A mapping of tag IDs to the IDs of the assets to tag.
+
+        Returns
+        -------
+            The response from the server for each group of tags.
+
+        Raises
+        ------
+            ImmichClientError: If a request fails.
+        """
+        groups: dict[frozenset[str], tuple[list[str], list[str]]] = {}
+        for tag_id, asset_ids in assignments.items():
+            unique_ids = list(dict.fromkeys(asset_ids))
+            if not unique_ids:
+                continue
+            tag_ids, _ = groups.setdefault(frozenset(unique_ids), ([], unique_ids))
+            tag_ids.append(tag_id)
+
+        return [
+            self.bulk_tag_assets(tag_ids, asset_ids)
+            for tag_ids, asset_ids in groups.values()
+        ]
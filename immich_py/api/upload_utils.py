@@ -7,12 +7,22 @@ This module contains utility functions for uploading assets to Immich,
 including handling directories and compressed archives.
 """
 
+import asyncio
 import concurrent.futures
+import contextlib
+import inspect
 import logging
+import os
+import shutil
+import stat
+import subprocess  # noqa: S404
 import tarfile
 import tempfile
+import threading
+import time
 import zipfile
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Collection, Iterator
+from contextlib import AbstractAsyncContextManager
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +30,37 @@ from immich_py.progress import add_album, remove_album
 
 logger = logging.getLogger(__name__)
 
+# Default cap on concurrent uploads from a directory or archive. Without a
+# cap, large directories open more connections than the server accepts and
+# uploads fail with refused connections or rate limiting.
+DEFAULT_MAX_WORKERS = 16
+
+# Minimum number of seconds between extraction progress updates. Writing
+# the terminal for every member slows down archives of many small files.
+EXTRACT_PROGRESS_INTERVAL = 1 / 30
+
+# Seconds the directory walk waits for room in the upload queue before
+# checking whether the uploads were stopped, e.g. cancelled
+WALK_POLL_INTERVAL = 0.5
+
+# Buffer size for reading archives and copying tar members to disk.
+# tarfile's defaults of 10 KiB and 16 KiB, and the default file buffer zip
+# archives are read through, turn a multi-gigabyte archive into hundreds of
+# thousands of small reads and writes.
+EXTRACT_BUFFER_SIZE = 2 * 1024 * 1024
+
+# Multi-threaded decompression commands used for compressed tar archives
+# when installed. tarfile decompresses on a single core, which limits how
+# fast large archives are extracted.
+PARALLEL_DECOMPRESSORS = {
+    ".gz": ("pigz", "-dc"),
+    ".tgz": ("pigz", "-dc"),
+    ".bz2": ("pbzip2", "-dc"),
+    ".tbz2": ("pbzip2", "-dc"),
+    ".xz": ("xz", "-dc", "-T0"),
+    ".txz": ("xz", "-dc", "-T0"),
+}
+
 
 def is_supported_archive(file_path: str | Path) -> bool:
     """
@@ -32,18 +73,7 @@ def is_supported_archive(file_path: str | Path) -> bool:
     -------
         True if the file is a supported archive format, False otherwise.
     """
-    file_path = Path(file_path)
-    lower_suffix = file_path.suffix.lower()
-    return lower_suffix in [
-        ".zip",
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".xz",
-        ".tgz",
-        ".tbz2",
-        ".txz",
-    ]
+    return Path(file_path).suffix.lower() in _ARCHIVE_HANDLERS
 
 
 def extract_archive(archive_path: str | Path, extract_dir: str | Path) -> None:
@@ -54,6 +84,36 @@ def extract_archive(archive_path: str | Path, extract_dir: str | Path) -> None:
         archive_path: The path to the archive.
         extract_dir: The directory to extract to.
 
+    Raises
+    ------
+        ValueError: If the archive format is not supported.
+    """
+    for _ in _extract_files(archive_path, extract_dir):
+        pass
+
+
+def _extract_files(
+    archive_path: str | Path,
+    extract_dir: str | Path,
+    *,
+    show_progress: bool = True,
+    keep_file: Callable[[str], bool] | None = None,
+) -> Iterator[Path]:
+    """
+    Extract an archive to a directory one member at a time.
+
+    Args:
+        archive_path: The path to the archive.
+        extract_dir: The directory to extract to.
+        show_progress: Whether to echo the number of members extracted.
+        keep_file: A callable given the name of each file member, which
+            returns False for files to leave out, or None to extract every
+            file.
+
+    Yields
+    ------
+        The path of each regular file as soon as it has been extracted.
+
     Raises
     ------
         ValueError: If the archive format is not supported.
@@ -63,72 +123,559 @@ def extract_archive(archive_path: str | Path, extract_dir: str | Path) -> None:
     archive_path = Path(archive_path)
     extract_dir = Path(extract_dir)
 
-    lower_suffix = archive_path.suffix.lower()
+    handler = _ARCHIVE_HANDLERS.get(archive_path.suffix.lower())
+    if handler is None:
+        msg = f"Unsupported archive format: {archive_path}"
+        raise ValueError(msg)
 
     # Echo that an archive is detected
     click.echo(f"Archive detected: {archive_path.name}")
     click.echo(f"Extracting to: {extract_dir}")
 
-    if lower_suffix == ".zip":
-        with zipfile.ZipFile(archive_path, "r") as zip_ref:
-            # Get total number of files
-            file_list = zip_ref.namelist()
-            total_files = len(file_list)
-
-            # Extract files with progress
-            for i, file in enumerate(file_list, 1):
-                zip_ref.extract(file, extract_dir)
-                percent = (i / total_files) * 100
-                click.echo(
-                    f"\r{archive_path.name}: {i} / {total_files} ({percent:.1f}%)",
-                    nl=False,
-                )
-            click.echo("\n")  # Print a newline after the progress is complete
-    elif lower_suffix in [
-        ".tar",
-        ".gz",
-        ".bz2",
-        ".xz",
-        ".tgz",
-        ".tbz2",
-        ".txz",
-    ] or archive_path.name.endswith((".tar.gz", ".tar.bz2", ".tar.xz")):
-        with tarfile.open(archive_path) as tar_ref:
-            # Get total number of files
-            members = tar_ref.getmembers()
-            total_files = len(members)
-            extracted_count = 0
-
-            # Filter out potentially dangerous paths and extract with progress
-            for member in members:
-                member_path = Path(member.name)
-                if member_path.is_absolute() or ".." in member_path.parts:
-                    continue  # Skip potentially dangerous paths
-
-                tar_ref.extract(member, extract_dir)
-                extracted_count += 1
-                percent = (extracted_count / total_files) * 100
-                click.echo(
-                    f"\r{archive_path.name}: {extracted_count} / {total_files} ({percent:.1f}%)",
-                    nl=False,
+    yield from handler(archive_path, extract_dir, show_progress, keep_file)
+    if show_progress:
+        click.echo("\n")  # Print a newline after the progress is complete
+
+
+def _extract_zip_files(
+    archive_path: Path,
+    extract_dir: Path,
+    show_progress: bool,
+    keep_file: Callable[[str], bool] | None,
+) -> Iterator[Path]:
+    """
+    Extract a zip archive one member at a time.
+
+    Args:
+        archive_path: The path to the archive.
+        extract_dir: The directory to extract to.
+        show_progress: Whether to echo the number of members extracted.
+        keep_file: A callable returning False for file members to leave out,
+            or None to extract every file.
+
+    Yields
+    ------
+        The path of each regular file as soon as it has been extracted.
+    """
+    with (
+        archive_path.open("rb", buffering=EXTRACT_BUFFER_SIZE) as archive_file,
+        zipfile.ZipFile(archive_file, "r") as zip_ref,
+    ):
+        # Get total number of files
+        members = [
+            member
+            for member in zip_ref.infolist()
+            if keep_file is None or member.is_dir() or keep_file(member.filename)
+        ]
+        total_files = len(members)
+
+        # Extract files with progress
+        next_echo = 0.0
+        for i, member in enumerate(members, 1):
+            extracted_path = Path(zip_ref.extract(member, extract_dir))
+            if show_progress and (i == total_files or time.monotonic() >= next_echo):
+                next_echo = time.monotonic() + EXTRACT_PROGRESS_INTERVAL
+                _echo_progress(archive_path.name, i, total_files)
+            if not member.is_dir():
+                yield extracted_path
+
+
+def _extract_tar_files(
+    archive_path: Path,
+    extract_dir: Path,
+    show_progress: bool,
+    keep_file: Callable[[str], bool] | None,
+) -> Iterator[Path]:
+    """
+    Extract a tar archive, compressed or not, one member at a time.
+
+    Members are read in a single streaming pass, so extraction starts
+    without first scanning, and for compressed archives decompressing, the
+    whole archive to build the member list. Members are extracted with the
+    "data" extraction filter, and those it rejects, such as links pointing
+    outside the extraction directory, are skipped.
+
+    Args:
+        archive_path: The path to the archive.
+        extract_dir: The directory to extract to.
+        show_progress: Whether to echo the number of members extracted.
+        keep_file: A callable returning False for file members to leave out,
+            or None to extract every file.
+
+    Yields
+    ------
+        The path of each regular file as soon as it has been extracted.
+    """
+    with _open_tar_stream(archive_path) as tar_ref:
+        extracted_count = 0
+
+        # Filter out potentially dangerous paths and extract with progress
+        next_echo = 0.0
+        for member in tar_ref:
+            if not _is_safe_member_name(member.name):
+                continue  # Skip potentially dangerous paths
+            if keep_file is not None and member.isfile() and not keep_file(member.name):
+                continue
+
+            try:
+                tar_ref.extract(member, extract_dir, filter="data")
+            except tarfile.FilterError as e:
+                logger.warning("Skipping unsafe archive member %s: %s", member.name, e)
+                continue
+            extracted_count += 1
+            if show_progress and time.monotonic() >= next_echo:
+                next_echo = time.monotonic() + EXTRACT_PROGRESS_INTERVAL
+                _echo_progress(archive_path.name, extracted_count)
+            if member.isfile():
+                yield extract_dir / member.name
+        if show_progress:
+            _echo_progress(archive_path.name, extracted_count)
+
+
+@contextlib.contextmanager
+def _open_tar_stream(archive_path: Path) -> Iterator[tarfile.TarFile]:
+    """
+    Open a tar archive for a single streaming pass.
+
+    Compressed archives are decompressed by the matching command in
+    PARALLEL_DECOMPRESSORS when it is installed, and by tarfile otherwise.
+
+    Args:
+        archive_path: The path to the archive.
+
+    Yields
+    ------
+        The open archive.
+
+    Raises
+    ------
+        tarfile.ReadError: If the archive cannot be read or decompressed.
+    """
+    command = PARALLEL_DECOMPRESSORS.get(archive_path.suffix.lower())
+    executable = shutil.which(command[0]) if command else None
+    if command is None or executable is None:
+        with tarfile.open(
+            archive_path,
+            mode="r|*",
+            bufsize=EXTRACT_BUFFER_SIZE,
+            copybufsize=EXTRACT_BUFFER_SIZE,
+        ) as tar_ref:
+            yield tar_ref
+        return
+
+    with (
+        subprocess.Popen(  # noqa: S603
+            [executable, *command[1:], str(archive_path)],
+            stdout=subprocess.PIPE,
+            bufsize=EXTRACT_BUFFER_SIZE,
+        ) as process
+    ):
+        with tarfile.open(
+            fileobj=process.stdout,
+            mode="r|",
+            bufsize=EXTRACT_BUFFER_SIZE,
+            copybufsize=EXTRACT_BUFFER_SIZE,
+        ) as tar_ref:
+            yield tar_ref
+        # Read past the end-of-archive padding so the command can finish
+        while process.stdout.read(EXTRACT_BUFFER_SIZE):
+            pass
+        if process.wait() != 0:
+            msg = f"Could not decompress {archive_path} with {command[0]}"
+            raise tarfile.ReadError(msg)
+
+
+# Extraction function for each supported archive suffix. Compressed tar
+# archives such as .tar.gz end in the compression suffix.
+_ARCHIVE_HANDLERS: dict[
+    str, Callable[[Path, Path, bool, Callable[[str], bool] | None], Iterator[Path]]
+] = {
+    ".zip": _extract_zip_files,
+    ".tar": _extract_tar_files,
+    ".gz": _extract_tar_files,
+    ".bz2": _extract_tar_files,
+    ".xz": _extract_tar_files,
+    ".tgz": _extract_tar_files,
+    ".tbz2": _extract_tar_files,
+    ".txz": _extract_tar_files,
+}
+
+
+def _member_filter(
+    allowed_suffixes: Collection[str] | None,
+) -> Callable[[str], bool]:
+    """
+    Build the filter for the archive members worth uploading.
+
+    Args:
+        allowed_suffixes: The lowercase file suffixes to keep, or None to keep
+            files of any suffix.
+
+    Returns
+    -------
+        A callable returning True for member names that are not hidden and
+        have an allowed suffix.
+    """
+
+    def keep_file(name: str) -> bool:
+        base_name = name.rpartition("/")[2]
+        return not base_name.startswith(".") and _has_allowed_suffix(
+            base_name, allowed_suffixes
+        )
+
+    return keep_file
+
+
+def _is_safe_member_name(name: str) -> bool:
+    """
+    Check that an archive member extracts inside the target directory.
+
+    The raw name is checked directly rather than through a Path, which is
+    much cheaper for archives with many members, and is only split into
+    components when it contains "..". Backslashes are treated as separators
+    too, so Windows-style names cannot escape either.
+
+    Args:
+        name: The member name.
+
+    Returns
+    -------
+        False if the name is absolute or has a ".." component, True otherwise.
+    """
+    if name.startswith(("/", "\\")):
+        return False
+    return ".." not in name or ".." not in name.replace("\\", "/").split("/")
+
+
+def _echo_progress(archive_name: str, count: int, total: int | None = None) -> None:
+    """
+    Echo the extraction progress of an archive over the current line.
+
+    Args:
+        archive_name: The name of the archive.
+        count: The number of members extracted so far.
+        total: The total number of members, or None if it is not known.
+    """
+    import click
+
+    if total is None:
+        click.echo(f"\r{archive_name}: {count} extracted", nl=False)
+        return
+    percent = (count / total) * 100
+    click.echo(f"\r{archive_name}: {count} / {total} ({percent:.1f}%)", nl=False)
+
+
+def _iter_files(
+    directory_path: Path, allowed_suffixes: Collection[str] | None = None
+) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Recursively yield the non-hidden files in a directory.
+
+    The directory is walked with os.scandir so each file's stat result comes
+    from its directory entry and can be passed on without statting it again.
+    Files are yielded as they are found, so uploads can start before the
+    walk of a large tree finishes. Subdirectories and files that cannot be
+    read are logged and skipped.
+
+    Args:
+        directory_path: The path to the directory.
+        allowed_suffixes: The lowercase file suffixes, such as ".jpg", to
+            yield, or None to yield files of any suffix.
+
+    Yields
+    ------
+        A (path, stat result) pair for each file found.
+    """
+    # Subdirectories are queued as the plain strings scandir returns; only
+    # files are turned into Path objects for the upload function
+    pending: list[str | Path] = [directory_path]
+    while pending:
+        current = pending.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError as e:
+            logger.warning("Skipping unreadable directory %s: %s", current, e)
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif (
+                    entry.is_file()
+                    and not entry.name.startswith(".")
+                    and _has_allowed_suffix(entry.name, allowed_suffixes)
+                ):
+                    try:
+                        file_stat = entry.stat()
+                    except OSError as e:
+                        logger.warning("Skipping unreadable file %s: %s", entry.path, e)
+                        continue
+                    yield Path(entry.path), file_stat
+
+
+def _has_allowed_suffix(name: str, allowed_suffixes: Collection[str] | None) -> bool:
+    """
+    Check whether a file name ends in one of the allowed suffixes.
+
+    Args:
+        name: The file name.
+        allowed_suffixes: The lowercase suffixes to allow, or None to allow
+            any suffix.
+
+    Returns
+    -------
+        True if the suffix is allowed, False otherwise.
+    """
+    if allowed_suffixes is None:
+        return True
+    stem, dot, extension = name.rpartition(".")
+    return bool(stem and dot) and (dot + extension).lower() in allowed_suffixes
+
+
+def _collect_result(
+    future: concurrent.futures.Future[dict[str, Any] | None],
+    file_path: Path,
+    results: list[dict[str, Any]],
+    *,
+    remove_uploaded: bool = False,
+) -> None:
+    """
+    Add the response of a finished upload to the results.
+
+    Args:
+        future: The finished upload.
+        file_path: The path of the uploaded file.
+        results: The list of responses to add to.
+        remove_uploaded: Whether to delete the file now that it is uploaded.
+    """
+    if remove_uploaded:
+        file_path.unlink(missing_ok=True)
+    try:
+        result = future.result()
+    except Exception:
+        # Log the error but continue with other files
+        logger.exception("Error uploading %s", file_path)
+        return
+    if result is not None:
+        results.append(result)
+
+
+@contextlib.asynccontextmanager
+async def _shared_session(
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None,
+    kwargs: dict[str, Any],
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Open the shared HTTP client, if any, and add it to the upload arguments.
+
+    Args:
+        session: A callable returning an async context manager that yields
+            the HTTP client, or None.
+        kwargs: The arguments to pass to the upload function.
+
+    Yields
+    ------
+        The upload arguments, including http_client when a session is given.
+    """
+    if session is None:
+        yield kwargs
+        return
+    async with session() as http_client:
+        yield {**kwargs, "http_client": http_client}
+
+
+async def process_directory_async(
+    directory_path: str | Path,
+    upload_func: Callable[..., Any],
+    *,
+    max_workers: int | None = DEFAULT_MAX_WORKERS,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    allowed_suffixes: Collection[str] | None = None,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """
+    Upload all supported assets in a directory concurrently.
+
+    The directory is walked in a worker thread that feeds a bounded queue,
+    and max_workers tasks on the current event loop take files from it and
+    upload them, so uploads start as soon as the first file is found. With
+    session, one HTTP client is opened for the whole directory and passed to
+    each upload as the http_client keyword argument, so all uploads share
+    its connection pool.
+
+    Args:
+        directory_path: The path to the directory.
+        upload_func: The coroutine function to call for each asset. It also
+            receives the file's stat result as the file_stat keyword argument.
+        max_workers: Maximum number of concurrent uploads, or None to use
+            DEFAULT_MAX_WORKERS.
+        session: A callable returning an async context manager that yields the
+            HTTP client to share, e.g. ImmichClient.async_client.
+        allowed_suffixes: The lowercase file suffixes to upload, or None to
+            upload files of any suffix.
+        **kwargs: Additional arguments to pass to the upload function.
+
+    Returns
+    -------
+        A list of responses from the upload function.
+    """
+    directory_path = Path(directory_path)
+    return await _upload_files_async(
+        _iter_files(directory_path, allowed_suffixes),
+        directory_path.name,
+        upload_func,
+        max_workers=max_workers,
+        session=session,
+        kwargs=kwargs,
+    )
+
+
+async def _upload_files_async(
+    files: Iterator[tuple[Path, os.stat_result]],
+    album_name: str,
+    upload_func: Callable[..., Any],
+    *,
+    max_workers: int | None,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None,
+    kwargs: dict[str, Any],
+    remove_uploaded: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Upload files concurrently while they are still being found.
+
+    Args:
+        files: The (path, stat result) pairs to upload. The iterator is
+            consumed in a worker thread.
+        album_name: The title shown in the progress display.
+        upload_func: The coroutine function to call for each file.
+        max_workers: Maximum number of concurrent uploads, or None to use
+            DEFAULT_MAX_WORKERS.
+        session: A callable returning an async context manager that yields the
+            HTTP client to share, or None.
+        kwargs: Additional arguments to pass to the upload function.
+        remove_uploaded: Whether to delete each file once it is uploaded.
+
+    Returns
+    -------
+        A list of responses from the upload function.
+    """
+    workers = max_workers or DEFAULT_MAX_WORKERS
+    queue: asyncio.Queue[tuple[Path, os.stat_result] | None] = asyncio.Queue(
+        workers * 2
+    )
+    loop = asyncio.get_running_loop()
+    results: list[dict[str, Any]] = []
+    stopped = threading.Event()
+
+    def put(item: tuple[Path, os.stat_result] | None) -> bool:
+        # Wait for room in the queue, but give up once the uploads have
+        # stopped, as nothing will take from the queue any more
+        future = asyncio.run_coroutine_threadsafe(queue.put(item), loop)
+        while not stopped.is_set():
+            try:
+                future.result(timeout=WALK_POLL_INTERVAL)
+            except TimeoutError:
+                continue
+            return True
+        future.cancel()
+        return False
+
+    def walk() -> None:
+        try:
+            for item in files:
+                if not put(item):
+                    return
+        finally:
+            # Tell every worker to stop once the queued files are done
+            for _ in range(workers):
+                if not put(None):
+                    break
+
+    # Add directory name as album title for progress display
+    add_album(album_name)
+
+    try:
+        async with _shared_session(session, kwargs) as upload_kwargs:
+
+            async def upload_worker() -> None:
+                while (item := await queue.get()) is not None:
+                    file_path, file_stat = item
+                    try:
+                        result = await upload_func(
+                            file_path, **upload_kwargs, file_stat=file_stat
+                        )
+                    except Exception:
+                        logger.exception("Error uploading %s", file_path)
+                        continue
+                    finally:
+                        if remove_uploaded:
+                            file_path.unlink(missing_ok=True)
+                    if result is not None:
+                        results.append(result)
+
+            try:
+                await asyncio.gather(
+                    asyncio.to_thread(walk),
+                    *(upload_worker() for _ in range(workers)),
                 )
-            click.echo("\n")  # Print a newline after the progress is complete
-    else:
-        msg = f"Unsupported archive format: {archive_path}"
-        raise ValueError(msg)
+            finally:
+                stopped.set()
+    finally:
+        # Remove album title from progress display
+        remove_album(album_name)
+
+    return results
+
+
+async def _upload_file_async(
+    upload_func: Callable[..., Any],
+    file_path: Path,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None,
+    kwargs: dict[str, Any],
+) -> dict[str, Any]:
+    """
+    Upload a single file with a coroutine upload function.
+
+    Args:
+        upload_func: The coroutine function to call for the file.
+        file_path: The path to the file.
+        session: A callable returning an async context manager that yields the
+            HTTP client to use, or None.
+        kwargs: Additional arguments to pass to the upload function.
+
+    Returns
+    -------
+        The response from the upload function.
+    """
+    async with _shared_session(session, kwargs) as upload_kwargs:
+        return await upload_func(file_path, **upload_kwargs)
 
 
 def process_directory(
     directory_path: str | Path,
     upload_func: Callable[[str | Path, dict[str, Any]], dict[str, Any]],
+    *,
+    max_workers: int | None = DEFAULT_MAX_WORKERS,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    allowed_suffixes: Collection[str] | None = None,
     **kwargs: Any,
 ) -> list[dict[str, Any]]:
     """
     Process a directory and upload all supported assets.
 
+    A coroutine upload function is run as in process_directory_async, on a
+    new event loop; any other upload function is called from a thread pool.
+
     Args:
         directory_path: The path to the directory.
-        upload_func: The function to call for each asset.
+        upload_func: The function to call for each asset. It also receives the
+            file's stat result as the file_stat keyword argument.
+        max_workers: Maximum number of concurrent uploads, or None to use the
+            ThreadPoolExecutor default.
+        session: A callable returning an async context manager that yields the
+            HTTP client shared by a coroutine upload function.
+        allowed_suffixes: The lowercase file suffixes to upload, or None to
+            upload files of any suffix.
         **kwargs: Additional arguments to pass to the upload function.
 
     Returns
@@ -136,38 +683,97 @@ def process_directory(
         A list of responses from the upload function.
     """
     directory_path = Path(directory_path)
-    results = []
+    return _upload_files(
+        _iter_files(directory_path, allowed_suffixes),
+        directory_path.name,
+        upload_func,
+        max_workers=max_workers,
+        session=session,
+        kwargs=kwargs,
+    )
+
+
+def _upload_files(
+    files: Iterator[tuple[Path, os.stat_result]],
+    album_name: str,
+    upload_func: Callable[..., Any],
+    *,
+    max_workers: int | None,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None,
+    kwargs: dict[str, Any],
+    remove_uploaded: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Upload files concurrently while they are still being found.
+
+    A coroutine upload function is run with _upload_files_async on a new
+    event loop; any other upload function is called from a thread pool.
 
-    # Get all files in the directory
-    files = [
-        item
-        for item in directory_path.rglob("*")
-        if item.is_file() and not item.name.startswith(".")
-    ]
+    Args:
+        files: The (path, stat result) pairs to upload.
+        album_name: The title shown in the progress display.
+        upload_func: The function to call for each file.
+        max_workers: Maximum number of concurrent uploads, or None to use the
+            ThreadPoolExecutor default.
+        session: A callable returning an async context manager that yields the
+            HTTP client shared by a coroutine upload function.
+        kwargs: Additional arguments to pass to the upload function.
+        remove_uploaded: Whether to delete each file once it is uploaded.
+
+    Returns
+    -------
+        A list of responses from the upload function.
+    """
+    if inspect.iscoroutinefunction(upload_func):
+        return asyncio.run(
+            _upload_files_async(
+                files,
+                album_name,
+                upload_func,
+                max_workers=max_workers,
+                session=session,
+                kwargs=kwargs,
+                remove_uploaded=remove_uploaded,
+            )
+        )
+
+    results: list[dict[str, Any]] = []
+    # Files are submitted as they are found, with at most this many waiting
+    # or in progress at a time
+    max_pending = 2 * (max_workers or DEFAULT_MAX_WORKERS)
 
     # Add directory name as album title for progress display
-    album_name = directory_path.name
     add_album(album_name)
 
     try:
         # Use ThreadPoolExecutor for parallel uploads
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            # Submit all upload tasks
-            future_to_file = {
-                executor.submit(upload_file, upload_func, file_path, kwargs): file_path
-                for file_path in files
-            }
-
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_file):
-                file_path = future_to_file[future]
-                try:
-                    result = future.result()
-                    if result is not None:
-                        results.append(result)
-                except Exception:
-                    logger.exception("Error uploading %s", file_path)
-                    # Log the error but continue with other files
+        with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+            pending: dict[concurrent.futures.Future[Any], Path] = {}
+            for file_path, file_stat in files:
+                if len(pending) >= max_pending:
+                    done, _ = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        _collect_result(
+                            future,
+                            pending.pop(future),
+                            results,
+                            remove_uploaded=remove_uploaded,
+                        )
+                future = executor.submit(
+                    upload_file,
+                    upload_func,
+                    file_path,
+                    {**kwargs, "file_stat": file_stat},
+                )
+                pending[future] = file_path
+
+            # Process the remaining results as they complete
+            for future in concurrent.futures.as_completed(pending):
+                _collect_result(
+                    future, pending[future], results, remove_uploaded=remove_uploaded
+                )
     finally:
         # Remove album title from progress display
         remove_album(album_name)
@@ -202,14 +808,27 @@ def upload_file(
 def process_archive(
     archive_path: str | Path,
     upload_func: Callable[[str | Path, dict[str, Any]], dict[str, Any]],
+    *,
+    max_workers: int | None = DEFAULT_MAX_WORKERS,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    allowed_suffixes: Collection[str] | None = None,
     **kwargs: Any,
 ) -> list[dict[str, Any]]:
     """
     Process an archive and upload all supported assets.
 
+    Files are uploaded while the rest of the archive is still being
+    extracted, and each one is deleted once it is uploaded.
+
     Args:
         archive_path: The path to the archive.
         upload_func: The function to call for each asset.
+        max_workers: Maximum number of concurrent uploads, or None to use the
+            ThreadPoolExecutor default.
+        session: A callable returning an async context manager that yields the
+            HTTP client shared by a coroutine upload function.
+        allowed_suffixes: The lowercase file suffixes to upload, or None to
+            upload files of any suffix.
         **kwargs: Additional arguments to pass to the upload function.
 
     Returns
@@ -228,21 +847,40 @@ def process_archive(
         msg = f"Unsupported archive format: {archive_path}"
         raise ValueError(msg)
 
-    # Create a temporary directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # Extract the archive
-        extract_archive(archive_path, temp_dir)
-
+    # Hidden files and files with other suffixes are not uploaded, so they
+    # are not extracted either
+    def extracted_files() -> Iterator[tuple[Path, os.stat_result]]:
+        for path in _extract_files(
+            archive_path,
+            temp_dir,
+            show_progress=False,
+            keep_file=_member_filter(allowed_suffixes),
+        ):
+            yield path, path.stat()
         # Echo completion of extraction
-        click.echo(f"Extraction of {archive_path.name} complete. Processing files...")
+        click.echo(f"Extraction of {archive_path.name} complete.")
 
-        # Process the extracted files
-        return process_directory(temp_dir, upload_func, **kwargs)
+    # Each file is uploaded as soon as it is extracted and deleted once it
+    # is uploaded, so only the files in flight take up disk space
+    with tempfile.TemporaryDirectory() as temp_dir:
+        return _upload_files(
+            extracted_files(),
+            archive_path.name,
+            upload_func,
+            max_workers=max_workers,
+            session=session,
+            kwargs=kwargs,
+            remove_uploaded=True,
+        )
 
 
 def process_upload_path(
     file_path: str | Path,
     upload_func: Callable[[str | Path, dict[str, Any]], dict[str, Any]],
+    *,
+    max_workers: int | None = DEFAULT_MAX_WORKERS,
+    session: Callable[[], AbstractAsyncContextManager[Any]] | None = None,
+    allowed_suffixes: Collection[str] | None = None,
     **kwargs: Any,
 ) -> list[dict[str, Any]] | dict[str, Any]:
     """
@@ -255,6 +893,13 @@ def process_upload_path(
     Args:
         file_path: The path to the file or directory.
         upload_func: The function to call for each asset.
+        max_workers: Maximum number of concurrent uploads for a directory or
+            archive, or None to use the ThreadPoolExecutor default.
+        session: A callable returning an async context manager that yields the
+            HTTP client shared by a coroutine upload function.
+        allowed_suffixes: The lowercase file suffixes to upload from a
+            directory or archive, or None to upload files of any suffix. A
+            single file is uploaded whatever its suffix.
         **kwargs: Additional arguments to pass to the upload function.
 
     Returns
@@ -269,13 +914,33 @@ def process_upload_path(
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    # One stat answers both whether the path exists and whether it is a
+    # directory
+    try:
+        file_mode = file_path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError) as e:
         msg = f"File or directory not found: {file_path}"
-        raise FileNotFoundError(msg)
-
-    if file_path.is_dir():
-        return process_directory(file_path, upload_func, **kwargs)
+        raise FileNotFoundError(msg) from e
+
+    if stat.S_ISDIR(file_mode):
+        return process_directory(
+            file_path,
+            upload_func,
+            max_workers=max_workers,
+            session=session,
+            allowed_suffixes=allowed_suffixes,
+            **kwargs,
+        )
     if is_supported_archive(file_path):
-        return process_archive(file_path, upload_func, **kwargs)
+        return process_archive(
+            file_path,
+            upload_func,
+            max_workers=max_workers,
+            session=session,
+            allowed_suffixes=allowed_suffixes,
+            **kwargs,
+        )
     # Single file upload
+    if inspect.iscoroutinefunction(upload_func):
+        return asyncio.run(_upload_file_async(upload_func, file_path, session, kwargs))
     return upload_func(file_path, **kwargs)
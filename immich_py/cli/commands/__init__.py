@@ -4,13 +4,18 @@
 CLI command modules for the Immich API.
 
 This package contains CLI command modules for interacting with the Immich API.
+The commands are imported from their modules when first accessed.
 """
 
-from .album import album
-from .asset import asset
-from .job import job
-from .server import server
-from .tag import tag
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .album import album
+    from .asset import asset
+    from .job import job
+    from .server import server
+    from .tag import tag
 
 __all__ = [
     "album",
@@ -19,3 +24,24 @@ __all__ = [
     "server",
     "tag",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import a command from its module on first access.
+
+    Args:
+        name: The command name.
+
+    Returns
+    -------
+        The click command.
+
+    Raises
+    ------
+        AttributeError: If the name is not a command.
+    """
+    if name in __all__:
+        return getattr(importlib.import_module(f".{name}", __name__), name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
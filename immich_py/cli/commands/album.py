@@ -180,10 +180,7 @@ def organize(
         )
 
         # check if album exists
-        albums = album_api.get_all_albums()
-        existing_album = next(
-            (album for album in albums if album.album_name == album_name), None
-        )
+        existing_album = album_api.get_album_by_name(album_name)
 
         # Get asset ids
         asset_ids = [asset.id for asset in assets]
@@ -7,7 +7,6 @@ This module contains CLI commands for interacting with assets in the Immich API.
 """
 
 import json
-from pathlib import Path
 from typing import Any
 
 import click
@@ -122,12 +121,17 @@ def list_assets(
     checksum: str | None,
     original_file_name: str | None,
 ) -> None:
-    """List assets."""
+    """
+    List assets.
+
+    Assets are printed as each page of results arrives, and the number of
+    assets found is printed after them.
+    """
     client = ctx.obj["client"]
     asset_api = AssetAPI(client)
 
     try:
-        assets = asset_api.search_assets(
+        assets = asset_api.iter_assets(
             with_exif=with_exif,
             with_deleted=with_deleted,
             with_archived=with_archived,
@@ -138,11 +142,14 @@ def list_assets(
             checksum=checksum,
             original_file_name=original_file_name,
         )
-        click.echo(f"Found {len(assets)} assets.")
+        # Print assets as pages arrive rather than collecting them first
+        count = 0
         for asset in assets:
             click.echo(
                 f"{asset.id} - {asset.original_file_name} - {asset.file_created_at}"
             )
+            count += 1
+        click.echo(f"Found {count} assets.")
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
 
@@ -180,12 +187,8 @@ def download(ctx: click.Context, asset_id: str, output: str | None) -> None:
         asset = asset_api.get_asset_info(asset_id)
         output_path = output or asset.original_file_name
 
-        # Download the asset
-        data = asset_api.download_asset(asset_id)
-
-        # Write the data to the output file
-        with Path.open(output_path, "wb") as f:
-            f.write(data)
+        # Stream the asset to the output file
+        asset_api.download_asset_to(asset_id, output_path)
 
         click.echo(f"Asset downloaded to {output_path}.")
     except Exception as e:
@@ -210,9 +213,9 @@ class UploadHelper:
 
         # Initialize album cache if album names are specified
         if album_names:
-            album_api = AlbumAPI(client)
-            albums = album_api.get_all_albums()
-            self.album_cache = {a.album_name: a.id for a in albums}
+            self.album_cache = {
+                name: album["id"] for name, album in client.get_albums_by_name().items()
+            }
 
     def upload_single(
         self,
@@ -268,6 +271,8 @@ class UploadHelper:
         is_archived: bool = False,
         sidecar_path: str | None = None,
         ignore_db: bool = False,
+        max_workers: int = 5,
+        media_only: bool = False,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """
         Upload multiple assets from a directory or archive.
@@ -280,6 +285,9 @@ class UploadHelper:
             is_archived: Whether the assets are archived.
             sidecar_path: Path to a sidecar file to upload (only for single file).
             ignore_db: Whether to ignore the hash database check.
+            max_workers: Maximum number of concurrent uploads.
+            media_only: Whether to skip files the server does not support as
+                an image or video.
 
         Returns
         -------
@@ -293,6 +301,8 @@ class UploadHelper:
             is_archived=is_archived,
             sidecar_path=sidecar_path,
             ignore_db=ignore_db,
+            max_workers=max_workers,
+            media_only=media_only,
         )
 
         # Handle the case where a single file was uploaded
@@ -422,6 +432,17 @@ def _display_upload_results(results: list[dict[str, Any]] | dict[str, Any]) -> N
     default=False,
     help="Process directories and archives recursively.",
 )
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of concurrent uploads with --recursive. Defaults to the global --max-workers.",
+)
+@click.option(
+    "--media-only/--all-files",
+    default=False,
+    help="With --recursive, upload only image and video files supported by the server.",
+)
 @click.option(
     "--ignore-db/--no-ignore-db",
     default=False,
@@ -444,6 +465,8 @@ def upload(
     archived: bool,
     sidecar_path: str | None,
     recursive: bool,
+    max_workers: int | None,
+    media_only: bool,
     ignore_db: bool,
     album: tuple[str, ...],
 ) -> None:
@@ -478,6 +501,8 @@ def upload(
                 is_archived=archived,
                 sidecar_path=sidecar_path,
                 ignore_db=ignore_db,
+                max_workers=max_workers or ctx.obj.get("max_workers", 5),
+                media_only=media_only,
             )
         else:
             results = upload_helper.upload_single(
@@ -10,14 +10,20 @@ import sys
 
 import click
 
-from immich_py.api.client import ImmichClient, ImmichClientError
-
-from . import commands
+from immich_py.api.cache import default_etag_cache_path
+from immich_py.api.client import HTTP2_AVAILABLE, ImmichClient, ImmichClientError
+from immich_py.cli.utils import LazyGroup
 
 # ruff: noqa: BLE001
 
 
-@click.group()
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={
+        name: f"immich_py.cli.commands.{name}:{name}"
+        for name in ("album", "asset", "job", "server", "tag")
+    },
+)
 @click.option(
     "--endpoint",
     "-e",
@@ -41,6 +47,11 @@ from . import commands
     default=60.0,
     help="Timeout for API requests in seconds.",
 )
+@click.option(
+    "--http2/--no-http2",
+    default=None,
+    help="Use HTTP/2 for API requests. Defaults to on when the h2 package is installed.",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -70,12 +81,17 @@ def main(
     api_key: str,
     no_verify_ssl: bool,
     timeout: float,
+    http2: bool | None,
     dry_run: bool,
     verbose: bool,
     progress: bool,
     max_workers: int,
 ) -> None:
     """Command-line interface for interacting with the Immich API."""
+    if http2 and not HTTP2_AVAILABLE:
+        msg = "--http2 requires the 'h2' package. Install it with: pip install 'immich-py[http2]'"
+        raise click.UsageError(msg)
+
     # Create the Immich client
     client = (
         ImmichClient(
@@ -83,12 +99,18 @@ def main(
             api_key=api_key,
             verify_ssl=not no_verify_ssl,
             timeout=timeout,
+            http2=http2,
             dry_run=dry_run,
+            etag_cache_path=default_etag_cache_path(),
         )
         if endpoint and api_key
         else None
     )
 
+    # Close the client's connection pool when the command finishes
+    if client is not None:
+        ctx.call_on_close(client.close)
+
     # Configure progress bar settings
     if progress:
         from immich_py.progress import set_max_workers
@@ -104,14 +126,6 @@ def main(
     }
 
 
-# Add commands
-main.add_command(commands.server)
-main.add_command(commands.asset)
-main.add_command(commands.album)
-main.add_command(commands.tag)
-main.add_command(commands.job)
-
-
 if __name__ == "__main__":
     try:
         main()
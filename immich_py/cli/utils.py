@@ -6,12 +6,49 @@ Utility functions for the CLI.
 This module contains utility functions for the CLI.
 """
 
+import importlib
 import sys
 from functools import wraps
+from typing import Any
 
 import click
 
 
+class LazyGroup(click.Group):
+    """
+    Click group whose subcommands are imported when they are first used.
+
+    Running one command then imports only that command's module and the
+    API modules it depends on, rather than those of every command.
+    """
+
+    def __init__(
+        self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any
+    ):
+        """
+        Initialize the group.
+
+        Args:
+            *args: Positional arguments for click.Group.
+            lazy_subcommands: A mapping of command names to the
+                "module:attribute" paths of their commands.
+            **kwargs: Keyword arguments for click.Group.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List the names of the eager and lazy subcommands."""
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        """Get a subcommand, importing it if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+            return getattr(importlib.import_module(module_name), attribute)
+        return super().get_command(ctx, cmd_name)
+
+
 def validate_client(f):
     """Validate that a client is available in the context."""
 
@@ -6,11 +6,12 @@ Album models for the Immich API.
 This module contains data models for albums in the Immich API.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Album:
     """Album model for the Immich API."""
 
@@ -38,6 +39,20 @@ class Album:
             asset_ids=data.get("assetIds", []),
         )
 
+    @classmethod
+    def from_dicts(cls, data: Iterable[dict[str, Any]]) -> list["Album"]:
+        """
+        Create Album instances from a sequence of dictionaries.
+
+        Args:
+            data: The dictionaries containing album information.
+
+        Returns
+        -------
+            A list of Album instances.
+        """
+        return list(map(cls.from_dict, data))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the Album instance to a dictionary.
@@ -54,7 +69,7 @@ class Album:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AlbumInfo:
     """Album information model for the Immich API."""
 
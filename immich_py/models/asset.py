@@ -6,7 +6,7 @@ Asset models for the Immich API.
 This module contains data models for assets in the Immich API.
 """
 
-import contextlib
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -21,7 +21,31 @@ class AssetType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+# Asset types by value, so Asset.from_dict avoids the Enum constructor
+_ASSET_TYPES = {e.value: e for e in AssetType}
+
+
+def _parse_datetime(value: Any) -> datetime | None:
+    """
+    Parse an ISO 8601 timestamp returned by the Immich API.
+
+    Args:
+        value: The raw timestamp value.
+
+    Returns
+    -------
+        The parsed datetime, or None if the value is empty or invalid.
+    """
+    if not value:
+        return None
+    try:
+        # fromisoformat accepts the "Z" suffix natively since Python 3.11
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+@dataclass(slots=True)
 class ExifInfo:
     """EXIF information for an asset."""
 
@@ -49,25 +73,19 @@ class ExifInfo:
         -------
             An ExifInfo instance.
         """
-        date_time_original = None
-        if data.get("dateTimeOriginal"):
-            with contextlib.suppress(ValueError, TypeError):
-                date_time_original = datetime.fromisoformat(
-                    data["dateTimeOriginal"].replace("Z", "+00:00")
-                )
-
+        get = data.get
         return cls(
-            make=data.get("make", ""),
-            model=data.get("model", ""),
-            exif_image_width=data.get("exifImageWidth", 0),
-            exif_image_height=data.get("exifImageHeight", 0),
-            file_size_in_byte=data.get("fileSizeInByte", 0),
-            orientation=data.get("orientation", ""),
-            date_time_original=date_time_original,
-            time_zone=data.get("timeZone", ""),
-            latitude=data.get("latitude", 0.0),
-            longitude=data.get("longitude", 0.0),
-            description=data.get("description", ""),
+            make=get("make", ""),
+            model=get("model", ""),
+            exif_image_width=get("exifImageWidth", 0),
+            exif_image_height=get("exifImageHeight", 0),
+            file_size_in_byte=get("fileSizeInByte", 0),
+            orientation=get("orientation", ""),
+            date_time_original=_parse_datetime(get("dateTimeOriginal")),
+            time_zone=get("timeZone", ""),
+            latitude=get("latitude", 0.0),
+            longitude=get("longitude", 0.0),
+            description=get("description", ""),
         )
 
     def to_dict(self) -> dict[str, Any]:
@@ -97,7 +115,7 @@ class ExifInfo:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Asset:
     """Asset model for the Immich API."""
 
@@ -137,61 +155,50 @@ class Asset:
         -------
             An Asset instance.
         """
-        asset_type = AssetType.UNKNOWN
-        if data.get("type") in [e.value for e in AssetType]:
-            asset_type = AssetType(data["type"])
-
-        file_created_at = None
-        if data.get("fileCreatedAt"):
-            with contextlib.suppress(ValueError, TypeError):
-                file_created_at = datetime.fromisoformat(
-                    data["fileCreatedAt"].replace("Z", "+00:00")
-                )
-
-        file_modified_at = None
-        if data.get("fileModifiedAt"):
-            with contextlib.suppress(ValueError, TypeError):
-                file_modified_at = datetime.fromisoformat(
-                    data["fileModifiedAt"].replace("Z", "+00:00")
-                )
-
-        updated_at = None
-        if data.get("updatedAt"):
-            with contextlib.suppress(ValueError, TypeError):
-                updated_at = datetime.fromisoformat(
-                    data["updatedAt"].replace("Z", "+00:00")
-                )
-
-        exif_info = ExifInfo()
-        if data.get("exifInfo"):
-            exif_info = ExifInfo.from_dict(data["exifInfo"])
+        # Bind the lookup once; this runs for every row of a search result
+        get = data.get
+        exif_data = get("exifInfo")
 
         return cls(
-            id=data.get("id", ""),
-            device_asset_id=data.get("deviceAssetId", ""),
-            owner_id=data.get("ownerId", ""),
-            device_id=data.get("deviceId", ""),
-            type=asset_type,
-            original_path=data.get("originalPath", ""),
-            original_file_name=data.get("originalFileName", ""),
-            resized=data.get("resized", False),
-            thumbhash=data.get("thumbhash", ""),
-            file_created_at=file_created_at,
-            file_modified_at=file_modified_at,
-            updated_at=updated_at,
-            is_favorite=data.get("isFavorite", False),
-            is_archived=data.get("isArchived", False),
-            is_trashed=data.get("isTrashed", False),
-            duration=data.get("duration", ""),
-            rating=data.get("rating", 0),
-            exif_info=exif_info,
-            live_photo_video_id=data.get("livePhotoVideoId", ""),
-            checksum=data.get("checksum", ""),
-            stack_parent_id=data.get("stackParentId", ""),
-            tags=data.get("tags", []),
-            library_id=data.get("libraryId", ""),
+            id=get("id", ""),
+            device_asset_id=get("deviceAssetId", ""),
+            owner_id=get("ownerId", ""),
+            device_id=get("deviceId", ""),
+            type=_ASSET_TYPES.get(get("type"), AssetType.UNKNOWN),
+            original_path=get("originalPath", ""),
+            original_file_name=get("originalFileName", ""),
+            resized=get("resized", False),
+            thumbhash=get("thumbhash", ""),
+            file_created_at=_parse_datetime(get("fileCreatedAt")),
+            file_modified_at=_parse_datetime(get("fileModifiedAt")),
+            updated_at=_parse_datetime(get("updatedAt")),
+            is_favorite=get("isFavorite", False),
+            is_archived=get("isArchived", False),
+            is_trashed=get("isTrashed", False),
+            duration=get("duration", ""),
+            rating=get("rating", 0),
+            exif_info=ExifInfo.from_dict(exif_data) if exif_data else ExifInfo(),
+            live_photo_video_id=get("livePhotoVideoId", ""),
+            checksum=get("checksum", ""),
+            stack_parent_id=get("stackParentId", ""),
+            tags=get("tags", []),
+            library_id=get("libraryId", ""),
         )
 
+    @classmethod
+    def from_dicts(cls, data: Iterable[dict[str, Any]]) -> list["Asset"]:
+        """
+        Create Asset instances from a sequence of dictionaries.
+
+        Args:
+            data: The dictionaries containing asset information.
+
+        Returns
+        -------
+            A list of Asset instances.
+        """
+        return list(map(cls.from_dict, data))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the Asset instance to a dictionary.
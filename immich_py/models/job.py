@@ -29,7 +29,7 @@ class JobName(str, Enum):
     USER_CLEANUP = "user-cleanup"
 
 
-@dataclass
+@dataclass(slots=True)
 class JobCounts:
     """Job counts model for the Immich API."""
 
@@ -79,7 +79,7 @@ class JobCounts:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class QueueStatus:
     """Queue status model for the Immich API."""
 
@@ -117,7 +117,7 @@ class QueueStatus:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """Job model for the Immich API."""
 
@@ -6,11 +6,12 @@ Tag models for the Immich API.
 This module contains data models for tags in the Immich API.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Tag:
     """Tag model for the Immich API."""
 
@@ -36,6 +37,20 @@ class Tag:
             value=data.get("value", ""),
         )
 
+    @classmethod
+    def from_dicts(cls, data: Iterable[dict[str, Any]]) -> list["Tag"]:
+        """
+        Create Tag instances from a sequence of dictionaries.
+
+        Args:
+            data: The dictionaries containing tag information.
+
+        Returns
+        -------
+            A list of Tag instances.
+        """
+        return list(map(cls.from_dict, data))
+
     def to_dict(self) -> dict[str, Any]:
         """
         Convert the Tag instance to a dictionary.
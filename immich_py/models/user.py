@@ -12,7 +12,7 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class User:
     """User model for the Immich API."""
 
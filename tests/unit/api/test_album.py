@@ -0,0 +1,72 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the AlbumAPI class.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from immich_py.api.album import AlbumAPI
+from immich_py.api.client import ImmichClientError
+
+
+def test_get_assets_albums():
+    """Test looking up the albums of several assets."""
+    client = MagicMock()
+    client.get_asset_albums.side_effect = lambda asset_id: [
+        {"id": f"album-{asset_id}", "albumName": f"Album {asset_id}"}
+    ]
+    album_api = AlbumAPI(client)
+
+    result = album_api.get_assets_albums(["a", "b", "a"])
+
+    assert list(result) == ["a", "b"]
+    assert result["a"][0].id == "album-a"
+    assert result["b"][0].album_name == "Album b"
+    assert client.get_asset_albums.call_count == 2
+
+
+def test_get_assets_albums_empty():
+    """Test an empty list of assets makes no requests."""
+    client = MagicMock()
+    album_api = AlbumAPI(client)
+
+    assert album_api.get_assets_albums([]) == {}
+    client.get_asset_albums.assert_not_called()
+
+
+def test_get_assets_albums_error():
+    """Test a failed lookup is raised to the caller."""
+    client = MagicMock()
+    client.get_asset_albums.side_effect = ImmichClientError("Not found")
+    album_api = AlbumAPI(client)
+
+    with pytest.raises(ImmichClientError):
+        album_api.get_assets_albums(["a"])
+
+
+def test_get_album_by_name():
+    """Test looking up an album by name."""
+    client = MagicMock()
+    client.get_albums_by_name.return_value = {
+        "Trip": {"id": "album-1", "albumName": "Trip"}
+    }
+    album_api = AlbumAPI(client)
+
+    assert album_api.get_album_by_name("Trip").id == "album-1"
+    assert album_api.get_album_by_name("Missing") is None
+
+
+def test_passthrough_methods():
+    """Test pass-through methods are forwarded to the client."""
+    client = MagicMock()
+    album_api = AlbumAPI(client)
+
+    album_api.delete_album("album-1")
+
+    client.delete_album.assert_called_once_with("album-1")
+    assert "add_assets_to_album" in dir(album_api)
+    with pytest.raises(AttributeError):
+        album_api.upload_asset  # noqa: B018
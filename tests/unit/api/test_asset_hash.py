@@ -4,12 +4,16 @@
 Tests for the asset_hash module.
 """
 
+import base64
+import hashlib
 import os
 import shutil
+import sqlite3
 import sys
 import tempfile
 import time
 from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -17,8 +21,12 @@ import pytest
 
 from immich_py.api.asset_hash import (
     AssetHashDatabase,
+    _BloomFilter,
     _create_hash_function,
+    _default_db_path,
     hash_file,
+    hash_files,
+    server_checksum,
 )
 
 
@@ -44,6 +52,11 @@ class TestAssetHash:
         shutil.rmtree(self.temp_dir)
         shutil.rmtree(self.db_dir)
 
+    def _stored_hashes(self):
+        """Read the hashes stored in the database file."""
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            return [row[0] for row in conn.execute("SELECT h FROM hashes ORDER BY h")]
+
     def test_hash_file_exists(self):
         """Test hash_file with an existing file."""
         # Get the hash of the test file
@@ -111,6 +124,28 @@ class TestAssetHash:
         assert isinstance(file_hash, str)
         assert len(file_hash) > 0
 
+    def test_server_checksum(self):
+        """Test server_checksum matches the base64 SHA-1 Immich stores."""
+        content = self.test_file_path.read_bytes()
+        expected = base64.b64encode(hashlib.sha1(content).digest()).decode()
+
+        assert server_checksum(self.test_file_path) == expected
+
+    def test_hash_files(self):
+        """Test hashing several files in parallel."""
+        paths = []
+        for i in range(5):
+            path = Path(self.temp_dir) / f"parallel_{i}.txt"
+            path.write_text(f"Content {i}")
+            paths.append(path)
+
+        result = hash_files([*paths, str(paths[0])], max_workers=3)
+
+        assert result == {path: hash_file(path) for path in paths}
+
+        with pytest.raises(FileNotFoundError):
+            hash_files([Path(self.temp_dir) / "missing.txt"])
+
     def test_create_hash_function(self):
         """Test the _create_hash_function utility."""
 
@@ -125,30 +160,59 @@ class TestAssetHash:
             def hexdigest(self):
                 return "mock_hash_digest"
 
-        mock_hash = MockHashObj()
-        hasher_func = _create_hash_function(mock_hash)
+        hash_objs = []
+
+        def hash_factory():
+            hash_objs.append(MockHashObj())
+            return hash_objs[-1]
+
+        hasher_func = _create_hash_function(hash_factory)
 
         # Test the hasher function
         result = hasher_func(self.test_file_path)
         assert result == "mock_hash_digest"
 
         # Verify that the hash object was updated with the file content
-        assert len(mock_hash.data) > 0
+        assert len(hash_objs[0].data) > 0
+
+        # Each call hashes into a fresh object, so results do not accumulate
+        hasher_func(self.test_file_path)
+        assert len(hash_objs) == 2
+        assert hash_objs[1].data == hash_objs[0].data
+
+    def test_hash_file_memory_mapped(self):
+        """Test large files hash the same when memory-mapped."""
+        expected = hash_file(self.test_file_path)
+
+        with patch("immich_py.api.asset_hash.MMAP_THRESHOLD", 0):
+            assert hash_file(self.test_file_path) == expected
 
     def test_asset_hash_database_init_default(self):
         """Test AssetHashDatabase initialization with default path."""
-        with patch("pathlib.Path.home") as mock_home:
-            mock_home.return_value = Path(self.temp_dir)
+        # The default path is resolved once per process, so reset it around
+        # the test
+        _default_db_path.cache_clear()
+        try:
+            with patch("pathlib.Path.home") as mock_home:
+                mock_home.return_value = Path(self.temp_dir)
 
-            # Initialize with default path
-            db = AssetHashDatabase()
+                # Initialize with default path
+                db = AssetHashDatabase()
 
-            # Verify the default path
-            expected_path = Path(self.temp_dir) / ".immich-py" / "uploaded_assets.db"
-            assert db.db_path == expected_path
+                # Verify the default path
+                expected_path = (
+                    Path(self.temp_dir) / ".immich-py" / "uploaded_assets.db"
+                )
+                assert db.db_path == expected_path
 
-            # Verify the directory was created
-            assert (Path(self.temp_dir) / ".immich-py").exists()
+                # Verify the directory was created
+                assert (Path(self.temp_dir) / ".immich-py").exists()
+
+                # A second database reuses the resolved path
+                assert AssetHashDatabase().db_path == expected_path
+                mock_home.assert_called_once()
+        finally:
+            _default_db_path.cache_clear()
 
     def test_asset_hash_database_init_custom(self):
         """Test AssetHashDatabase initialization with custom path."""
@@ -220,8 +284,21 @@ class TestAssetHash:
         # Check for a hash that's not in the database
         assert db.contains_hash("not_in_db") is False
 
+    def test_asset_hash_database_batch_operations(self):
+        """Test adding and checking hashes in batches."""
+        db = AssetHashDatabase(self.db_path)
+
+        db.add_hash("hash1")
+        db.add_hashes(["hash2", "hash3", "hash2", "hash1"])
+
+        assert db.contains_hashes(["hash1", "hash3", "missing"]) == {"hash1", "hash3"}
+        assert db.contains_hashes([]) == set()
+
+        # Duplicates are stored only once
+        assert self._stored_hashes() == ["hash1", "hash2", "hash3"]
+
     def test_asset_hash_database_file_content(self):
-        """Test the content of the database file."""
+        """Test the hashes stored in the database file."""
         # Initialize the database
         db = AssetHashDatabase(self.db_path)
 
@@ -229,14 +306,75 @@ class TestAssetHash:
         hashes = ["hash1", "hash2", "hash3"]
         for h in hashes:
             db.add_hash(h)
+        db.close()
+
+        # Verify the stored hashes
+        assert self._stored_hashes() == hashes
 
-        # Read the file content
-        with open(self.db_path) as f:
-            content = f.read()
+    def test_asset_hash_database_group_commit(self):
+        """Test single hashes are committed in groups."""
+        db = AssetHashDatabase(self.db_path)
+
+        db.add_hash("hash1")
+
+        # Pending hashes are visible to lookups but not yet written
+        assert db.contains_hash("hash1") is True
+        assert db.contains_hashes(["hash1", "hash2"]) == {"hash1"}
+        assert self._stored_hashes() == []
+
+        db.flush()
+        assert self._stored_hashes() == ["hash1"]
+
+        # Reaching the threshold commits without an explicit flush
+        with patch("immich_py.api.asset_hash.FLUSH_THRESHOLD", 2):
+            db.add_hash("hash2")
+            db.add_hash("hash3")
+        assert self._stored_hashes() == ["hash1", "hash2", "hash3"]
+
+        # The timer commits the remaining hashes
+        with patch("immich_py.api.asset_hash.FLUSH_INTERVAL", 0.2):
+            db.add_hash("hash4")
+            timer = db._flush_timer
+        timer.join()
+        assert "hash4" in self._stored_hashes()
+
+    def test_bloom_filter(self):
+        """Test the Bloom filter has no false negatives and few false positives."""
+        bloom = _BloomFilter(1000)
+        items = [f"hash_{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+        false_positives = sum(f"other_{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+    def test_asset_hash_database_bloom_filter_grows(self):
+        """Test the database's Bloom filter is rebuilt when it fills up."""
+        with patch("immich_py.api.asset_hash.BLOOM_MIN_CAPACITY", 4):
+            db = AssetHashDatabase(self.db_path)
+            hashes = [f"hash{i}" for i in range(10)]
+            for h in hashes:
+                db.add_hash(h)
+
+        assert db._bloom.capacity >= len(hashes)
+        assert all(db.contains_hash(h) for h in hashes)
+        assert db.contains_hash("missing") is False
+
+    def test_asset_hash_database_migrates_text_file(self):
+        """Test a text format database is migrated to SQLite on open."""
+        with open(self.db_path, "w") as f:
+            f.write("hash1\nhash2\n\nhash1\n")
+
+        db = AssetHashDatabase(self.db_path)
 
-        # Verify the content
-        expected_content = "hash1\nhash2\nhash3\n"
-        assert content == expected_content
+        assert db.contains_hashes(["hash1", "hash2", "hash3"]) == {"hash1", "hash2"}
+        assert self._stored_hashes() == ["hash1", "hash2"]
+        assert list(Path(self.db_dir).glob("*.migrating")) == []
+
+        # Reopening the migrated database keeps its hashes
+        db.close()
+        assert AssetHashDatabase(self.db_path).contains_hash("hash2") is True
 
     def test_xxhash_implementation(self):
         """Test the xxHash implementation of hash_file."""
@@ -305,6 +443,7 @@ class TestAssetHash:
 
         # Verify that all hashes are added correctly
         # First, reload the database to ensure we're reading from disk
+        db.close()
         new_db = AssetHashDatabase(self.db_path)
 
         # Check that all expected hashes are in the database
@@ -313,13 +452,9 @@ class TestAssetHash:
                 hash_value = f"thread_{thread_id}_hash_{i}"
                 assert new_db.contains_hash(hash_value), f"Missing hash: {hash_value}"
 
-        # Count the number of lines in the file to ensure no duplicates
-        with Path.open(self.db_path) as f:
-            lines = f.readlines()
-
-        assert len(set(lines)) == len(lines), (
-            "Duplicate hashes found in the database file"
-        )
+        # Count the stored hashes to ensure no duplicates
+        hashes = self._stored_hashes()
+        assert len(hashes) == num_threads * hashes_per_thread
 
     def test_hash_keep_adding_a_duplicate(self):
         """Test that adding the same hash multiple times only writes it once."""
@@ -328,9 +463,7 @@ class TestAssetHash:
         test_hash = "duplicate_test_hash"
         for _ in range(5):
             db.add_hash(test_hash)
+        db.close()
 
-        with Path.open(self.db_path) as f:
-            content = f.readlines()
-
-        occurences = content.count(f"{test_hash}\n")
+        occurences = self._stored_hashes().count(test_hash)
         assert occurences == 1, f"Hash was written {occurences} times"
@@ -4,13 +4,20 @@
 Tests for the AssetAPI upload_assets method.
 """
 
+import asyncio
+import io
 import os
 import shutil
 import tempfile
+import threading
 import zipfile
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
 
 from immich_py.api.asset import AssetAPI
+from immich_py.api.asset_hash import hash_file, server_checksum
+from immich_py.api.client import ImmichClient, ImmichClientError
 
 
 class TestAssetUpload:
@@ -214,16 +221,14 @@ class TestAssetUpload:
             # Check that the result is correct
             assert result == {"id": "test-id", "status": "created"}
 
-            # Reset the mock
-            mock_upload_asset.reset_mock()
-
-            # Set up the mock to return a list of results for the directory test
-            mock_results = [
-                {"id": f"test-id-{i}", "status": "created"}
-                for i in range(len(self.test_files) + 1)
-            ]
-            mock_upload_asset.side_effect = mock_results
-
+        # Directories are uploaded through the async client
+        mock_results = [
+            {"id": f"test-id-{i}", "status": "created"}
+            for i in range(len(self.test_files) + 1)
+        ]
+        with patch.object(
+            asset_api, "upload_asset_async", AsyncMock(side_effect=mock_results)
+        ) as mock_upload_asset_async:
             # Call upload_assets with a directory
             results = asset_api.upload_assets(
                 self.temp_dir,
@@ -234,3 +239,341 @@ class TestAssetUpload:
             # Check that the results are a list of the expected length
             assert isinstance(results, list)
             assert len(results) == len(self.test_files) + 1
+
+        # Every upload shares the one async client opened for the directory
+        mock_client.async_client.assert_called_once_with(max_connections=5)
+        http_client = mock_client.async_client.return_value.__aenter__.return_value
+        assert all(
+            call.args[0] is http_client
+            for call in mock_upload_asset_async.call_args_list
+        )
+
+    @patch("immich_py.api.asset.hash_file")
+    def test_upload_files(self, mock_hash_file):
+        """Test upload_files uploads every file through the async client."""
+        mock_hash_file.side_effect = lambda path: f"hash-{os.path.basename(path)}"
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+
+        def fake_upload(http_client, file_path, **kwargs):
+            if file_path.name == "test_file_1.jpg":
+                msg = "Upload failed"
+                raise ImmichClientError(msg)
+            return {"id": file_path.name, "status": "created"}
+
+        mock_client.upload_asset_async = AsyncMock(side_effect=fake_upload)
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.side_effect = lambda h: h.endswith("_2.jpg")
+            results = asset_api.upload_files(
+                self.test_files[:3], show_progress=False, max_concurrency=2
+            )
+
+        # One file fails and one is skipped by the hash database
+        statuses = sorted(result["status"] for result in results)
+        assert statuses == ["created", "skipped"]
+        mock_client.async_client.assert_called_once_with(max_connections=2)
+        mock_hash_db.add_hash.assert_called_once_with("hash-test_file_0.jpg")
+
+    @patch("immich_py.api.asset.hash_file")
+    def test_upload_files_skips_copies(self, mock_hash_file):
+        """Test copies of a file in one run are uploaded only once."""
+        mock_hash_file.return_value = "same-hash"
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_client.upload_asset_async = AsyncMock(
+            return_value={"id": "new", "status": "created"}
+        )
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.return_value = False
+            results = asset_api.upload_files(self.test_files[:3], show_progress=False)
+
+        assert sorted(result["status"] for result in results) == [
+            "created",
+            "skipped",
+            "skipped",
+        ]
+        mock_client.upload_asset_async.assert_called_once()
+
+    @patch("immich_py.api.asset.hash_file")
+    def test_upload_files_skips_copies_ignore_db(self, mock_hash_file):
+        """Test copies are skipped even when the hash database is ignored."""
+        mock_hash_file.return_value = "same-hash"
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_client.upload_asset_async = AsyncMock(
+            return_value={"id": "new", "status": "created"}
+        )
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            results = asset_api.upload_files(
+                self.test_files[:3], ignore_db=True, show_progress=False
+            )
+
+        assert sorted(result["status"] for result in results) == [
+            "created",
+            "skipped",
+            "skipped",
+        ]
+        mock_client.upload_asset_async.assert_called_once()
+        assert mock_client.upload_asset_async.call_args.kwargs["data_callback"] is None
+        mock_hash_db.contains_hash.assert_not_called()
+        mock_hash_db.add_hash.assert_called_once_with("same-hash")
+
+    @patch("immich_py.api.asset.hash_file")
+    def test_upload_files_retries_failed_copy(self, mock_hash_file):
+        """Test a copy is still uploaded when the first upload fails."""
+        mock_hash_file.return_value = "same-hash"
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_client.upload_asset_async = AsyncMock(
+            side_effect=[ImmichClientError("Upload failed"), {"status": "created"}]
+        )
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.return_value = False
+            results = asset_api.upload_files(
+                self.test_files[:2], show_progress=False, max_concurrency=1
+            )
+
+        assert [result["status"] for result in results] == ["created"]
+        assert mock_client.upload_asset_async.call_count == 2
+
+    def test_upload_files_check_server(self):
+        """Test files already on the server are skipped without uploading."""
+        on_server = server_checksum(self.test_files[0])
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_client.check_existing_checksums.return_value = {on_server: "asset-0"}
+        mock_client.upload_asset_async = AsyncMock(
+            return_value={"id": "new", "status": "created"}
+        )
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.return_value = False
+            results = asset_api.upload_files(
+                self.test_files[:2], show_progress=False, check_server=True
+            )
+
+        assert sorted(result["status"] for result in results) == [
+            "created",
+            "skipped",
+        ]
+        (checksums,), _ = mock_client.check_existing_checksums.call_args
+        assert len(checksums) == 2
+        mock_client.upload_asset_async.assert_called_once()
+
+    @patch("immich_py.api.asset.server_checksum")
+    def test_upload_files_check_server_hashes_each_path_once(self, mock_checksum):
+        """Test a path listed twice is hashed and checked only once."""
+        mock_checksum.side_effect = lambda path: f"sha-{os.path.basename(path)}"
+
+        mock_client = MagicMock()
+        mock_client.async_client.return_value.__aenter__ = AsyncMock(
+            return_value=MagicMock()
+        )
+        mock_client.async_client.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_client.check_existing_checksums.return_value = {
+            "sha-test_file_0.jpg": "asset-0"
+        }
+        mock_client.upload_asset_async = AsyncMock(
+            return_value={"id": "new", "status": "created"}
+        )
+
+        asset_api = AssetAPI(mock_client)
+        file_paths = [self.test_files[0], self.test_files[1], self.test_files[0]]
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.return_value = False
+            results = asset_api.upload_files(
+                file_paths, show_progress=False, check_server=True
+            )
+
+        assert mock_checksum.call_count == 2
+        (checksums,), _ = mock_client.check_existing_checksums.call_args
+        assert checksums == ["sha-test_file_0.jpg", "sha-test_file_1.jpg"]
+        assert [result["status"] for result in results].count("skipped") == 2
+
+    @patch("immich_py.api.asset.hash_file")
+    def test_upload_asset_with_precomputed_hash(self, mock_hash_file):
+        """Test upload_asset does not rehash when a hash is supplied."""
+        mock_client = MagicMock()
+        mock_client.upload_asset.return_value = {"id": "test-id", "status": "created"}
+
+        asset_api = AssetAPI(mock_client)
+        with patch.object(AssetAPI, "_hash_db") as mock_hash_db:
+            mock_hash_db.contains_hash.return_value = False
+            result = asset_api.upload_asset(
+                self.test_files[0], show_progress=False, file_hash="known-hash"
+            )
+
+        assert result["status"] == "created"
+        mock_hash_file.assert_not_called()
+        # The file is stat'ed once and the result handed to the client
+        file_stat = mock_client.upload_asset.call_args.kwargs["file_stat"]
+        assert file_stat.st_size == os.path.getsize(self.test_files[0])
+        mock_hash_db.add_hash.assert_called_once_with("known-hash")
+
+    @patch("immich_py.api.upload_utils.process_upload_path")
+    def test_upload_assets_binds_upload_options(self, mock_process_upload_path):
+        """Test the upload function handed to process_upload_path."""
+        asset_api = AssetAPI(MagicMock())
+        asset_api.upload_asset = MagicMock(return_value={"status": "created"})
+
+        asset_api.upload_assets(
+            self.test_files[0],
+            sidecar_path="sidecar.xmp",
+            ignore_db=True,
+            show_progress=False,
+        )
+
+        upload_func = mock_process_upload_path.call_args.args[1]
+        kwargs = dict(mock_process_upload_path.call_args.kwargs)
+        assert kwargs.pop("max_workers") == 5
+        assert kwargs["sidecar_path"] == "sidecar.xmp"
+
+        upload_func(self.test_files[0], **kwargs)
+        asset_api.upload_asset.assert_called_once_with(
+            self.test_files[0], ignore_db=True, show_progress=False, **kwargs
+        )
+
+    def test_upload_asset_ignore_db_hashes_while_uploading(self):
+        """Test ignore_db uploads hash the file from the data sent."""
+        expected_hash = hash_file(self.test_files[0])
+
+        def handler(request):
+            request.read()
+            return httpx.Response(201, json={"id": "test-id", "status": "created"})
+
+        client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        client._supported_media_types = {".jpg": "image"}
+        asset_api = AssetAPI(client)
+
+        with (
+            patch.object(AssetAPI, "_hash_db") as mock_hash_db,
+            patch("immich_py.api.asset.hash_file", wraps=hash_file) as mock_hash_file,
+        ):
+            result = asset_api.upload_asset(
+                self.test_files[0], ignore_db=True, show_progress=False
+            )
+
+        assert result["status"] == "created"
+        mock_hash_file.assert_not_called()
+        mock_hash_db.contains_hash.assert_not_called()
+        mock_hash_db.add_hash.assert_called_once_with(expected_hash)
+
+    def test_upload_asset_streams_file(self):
+        """Test uploads read the file in bounded chunks with a known length."""
+        reads = []
+
+        class RecordingFile(io.BytesIO):
+            def read(self, size=-1):
+                reads.append(size)
+                return super().read(size)
+
+        data = os.urandom(300_000)
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            request.read()
+            return httpx.Response(201, json={"id": "test-id", "status": "created"})
+
+        client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        client._supported_media_types = {".jpg": "image"}
+
+        client.upload_asset(
+            self.test_files[0],
+            file=RecordingFile(data),
+            file_stat=os.stat(self.test_files[0]),
+        )
+
+        assert reads
+        assert all(0 < size < len(data) for size in reads)
+        headers = requests[0].headers
+        assert int(headers["Content-Length"]) > len(data)
+        assert "Transfer-Encoding" not in headers
+        assert data in requests[0].content
+
+    def test_upload_asset_async_retries_gateway_errors(self):
+        """Test async uploads are retried on gateway errors."""
+        statuses = iter([503, 201])
+        bodies = []
+
+        def handler(request):
+            bodies.append(request.read())
+            return httpx.Response(next(statuses), json={"id": "test-id"})
+
+        client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+        client._supported_media_types = {".jpg": "image"}
+        client.retry_delay = 0
+
+        sizes = []
+
+        async def upload():
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as http_client:
+                return await client.upload_asset_async(
+                    http_client, self.test_files[0], progress_callback=sizes.append
+                )
+
+        result = asyncio.run(upload())
+
+        assert result == {"id": "test-id"}
+        assert len(bodies) == 2
+        assert len(bodies[0]) == len(bodies[1])
+        # The file sent twice is counted once in the progress
+        assert sum(sizes) == os.path.getsize(self.test_files[0])
+
+    def test_upload_asset_async_builds_form_off_event_loop(self):
+        """Test the media type lookup for an async upload runs in a thread."""
+        lookup_threads = []
+
+        def handler(request):
+            if request.url.path.endswith("/server/media-types"):
+                lookup_threads.append(threading.get_ident())
+                return httpx.Response(200, json={"image": [".jpg"]})
+            return httpx.Response(201, json={"id": "test-id"})
+
+        client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        async def upload():
+            async with httpx.AsyncClient(
+                transport=httpx.MockTransport(handler)
+            ) as http_client:
+                return await client.upload_asset_async(http_client, self.test_files[0])
+
+        result = asyncio.run(upload())
+
+        assert result == {"id": "test-id"}
+        assert lookup_threads
+        assert threading.get_ident() not in lookup_threads
@@ -0,0 +1,114 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the cache module.
+"""
+
+import stat
+from unittest.mock import patch
+
+from immich_py.api.cache import MISSING, ETagCache, ResponseCache, api_key_scope
+
+
+def test_get_and_set():
+    """Test storing and retrieving a value."""
+    cache = ResponseCache()
+    assert cache.get(("/assets/1",)) is MISSING
+
+    cache.set(("/assets/1",), {"id": "1"})
+    assert cache.get(("/assets/1",)) == {"id": "1"}
+
+    # None is a valid cached value
+    cache.set(("/assets/2",), None)
+    assert cache.get(("/assets/2",)) is None
+
+
+def test_expiry():
+    """Test entries expire after the TTL."""
+    cache = ResponseCache(ttl=10.0)
+    with patch("immich_py.api.cache.time.monotonic", return_value=100.0):
+        cache.set(("/albums",), [])
+    with patch("immich_py.api.cache.time.monotonic", return_value=105.0):
+        assert cache.get(("/albums",)) == []
+    with patch("immich_py.api.cache.time.monotonic", return_value=111.0):
+        assert cache.get(("/albums",)) is MISSING
+
+
+def test_lru_eviction():
+    """Test the least recently used entry is evicted first."""
+    cache = ResponseCache(maxsize=2)
+    cache.set(("/a",), 1)
+    cache.set(("/b",), 2)
+    cache.get(("/a",))
+    cache.set(("/c",), 3)
+
+    assert cache.get(("/a",)) == 1
+    assert cache.get(("/b",)) is MISSING
+    assert cache.get(("/c",)) == 3
+
+
+def test_invalidate_and_clear():
+    """Test invalidating by path prefix and clearing."""
+    cache = ResponseCache()
+    cache.set(("/albums",), [])
+    cache.set(("/albums/1", ()), {})
+    cache.set(("/assets/1", ()), {})
+
+    cache.invalidate("/albums")
+    assert cache.get(("/albums",)) is MISSING
+    assert cache.get(("/albums/1", ())) is MISSING
+    assert cache.get(("/assets/1", ())) == {}
+
+    cache.clear()
+    assert cache.get(("/assets/1", ())) is MISSING
+
+
+def test_etag_cache_persists(tmp_path):
+    """Test ETag entries are saved to and loaded from the cache file."""
+    path = tmp_path / "cache" / "etags.json"
+    cache = ETagCache(path)
+    assert cache.get("https://immich/api/server/about") is None
+
+    cache.set("https://immich/api/server/about", 'W/"1"', {"version": "1.0.0"})
+
+    reloaded = ETagCache(path)
+    assert reloaded.get("https://immich/api/server/about") == (
+        'W/"1"',
+        {"version": "1.0.0"},
+    )
+
+
+def test_etag_cache_ignores_unreadable_file(tmp_path):
+    """Test a corrupt cache file is treated as empty and then replaced."""
+    path = tmp_path / "etags.json"
+    path.write_text("not json")
+    cache = ETagCache(path)
+
+    assert cache.get("https://immich/api/users/me") is None
+    cache.set("https://immich/api/users/me", '"2"', {"id": "user-id"})
+    assert ETagCache(path).get("https://immich/api/users/me") == (
+        '"2"',
+        {"id": "user-id"},
+    )
+
+
+def test_etag_cache_scopes(tmp_path):
+    """Test entries stored for one API key are not returned for another."""
+    path = tmp_path / "etags.json"
+    url = "https://immich/api/users/me"
+    ETagCache(path, scope=api_key_scope("key-a")).set(url, '"1"', {"id": "a"})
+
+    assert ETagCache(path, scope=api_key_scope("key-b")).get(url) is None
+    assert ETagCache(path, scope=api_key_scope("key-a")).get(url) == (
+        '"1"',
+        {"id": "a"},
+    )
+    assert "key-a" not in path.read_text()
+
+
+def test_etag_cache_file_private(tmp_path):
+    """Test the cache file is readable only by its owner."""
+    path = tmp_path / "cache" / "etags.json"
+    ETagCache(path).set("https://immich/api/users/me", '"1"', {"id": "a"})
+
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
@@ -2,14 +2,20 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Tests for the immich_py.client module."""
 
+import json
 import platform
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import ANY, MagicMock, patch
 
 import httpx
 import pytest
 
-from immich_py.api.client import ImmichClient, ImmichClientError
+from immich_py.api.client import (
+    HTTP2_AVAILABLE,
+    KEEPALIVE_EXPIRY,
+    ImmichClient,
+    ImmichClientError,
+)
 
 
 class TestImmichClientError:
@@ -87,9 +93,37 @@ class TestImmichClient:
         httpx_client = client.client
         assert isinstance(httpx_client, httpx.Client)
         assert httpx_client.headers["x-api-key"] == "test_api_key"
+        assert httpx_client.headers["Accept"] == "application/json"
         # Second call should return the same client
         assert client.client is httpx_client
 
+    def test_client_property_pool_and_retries(self) -> None:
+        """Test the httpx client uses a pooled transport with retries."""
+        client = ImmichClient(
+            endpoint="https://immich.example.com",
+            api_key="test_api_key",
+            retries=3,
+        )
+        with patch("httpx.HTTPTransport", wraps=httpx.HTTPTransport) as transport:
+            client.client  # noqa: B018
+        _, kwargs = transport.call_args
+        assert kwargs["retries"] == 3
+        assert kwargs["limits"].max_connections == 64
+        assert kwargs["limits"].max_keepalive_connections == 32
+        assert kwargs["limits"].keepalive_expiry == KEEPALIVE_EXPIRY
+        assert kwargs["http2"] is HTTP2_AVAILABLE
+
+    def test_http2_disabled(self) -> None:
+        """Test HTTP/2 can be turned off explicitly."""
+        client = ImmichClient(
+            endpoint="https://immich.example.com",
+            api_key="test_api_key",
+            http2=False,
+        )
+        with patch("httpx.HTTPTransport", wraps=httpx.HTTPTransport) as transport:
+            client.client  # noqa: B018
+        assert transport.call_args.kwargs["http2"] is False
+
     def test_close(self, mock_client: ImmichClient) -> None:
         """Test closing the client.
 
@@ -138,7 +172,7 @@ class TestImmichClient:
         """
         mock_response.status_code = status_code
         if response_data is not None:
-            mock_response.json.return_value = response_data
+            mock_response.content = json.dumps(response_data).encode()
 
         result = mock_client._handle_response(
             mock_response, "/test", expected_status=expected_status
@@ -155,7 +189,7 @@ class TestImmichClient:
             mock_response: A mocked httpx.Response object.
         """
         mock_response.status_code = 404
-        mock_response.json.return_value = {"message": "Not found"}
+        mock_response.content = b'{"message": "Not found"}'
 
         with pytest.raises(ImmichClientError) as excinfo:
             mock_client._handle_response(mock_response, "/test")
@@ -181,10 +215,10 @@ class TestImmichClient:
             method="GET",
             url="https://immich.example.com/api/test",
             params=None,
-            json=None,
+            content=None,
             data=None,
             files=None,
-            headers={"Accept": "application/json"},
+            headers=None,
         )
         assert result == {"success": True}
 
@@ -294,15 +328,20 @@ class TestImmichClient:
         # Call the method dynamically
         result = getattr(mock_client, method)(path, **kwargs)
 
+        expected_headers = (
+            None if expected_json is None else {"Content-Type": "application/json"}
+        )
         mock_client.client.request.assert_called_once_with(
             method=expected_method,
             url=expected_url,
             params=expected_params,
-            json=expected_json,
+            content=ANY,
             data=expected_data,
             files=expected_files,
-            headers={"Accept": "application/json"},
+            headers=expected_headers,
         )
+        content = mock_client.client.request.call_args.kwargs["content"]
+        assert (None if content is None else json.loads(content)) == expected_json
         assert result == {"success": True}
 
     @pytest.mark.parametrize(
@@ -2,15 +2,32 @@
 # Licensed under the MIT License. See LICENSE file for details.
 """Additional tests for the immich_py.client module."""
 
+import ast
+import asyncio
+import dataclasses
+import enum
+import inspect
+import io
 import json
-from datetime import datetime
+import uuid
+from datetime import UTC, date, datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
 import pytest
 
-from immich_py.api.client import ImmichClient, ImmichClientError
+import immich_py.api.album
+import immich_py.api.asset
+from immich_py.api.client import (
+    ImmichClient,
+    ImmichClientError,
+    _format_timestamp,
+    _mime_type_for_extension,
+    _paged_json,
+    _ProgressFileWrapper,
+    _stdlib_json_dumps,
+)
 
 # ruff: noqa: DTZ001
 
@@ -32,6 +49,30 @@ def test_context_manager():
         mock_instance.close.assert_called_once()
 
 
+def test_requests_share_one_http_client():
+    """Test every API call reuses the client's one pooled HTTP client."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=[])
+
+    with (
+        patch("httpx.HTTPTransport", return_value=httpx.MockTransport(handler)),
+        patch("httpx.Client", wraps=httpx.Client) as mock_httpx_client,
+        ImmichClient(
+            endpoint="https://immich.example.com",
+            api_key="test_api_key",
+            cache_reads=False,
+        ) as client,
+    ):
+        client.get_all_albums()
+        client.get_album_info("album-1")
+        client.tag_assets("tag-1", ["asset-1"])
+        client.send_job_command("thumbnailGeneration", "start")
+
+    mock_httpx_client.assert_called_once()
+    assert client._client is None
+
+
 @pytest.mark.asyncio
 async def test_async_client():
     """Test the async_client context manager."""
@@ -51,10 +92,28 @@ async def test_async_client():
         mock_instance.aclose.assert_awaited_once()
 
 
+@pytest.mark.parametrize(
+    ("max_connections", "expected"),
+    [(None, (100, 20)), (8, (8, 8))],
+)
+@pytest.mark.asyncio
+async def test_async_client_limits(max_connections, expected):
+    """Test the async connection pool is always bounded."""
+    client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+
+    with patch("httpx.AsyncHTTPTransport") as mock_transport:
+        mock_transport.return_value.aclose = AsyncMock()
+        async with client.async_client(max_connections):
+            pass
+
+    limits = mock_transport.call_args.kwargs["limits"]
+    assert (limits.max_connections, limits.max_keepalive_connections) == expected
+
+
 def test_handle_response_error_with_error_key(mock_client, mock_response):
     """Test handling an error response with 'error' key."""
     mock_response.status_code = 400
-    mock_response.json.return_value = {"error": "Bad request"}
+    mock_response.content = b'{"error": "Bad request"}'
 
     with pytest.raises(ImmichClientError) as excinfo:
         mock_client._handle_response(mock_response, "/test")
@@ -66,7 +125,7 @@ def test_handle_response_error_with_error_key(mock_client, mock_response):
 def test_handle_response_error_with_text(mock_client, mock_response):
     """Test handling an error response with text."""
     mock_response.status_code = 500
-    mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
+    mock_response.content = b"Internal server error"
     mock_response.text = "Internal server error"
 
     with pytest.raises(ImmichClientError) as excinfo:
@@ -76,6 +135,26 @@ def test_handle_response_error_with_text(mock_client, mock_response):
     assert "Internal server error" in str(excinfo.value)
 
 
+@pytest.mark.parametrize(
+    ("content", "expected_message"),
+    [
+        (b"<html>" + b"x" * 1000 + b"</html>", "<html>" + "x" * 506),
+        (b"500", "HTTP 500"),
+        (b'["unexpected"]', "HTTP 500"),
+    ],
+)
+def test_handle_response_error_with_other_body(content, expected_message):
+    """Test error bodies that are not a JSON object give a short message."""
+    response = httpx.Response(
+        500, content=content, request=httpx.Request("GET", "https://immich/api/test")
+    )
+
+    with pytest.raises(ImmichClientError) as excinfo:
+        ImmichClient("https://immich", "key")._handle_response(response, "/test")
+
+    assert excinfo.value.args[0] == expected_message
+
+
 def test_request_error(mock_client):
     """Test handling a request error."""
     mock_client.client.request.side_effect = httpx.RequestError("Connection error")
@@ -102,11 +181,27 @@ def test_get_binary(mock_client, mock_response):
     assert result == b"binary data"
 
 
+def test_get_binary_extra_headers(mock_client, mock_response):
+    """Test caller headers are merged without changing the shared defaults."""
+    mock_client.client.request.return_value = mock_response
+    mock_response.content = b"binary data"
+
+    mock_client.get_binary("/test", headers={"Range": "bytes=0-9"})
+    mock_client.get_binary("/test")
+
+    first, second = mock_client.client.request.call_args_list
+    assert first.kwargs["headers"] == {
+        "Accept": "application/octet-stream",
+        "Range": "bytes=0-9",
+    }
+    assert second.kwargs["headers"] == {"Accept": "application/octet-stream"}
+
+
 def test_get_binary_error(mock_client, mock_response):
     """Test the get_binary method with an error response."""
     mock_client.client.request.return_value = mock_response
     mock_response.status_code = 404
-    mock_response.json.return_value = {"message": "Not found"}
+    mock_response.content = b'{"message": "Not found"}'
 
     with pytest.raises(ImmichClientError) as excinfo:
         mock_client.get_binary("/test")
@@ -136,6 +231,71 @@ def test_download_asset(mock_client):
     assert result == b"asset data"
 
 
+def test_download_asset_with_destination(mock_client):
+    """Test downloading an asset to a destination streams it instead."""
+    mock_client.get_binary = MagicMock()
+    mock_client.download_asset_to = MagicMock(return_value=10)
+    destination = io.BytesIO()
+
+    result = mock_client.download_asset("asset-id", destination)
+
+    mock_client.download_asset_to.assert_called_once_with("asset-id", destination)
+    mock_client.get_binary.assert_not_called()
+    assert result == 10
+
+
+def test_download_asset_to(mock_client, mock_response, tmp_path):
+    """Test streaming an asset to a file."""
+    mock_response.iter_bytes.return_value = [b"asset ", b"data"]
+    mock_client.client.stream.return_value.__enter__.return_value = mock_response
+
+    destination = tmp_path / "asset.jpg"
+    written = mock_client.download_asset_to("asset-id", destination)
+
+    mock_client.client.stream.assert_called_once_with(
+        "GET",
+        "https://immich.example.com/api/assets/asset-id/original",
+        params=None,
+        headers={"Accept": "application/octet-stream"},
+    )
+    assert written == 10
+    assert destination.read_bytes() == b"asset data"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+def test_download_asset_to_interrupted(mock_client, mock_response, tmp_path):
+    """Test an interrupted download leaves the destination untouched."""
+
+    def iter_bytes(_chunk_size):
+        yield b"partial"
+        msg = "connection lost"
+        raise httpx.ReadError(msg)
+
+    mock_response.iter_bytes.side_effect = iter_bytes
+    mock_client.client.stream.return_value.__enter__.return_value = mock_response
+    destination = tmp_path / "asset.jpg"
+    destination.write_bytes(b"previous")
+
+    with pytest.raises(ImmichClientError):
+        mock_client.download_asset_to("asset-id", destination)
+
+    assert destination.read_bytes() == b"previous"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+def test_download_asset_to_error(mock_client, mock_response):
+    """Test streaming an asset with an error response."""
+    mock_response.status_code = 404
+    mock_response.content = b'{"message": "Not found"}'
+    mock_client.client.stream.return_value.__enter__.return_value = mock_response
+
+    with pytest.raises(ImmichClientError) as excinfo:
+        mock_client.download_asset_to("asset-id", io.BytesIO())
+
+    assert excinfo.value.status_code == 404
+    assert excinfo.value.endpoint == "DownloadAsset"
+
+
 @pytest.mark.parametrize(
     (
         "is_archived",
@@ -222,12 +382,60 @@ def test_update_assets(
         stack_parent_id=stack_parent_id,
     )
 
-    mock_client.put.assert_called_once_with(
-        "/assets", json_data=expected_data, endpoint_name="UpdateAssets"
-    )
+    mock_client.put.assert_called_once()
+    assert mock_client.put.call_args.args == ("/assets",)
+    assert mock_client.put.call_args.kwargs["endpoint_name"] == "UpdateAssets"
+    assert json.loads(mock_client.put.call_args.kwargs["json_content"]) == expected_data
     assert result == {"success": True}
 
 
+def test_update_assets_batches_and_extra_fields(mock_client):
+    """Test bulk updates are split into batches and pass extra fields."""
+    mock_client.put = MagicMock(return_value={})
+    asset_ids = [f"asset-{i}" for i in range(5)]
+
+    with patch("immich_py.api.client.UPDATE_BATCH_SIZE", 2):
+        mock_client.update_assets(asset_ids, is_favorite=True, rating=4)
+
+    batches = [
+        json.loads(call.kwargs["json_content"])
+        for call in mock_client.put.call_args_list
+    ]
+    assert [batch["ids"] for batch in batches] == [
+        ["asset-0", "asset-1"],
+        ["asset-2", "asset-3"],
+        ["asset-4"],
+    ]
+    assert all(batch["rating"] == 4 for batch in batches)
+    assert all(batch["isFavorite"] is True for batch in batches)
+
+
+def test_update_assets_fields(mock_client):
+    """Test a partial bulk update sends only the given fields."""
+    mock_client.put = MagicMock(return_value={})
+
+    mock_client.update_assets_fields(
+        ["asset-1", "asset-2"], dateTimeOriginal="2024-01-01T00:00:00"
+    )
+
+    mock_client.put.assert_called_once()
+    assert json.loads(mock_client.put.call_args.kwargs["json_content"]) == {
+        "ids": ["asset-1", "asset-2"],
+        "dateTimeOriginal": "2024-01-01T00:00:00",
+    }
+
+
+def test_update_assets_fields_without_fields(mock_client):
+    """Test a bulk update with no fields sends only the IDs."""
+    mock_client.put = MagicMock(return_value={})
+
+    mock_client.update_assets_fields(["asset-1"])
+
+    assert json.loads(mock_client.put.call_args.kwargs["json_content"]) == {
+        "ids": ["asset-1"]
+    }
+
+
 def test_upload_asset_dry_run(mock_client):
     """Test uploading an asset in dry run mode."""
     mock_client.dry_run = True
@@ -237,6 +445,28 @@ def test_upload_asset_dry_run(mock_client):
     assert result == {"id": "dry-run-id", "status": "created"}
 
 
+def test_upload_asset_async_dry_run(mock_client):
+    """Test uploading an asset asynchronously in dry run mode."""
+    mock_client.dry_run = True
+    http_client = AsyncMock()
+
+    result = asyncio.run(
+        mock_client.upload_asset_async(http_client, file_path="test.jpg")
+    )
+
+    assert result == {"id": "dry-run-id", "status": "created"}
+    http_client.post.assert_not_called()
+
+
+def test_create_album_dry_run_keywords(mock_client):
+    """Test dry run results are built from keyword and default arguments."""
+    mock_client.dry_run = True
+
+    result = mock_client.create_album(album_name="Test Album")
+
+    assert result == {"id": "dry-run-id", "albumName": "Test Album", "description": ""}
+
+
 def test_upload_asset_file_not_found(mock_client):
     """Test uploading a non-existent file."""
     with patch("pathlib.Path.exists", return_value=False):
@@ -246,6 +476,19 @@ def test_upload_asset_file_not_found(mock_client):
         assert "File not found" in str(excinfo.value)
 
 
+def test_upload_asset_sidecar_not_found(mock_client, tmp_path):
+    """Test uploading with a missing sidecar file."""
+    asset_path = tmp_path / "photo.jpg"
+    asset_path.write_bytes(b"image data")
+    mock_client._supported_media_types = {".jpg": "image"}
+
+    with pytest.raises(ImmichClientError) as excinfo:
+        mock_client.upload_asset(asset_path, sidecar_path=tmp_path / "photo.xmp")
+
+    assert "Sidecar file not found" in str(excinfo.value)
+    mock_client.client.request.assert_not_called()
+
+
 def test_upload_asset_unsupported_type(mock_client):
     """Test uploading an unsupported file type."""
     with (
@@ -437,6 +680,26 @@ def test_replace_asset_with_sidecar_success(mock_client):
         mock_client.put.assert_called_once()
 
 
+def test_replace_asset_with_open_file(mock_client):
+    """Test replacing an asset from a caller-supplied file handle."""
+    asset_file = io.BytesIO(b"image data")
+
+    with (
+        patch("pathlib.Path.exists") as mock_exists,
+        patch("pathlib.Path.open") as mock_open,
+        patch.object(mock_client, "_get_mime_type", return_value="image/jpeg"),
+        patch.object(mock_client, "put", return_value={"id": "asset-id"}) as mock_put,
+    ):
+        result = mock_client.replace_asset("asset-id", "test.jpg", file=asset_file)
+
+    assert result == {"id": "asset-id"}
+    mock_exists.assert_not_called()
+    mock_open.assert_not_called()
+    files = mock_put.call_args.kwargs["files"]
+    assert files["assetData"] == ("test.jpg", asset_file, "image/jpeg")
+    assert not asset_file.closed
+
+
 def test_search_assets_pagination(mock_client):
     """Test asset search with pagination."""
     # First page has nextPage, second page doesn't
@@ -461,6 +724,91 @@ def test_search_assets_pagination(mock_client):
     assert mock_client.post.call_count == 2
 
 
+def test_iter_search_assets_is_lazy(mock_client):
+    """Test pages are only requested as the iterator is consumed."""
+    mock_client.post = MagicMock(
+        side_effect=[
+            {"assets": {"items": [{"id": "asset-1"}], "nextPage": "2"}},
+            {"assets": {"items": [{"id": "asset-2"}], "nextPage": None}},
+        ]
+    )
+
+    assets = mock_client.iter_search_assets(page_size=1)
+    assert mock_client.post.call_count == 0
+
+    assert next(assets)["id"] == "asset-1"
+    assert mock_client.post.call_count == 1
+    assert [asset["id"] for asset in assets] == ["asset-2"]
+    assert json.loads(mock_client.post.call_args.kwargs["json_content"])["page"] == 2
+
+
+def test_iter_search_assets_prefetch(mock_client):
+    """Test prefetched pages are yielded in order and stop at the last page."""
+    last_page = 5
+
+    def post(_path, *, json_content, endpoint_name):
+        page = json.loads(json_content)["page"]
+        if page > last_page:
+            return {"assets": {"items": [], "nextPage": None}}
+        next_page = str(page + 1) if page < last_page else None
+        return {"assets": {"items": [{"id": f"asset-{page}"}], "nextPage": next_page}}
+
+    mock_client.post = MagicMock(side_effect=post)
+
+    assets = list(mock_client.iter_search_assets(page_size=1, prefetch=3))
+
+    assert [asset["id"] for asset in assets] == [f"asset-{p}" for p in range(1, 6)]
+    requested = {
+        json.loads(call.kwargs["json_content"])["page"]
+        for call in mock_client.post.mock_calls
+    }
+    assert requested <= set(range(1, last_page + 3))
+
+
+def test_paged_json():
+    """Test paged query bodies only differ in their page number."""
+    body = _paged_json({"page": 1, "size": 1000, "model": "X100"})
+
+    assert json.loads(body(3)) == {"size": 1000, "model": "X100", "page": 3}
+    assert json.loads(_paged_json({})(2)) == {"page": 2}
+
+
+def test_search_assets_async():
+    """Test async search fetches later pages concurrently and keeps their order."""
+    last_page = 5
+    requested = []
+
+    def handler(request):
+        query = json.loads(request.content)
+        page = query["page"]
+        requested.append(page)
+        assert query["model"] == "X100"
+        if page > last_page:
+            return httpx.Response(200, json={"assets": {"items": [], "nextPage": None}})
+        next_page = str(page + 1) if page < last_page else None
+        return httpx.Response(
+            200,
+            json={
+                "assets": {"items": [{"id": f"asset-{page}"}], "nextPage": next_page}
+            },
+        )
+
+    client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+
+    async def search():
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as http_client:
+            return await client.search_assets_async(
+                http_client, page_size=1, model="X100", max_concurrency=3
+            )
+
+    assets = asyncio.run(search())
+
+    assert [asset["id"] for asset in assets] == [f"asset-{p}" for p in range(1, 6)]
+    assert sorted(requested) == list(range(1, 8))
+
+
 @pytest.mark.parametrize(
     ("checksum", "expected_result"),
     [
@@ -483,6 +831,59 @@ def test_get_assets_by_hash(mock_client, checksum, expected_result):
     assert result == expected_result
 
 
+def test_get_assets_by_hashes(mock_client):
+    """Test getting assets for many checksums in batches."""
+    mock_client.post = MagicMock(
+        side_effect=[
+            {"results": [{"id": "abc", "action": "reject", "assetId": "asset-1"}]},
+            {"results": [{"id": "xyz", "action": "accept"}]},
+        ]
+    )
+    mock_client.get_asset_info = MagicMock(return_value={"id": "asset-1"})
+
+    result = mock_client.get_assets_by_hashes(["abc", "xyz", "abc"], batch_size=1)
+
+    assert result == {"abc": [{"id": "asset-1"}], "xyz": []}
+    assert mock_client.post.call_count == 2
+    assert mock_client.post.call_args.kwargs["json_data"] == {
+        "assets": [{"id": "xyz", "checksum": "xyz"}]
+    }
+    mock_client.get_asset_info.assert_called_once_with("asset-1")
+
+
+def test_check_existing_checksums(mock_client):
+    """Test checking checksums without fetching the matching assets."""
+    mock_client.post = MagicMock(
+        return_value={
+            "results": [
+                {"id": "abc", "action": "reject", "assetId": "asset-1"},
+                {"id": "xyz", "action": "accept"},
+            ]
+        }
+    )
+    mock_client.get_asset_info = MagicMock()
+
+    result = mock_client.check_existing_checksums(["abc", "xyz"])
+
+    assert result == {"abc": "asset-1"}
+    mock_client.get_asset_info.assert_not_called()
+
+
+def test_get_assets_by_hashes_fallback(mock_client):
+    """Test falling back to searches when the bulk endpoint is missing."""
+    mock_client.post = MagicMock(
+        side_effect=ImmichClientError("Not Found", status_code=404)
+    )
+    mock_client.get_assets_by_hash = MagicMock(
+        side_effect=lambda checksum: [{"id": f"asset-{checksum}"}]
+    )
+
+    result = mock_client.get_assets_by_hashes(["abc", "xyz"])
+
+    assert result == {"abc": [{"id": "asset-abc"}], "xyz": [{"id": "asset-xyz"}]}
+    assert mock_client.get_assets_by_hash.call_count == 2
+
+
 @pytest.mark.parametrize(
     ("name", "expected_result"),
     [
@@ -527,6 +928,218 @@ def test_get_album_info(mock_client):
     )
 
 
+def test_download_asset_to_async(mock_client, tmp_path):
+    """Test streaming an asset to a file asynchronously."""
+
+    def handler(request):
+        if request.url.path.endswith("/missing/original"):
+            return httpx.Response(404, json={"message": "Not found"})
+        return httpx.Response(200, content=b"x" * 10)
+
+    async def download(asset_id):
+        async with httpx.AsyncClient(
+            transport=httpx.MockTransport(handler)
+        ) as http_client:
+            return await mock_client.download_asset_to_async(
+                http_client, asset_id, tmp_path / f"{asset_id}.jpg", chunk_size=4
+            )
+
+    assert asyncio.run(download("asset-1")) == 10
+    assert (tmp_path / "asset-1.jpg").read_bytes() == b"x" * 10
+    with pytest.raises(ImmichClientError) as excinfo:
+        asyncio.run(download("missing"))
+    assert excinfo.value.status_code == 404
+
+
+def test_cached_reads_and_invalidation(mock_client, mock_response):
+    """Test repeated reads are cached until a write invalidates them."""
+    mock_response.content = b'{"id": "album-id", "assets": []}'
+    mock_client.client.request.return_value = mock_response
+
+    mock_client.get_album_info("album-id")
+    mock_client.get_album_info("album-id")
+    assert mock_client.client.request.call_count == 1
+
+    # Different parameters are cached separately
+    mock_client.get_album_info("album-id", without_assets=True)
+    assert mock_client.client.request.call_count == 2
+
+    # Album info embeds assets, so an asset write invalidates it
+    mock_client.update_asset("asset-id", isFavorite=True)
+    mock_client.get_album_info("album-id")
+    assert mock_client.client.request.call_count == 4
+
+
+def test_cached_tags_and_albums(mock_client, mock_response):
+    """Test tag and album lists are cached until a tag or album write."""
+    mock_response.content = b"[]"
+    mock_client.client.request.return_value = mock_response
+
+    mock_client.get_all_tags()
+    mock_client.get_all_tags()
+    mock_client.get_all_albums()
+    mock_client.get_all_albums()
+    assert mock_client.client.request.call_count == 2
+
+    mock_client.upsert_tags(["new-tag"])
+    mock_client.get_all_tags()
+    mock_client.get_all_albums()
+    assert mock_client.client.request.call_count == 4
+
+    mock_client.create_album("New Album")
+    mock_client.get_all_tags()
+    mock_client.get_all_albums()
+    assert mock_client.client.request.call_count == 6
+
+
+def test_get_albums_by_name(mock_client, mock_response):
+    """Test the album name index is built once and rebuilt after album writes."""
+    mock_response.content = (
+        b'[{"id": "album-1", "albumName": "Trip"},'
+        b' {"id": "album-2", "albumName": "Trip"},'
+        b' {"id": "album-3", "albumName": "Pets"}]'
+    )
+    mock_client.client.request.return_value = mock_response
+
+    albums = mock_client.get_albums_by_name()
+    assert {name: album["id"] for name, album in albums.items()} == {
+        "Trip": "album-1",
+        "Pets": "album-3",
+    }
+    mock_client.get_albums_by_name()
+    assert mock_client.client.request.call_count == 1
+
+    mock_client.delete_album("album-3")
+    mock_client.get_albums_by_name()
+    assert mock_client.client.request.call_count == 3
+
+
+def test_search_assets_by_filename_pattern_pages(mock_client):
+    """Test filename searches follow nextPage with the query serialized once."""
+    mock_client.post = MagicMock(
+        side_effect=[
+            {"assets": {"items": [{"id": "asset-1"}], "nextPage": "2"}},
+            {"assets": {"items": [{"id": "asset-2"}], "nextPage": None}},
+        ]
+    )
+
+    result = mock_client.search_assets_by_filename_pattern("IMG_")
+
+    assert [asset["id"] for asset in result] == ["asset-1", "asset-2"]
+    assert [
+        json.loads(call.kwargs["json_content"])
+        for call in mock_client.post.call_args_list
+    ] == [
+        {"originalFileName": "IMG_", "size": 999, "page": 1},
+        {"originalFileName": "IMG_", "size": 999, "page": 2},
+    ]
+
+
+def test_cached_asset_lookups(mock_client, mock_response):
+    """Test lookups by checksum and name are cached until an asset write."""
+    mock_client.client.request.return_value = mock_response
+    mock_client.search_assets = MagicMock(
+        return_value=[{"id": "asset-1", "checksum": "abc", "originalFileName": "a"}]
+    )
+
+    mock_client.get_assets_by_hash("abc")
+    mock_client.get_assets_by_hash("abc")
+    mock_client.get_assets_by_name("a")
+    mock_client.get_assets_by_name("a")
+    assert mock_client.search_assets.call_count == 2
+
+    mock_client.delete_assets(["asset-1"])
+    mock_client.get_assets_by_hash("abc")
+    assert mock_client.search_assets.call_count == 3
+
+
+@pytest.mark.parametrize(
+    ("method", "expected_calls"),
+    [("GET", 2), ("PUT", 2), ("POST", 1)],
+)
+def test_request_retries_idempotent_methods(method, expected_calls):
+    """Test only idempotent requests are retried on gateway errors."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(503, json={"message": "Unavailable"})
+
+    client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.retry_delay = 0
+
+    with pytest.raises(ImmichClientError) as excinfo:
+        client._request(method, "/server/ping")
+
+    assert excinfo.value.status_code == 503
+    assert len(calls) == expected_calls
+
+
+def test_request_json_round_trip():
+    """Test JSON request bodies are sent and JSON responses parsed."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json={"name": "Été", "count": 2})
+
+    client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    result = client.post("/albums", json_data={"albumName": "Été"})
+
+    assert result == {"name": "Été", "count": 2}
+    assert requests[0].headers["Content-Type"] == "application/json"
+    assert httpx.Response(200, content=requests[0].content).json() == {
+        "albumName": "Été"
+    }
+
+
+def test_conditional_get_reuses_body_on_not_modified(tmp_path):
+    """Test rarely changing GETs are revalidated with their stored ETag."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        if request.headers.get("If-None-Match") == 'W/"abc"':
+            return httpx.Response(304)
+        return httpx.Response(
+            200, json={"version": "1.0.0"}, headers={"ETag": 'W/"abc"'}
+        )
+
+    def make_client():
+        client = ImmichClient(
+            endpoint="https://immich.example.com",
+            api_key="key",
+            etag_cache_path=tmp_path / "etags.json",
+        )
+        client._client = httpx.Client(transport=httpx.MockTransport(handler))
+        return client
+
+    assert make_client().get_about_info() == {"version": "1.0.0"}
+    # A new client, as in the next CLI run, revalidates from the file
+    assert make_client().get_about_info() == {"version": "1.0.0"}
+
+    assert "If-None-Match" not in requests[0].headers
+    assert requests[1].headers["If-None-Match"] == 'W/"abc"'
+
+
+def test_cached_reads_disabled():
+    """Test reads are not cached when caching is disabled."""
+    client = ImmichClient(
+        endpoint="https://immich.example.com",
+        api_key="test_api_key",
+        cache_reads=False,
+    )
+    client.get = MagicMock(return_value={"id": "asset-id"})
+
+    client.get_asset_info("asset-id")
+    client.get_asset_info("asset-id")
+
+    assert client.get.call_count == 2
+
+
 def test_add_assets_to_album_dry_run(mock_client):
     """Test adding assets to album in dry run mode."""
     mock_client.dry_run = True
@@ -553,6 +1166,44 @@ def test_add_assets_to_album(mock_client):
     assert result == [{"id": "asset-1"}, {"id": "asset-2"}]
 
 
+def test_add_assets_to_album_batches(mock_client):
+    """Test large additions are split into batches and their results joined."""
+    mock_client.put = MagicMock(
+        side_effect=lambda path, json_data, endpoint_name: [
+            {"id": asset_id, "success": True} for asset_id in json_data["ids"]
+        ]
+    )
+    asset_ids = [f"asset-{i}" for i in range(5)]
+
+    with patch("immich_py.api.client.ALBUM_BATCH_SIZE", 2):
+        result = mock_client.add_assets_to_album("album-id", asset_ids)
+
+    # Batches are sent concurrently, so only their results keep their order
+    assert sorted(
+        call.kwargs["json_data"]["ids"] for call in mock_client.put.call_args_list
+    ) == [["asset-0", "asset-1"], ["asset-2", "asset-3"], ["asset-4"]]
+    assert [item["id"] for item in result] == asset_ids
+
+
+def test_create_album_batches_assets(mock_client):
+    """Test a large album is created with one batch and the rest added after."""
+    mock_client.post = MagicMock(return_value={"id": "album-id"})
+    mock_client.add_assets_to_album = MagicMock(return_value=[])
+    asset_ids = [f"asset-{i}" for i in range(5)]
+
+    with patch("immich_py.api.client.ALBUM_BATCH_SIZE", 2):
+        result = mock_client.create_album("Trip", asset_ids=asset_ids)
+
+    assert result == {"id": "album-id"}
+    assert mock_client.post.call_args.kwargs["json_data"]["assetIds"] == [
+        "asset-0",
+        "asset-1",
+    ]
+    mock_client.add_assets_to_album.assert_called_once_with(
+        "album-id", ["asset-2", "asset-3", "asset-4"]
+    )
+
+
 def test_create_album_dry_run(mock_client):
     """Test creating an album in dry run mode."""
     mock_client.dry_run = True
@@ -738,6 +1389,42 @@ def test_bulk_tag_assets(mock_client):
     assert result == {"count": 2}
 
 
+@pytest.mark.parametrize(
+    ("method", "args", "expected"),
+    [
+        ("add_assets_to_album", ("album-1", []), []),
+        ("tag_assets", ("tag-1", []), []),
+        ("bulk_tag_assets", (["tag-1"], []), {"count": 0}),
+        ("bulk_tag_assets", ([], ["asset-1"]), {"count": 0}),
+        ("upsert_tags", ([],), []),
+    ],
+)
+def test_empty_writes_skip_request(mock_client, method, args, expected):
+    """Test writes with nothing to send do not make a request."""
+    mock_client.put = MagicMock()
+
+    assert getattr(mock_client, method)(*args) == expected
+    mock_client.put.assert_not_called()
+
+
+def test_bulk_tag_assets_batches(mock_client):
+    """Test large bulk tagging is split into batches and their counts summed."""
+    mock_client.put = MagicMock(
+        side_effect=lambda path, json_data, endpoint_name: {
+            "count": len(json_data["assetIds"])
+        }
+    )
+    asset_ids = [f"asset-{i}" for i in range(5)]
+
+    with patch("immich_py.api.client.TAG_BATCH_SIZE", 2):
+        result = mock_client.bulk_tag_assets(["tag-1"], asset_ids)
+
+    assert result == {"count": 5}
+    assert sorted(
+        call.kwargs["json_data"]["assetIds"] for call in mock_client.put.call_args_list
+    ) == [["asset-0", "asset-1"], ["asset-2", "asset-3"], ["asset-4"]]
+
+
 def test_create_stack_too_few_assets(mock_client):
     """Test creating a stack with too few assets."""
     with pytest.raises(ImmichClientError) as excinfo:
@@ -807,8 +1494,22 @@ def test_create_job(mock_client):
     assert result == {"id": "job-id"}
 
 
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2024, 2, 29, 7, 5, 9, 123456),
+        datetime(2024, 2, 29, 7, 5, 9, tzinfo=UTC),
+        datetime(1999, 12, 31, 23, 59, 59),
+    ],
+)
+def test_format_timestamp(value):
+    """Test upload timestamps match the strftime format they replace."""
+    assert _format_timestamp(value) == value.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def test_get_mime_type(mock_client):
     """Test getting MIME type from file path."""
+    _mime_type_for_extension.cache_clear()
     with patch("mimetypes.guess_type") as mock_guess_type:
         # Test with known MIME type
         mock_guess_type.return_value = ("image/jpeg", None)
@@ -818,6 +1519,12 @@ def test_get_mime_type(mock_client):
         mock_guess_type.return_value = (None, None)
         assert mock_client._get_mime_type("unknown.xyz") == "application/octet-stream"
 
+        # Lookups are cached per lowercase extension
+        assert mock_client._get_mime_type("/photos/OTHER.JPG") == "image/jpeg"
+        assert mock_client._get_mime_type(Path("/photos/more.jpg")) == "image/jpeg"
+        assert mock_guess_type.call_count == 2
+    _mime_type_for_extension.cache_clear()
+
 
 @pytest.mark.parametrize(
     ("extension", "supported_types", "expected_result"),
@@ -886,6 +1593,10 @@ def test_get_supported_media_types(mock_client):
     assert result[".json"] == "sidecar"
     assert result[".csv"] == "meta"
 
+    # Later calls reuse the list fetched by the first one
+    assert mock_client.get_supported_media_types() is result
+    mock_client.get.assert_called_once()
+
 
 def test_validate_connection(mock_client):
     """Test validating connection."""
@@ -979,3 +1690,137 @@ def test_delete_assets(mock_client):
         endpoint_name="DeleteAssets",
     )
     assert result == {"success": True}
+
+
+def test_progress_file_wrapper_data_callback():
+    """Test the data callback sees each block once even if data is re-read."""
+    received = []
+    sizes = []
+    wrapper = _ProgressFileWrapper(io.BytesIO(b"abcdef"), sizes.append, received.append)
+
+    assert wrapper.read(4) == b"abcd"
+    wrapper.seek(0)
+    assert wrapper.read() == b"abcdef"
+
+    # Re-read data is not counted as progress again
+    assert sizes == [4, 2]
+    assert b"".join(received) == b"abcd"
+
+    assert wrapper.read() == b""
+    wrapper.seek(4)
+    wrapper.read()
+    assert b"".join(received) == b"abcdef"
+
+
+def test_retried_upload_counts_progress_once():
+    """Test a file re-sent after a 503 is counted once in the progress."""
+    statuses = iter([503, 200])
+    bodies = []
+
+    def handler(request):
+        bodies.append(request.read())
+        return httpx.Response(next(statuses), json={"id": "test-id"})
+
+    client = ImmichClient(endpoint="https://immich.example.com", api_key="key")
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    client.retry_delay = 0
+    data = b"x" * 100_000
+    sizes = []
+
+    result = client.put(
+        "/assets/test-id/original",
+        files={
+            "assetData": (
+                "photo.jpg",
+                _ProgressFileWrapper(io.BytesIO(data), sizes.append),
+                "image/jpeg",
+            )
+        },
+    )
+
+    assert result == {"id": "test-id"}
+    assert len(bodies) == 2
+    assert data in bodies[1]
+    assert sum(sizes) == len(data)
+
+
+class _Visibility(enum.Enum):
+    ARCHIVE = "archive"
+
+
+@dataclasses.dataclass
+class _Payload:
+    taken_at: datetime
+
+
+JSON_PAYLOAD = {
+    "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "takenAfter": datetime(2024, 1, 2, 3, 4, 5, 600000, tzinfo=UTC),
+    "takenBefore": datetime(2024, 1, 2),
+    "day": date(2024, 1, 2),
+    "visibility": _Visibility.ARCHIVE,
+    "nested": _Payload(datetime(2024, 1, 2, tzinfo=UTC)),
+    "name": "Café",
+}
+
+
+def test_stdlib_json_dumps_encodes_like_orjson():
+    """Test the json fallback encodes dates, UUIDs and enums as orjson does."""
+    assert json.loads(_stdlib_json_dumps(JSON_PAYLOAD)) == {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "takenAfter": "2024-01-02T03:04:05.600000+00:00",
+        "takenBefore": "2024-01-02T00:00:00",
+        "day": "2024-01-02",
+        "visibility": "archive",
+        "nested": {"taken_at": "2024-01-02T00:00:00+00:00"},
+        "name": "Café",
+    }
+
+
+def test_stdlib_json_dumps_matches_orjson():
+    """Test both JSON serializers produce the same bytes."""
+    orjson = pytest.importorskip("orjson")
+
+    assert _stdlib_json_dumps(JSON_PAYLOAD) == orjson.dumps(JSON_PAYLOAD)
+
+
+def test_stdlib_json_dumps_rejects_unknown_types():
+    """Test the json fallback still rejects values with no JSON form."""
+    with pytest.raises(TypeError, match="object"):
+        _stdlib_json_dumps({"value": object()})
+
+
+@pytest.mark.parametrize(
+    ("module", "class_name"),
+    [(immich_py.api.album, "AlbumAPI"), (immich_py.api.asset, "AssetAPI")],
+)
+def test_passthrough_declarations_match_client(module, class_name):
+    """Test the declared forwarded methods mirror the client's signatures."""
+    tree = ast.parse(inspect.getsource(module))
+    class_node = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.ClassDef) and node.name == class_name
+    )
+    declared = {
+        node.name: node
+        for block in class_node.body
+        if isinstance(block, ast.If) and ast.unparse(block.test) == "TYPE_CHECKING"
+        for node in block.body
+        if isinstance(node, ast.FunctionDef)
+    }
+
+    assert set(declared) == module._PASSTHROUGH
+    for name, node in declared.items():
+        parameters = inspect.signature(getattr(ImmichClient, name)).parameters
+        arguments = node.args
+        assert [a.arg for a in arguments.args] == [
+            p.name
+            for p in parameters.values()
+            if p.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD
+        ]
+        assert [a.arg for a in arguments.kwonlyargs] == [
+            p.name
+            for p in parameters.values()
+            if p.kind is inspect.Parameter.KEYWORD_ONLY
+        ]
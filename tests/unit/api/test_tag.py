@@ -0,0 +1,39 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the TagAPI class.
+"""
+
+from unittest.mock import MagicMock, call
+
+from immich_py.api.tag import TagAPI
+
+
+def test_tag_assets_many_groups_shared_assets():
+    """Test tags with the same assets are sent in one bulk request."""
+    client = MagicMock()
+    client.bulk_tag_assets.return_value = {"count": 2}
+    tag_api = TagAPI(client)
+
+    result = tag_api.tag_assets_many({
+        "tag-1": ["a", "b"],
+        "tag-2": ["b", "a", "a"],
+        "tag-3": ["c"],
+        "tag-4": [],
+    })
+
+    assert client.bulk_tag_assets.call_args_list == [
+        call(["tag-1", "tag-2"], ["a", "b"]),
+        call(["tag-3"], ["c"]),
+    ]
+    assert result == [{"count": 2}, {"count": 2}]
+    client.tag_assets.assert_not_called()
+
+
+def test_tag_assets_many_empty():
+    """Test no assignments make no requests."""
+    client = MagicMock()
+    tag_api = TagAPI(client)
+
+    assert tag_api.tag_assets_many({}) == []
+    client.bulk_tag_assets.assert_not_called()
@@ -4,16 +4,25 @@
 Tests for the upload_utils module.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
 import os
 import shutil
+import tarfile
 import tempfile
+import threading
 import zipfile
 from pathlib import Path
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from immich_py.api.upload_utils import (
+    DEFAULT_MAX_WORKERS,
+    PARALLEL_DECOMPRESSORS,
+    _is_safe_member_name,
+    _upload_files_async,
     extract_archive,
     is_supported_archive,
     process_archive,
@@ -22,6 +31,25 @@ from immich_py.api.upload_utils import (
 )
 
 
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("photo.jpg", True),
+        ("album/photo.jpg", True),
+        ("album/..photo.jpg", True),
+        ("/etc/passwd", False),
+        ("../photo.jpg", False),
+        ("album/../../photo.jpg", False),
+        ("..", False),
+        ("..\\photo.jpg", False),
+        ("\\photo.jpg", False),
+    ],
+)
+def test_is_safe_member_name(name, expected):
+    """Test archive member names that would escape the target are rejected."""
+    assert _is_safe_member_name(name) is expected
+
+
 class TestUploadUtils:
     """Tests for the upload_utils module."""
 
@@ -107,6 +135,92 @@ class TestUploadUtils:
         with pytest.raises(ValueError, match=r"Unsupported archive format:*"):
             extract_archive(self.test_files[0], extract_dir)
 
+    def test_extract_archive_throttles_progress(self, monkeypatch):
+        """Test progress is echoed at most once per interval, plus at the end."""
+        archive_path = os.path.join(self.temp_dir, "many.zip")
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            for i in range(50):
+                zip_file.writestr(f"file_{i}.jpg", "content")
+        echo_calls = []
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: echo_calls.append(msg))
+        monkeypatch.setattr("time.monotonic", lambda: 100.0)
+
+        extract_archive(archive_path, os.path.join(self.temp_dir, "many"))
+
+        progress_messages = [msg for msg in echo_calls if "many.zip:" in msg]
+        assert progress_messages == [
+            "\rmany.zip: 1 / 50 (2.0%)",
+            "\rmany.zip: 50 / 50 (100.0%)",
+        ]
+
+    def test_extract_tar_archive_streams(self, monkeypatch):
+        """Test tar archives are extracted in one pass with a running count."""
+        archive_path = os.path.join(self.temp_dir, "photos.tar.gz")
+        with tarfile.open(archive_path, "w:gz") as tar_file:
+            for file_path in self.test_files:
+                tar_file.add(file_path, arcname=os.path.basename(file_path))
+        echo_calls = []
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: echo_calls.append(msg))
+        extract_dir = os.path.join(self.temp_dir, "photos")
+
+        with patch.object(tarfile.TarFile, "getmembers") as getmembers:
+            extract_archive(archive_path, extract_dir)
+
+        getmembers.assert_not_called()
+        for file_path in self.test_files:
+            assert os.path.exists(
+                os.path.join(extract_dir, os.path.basename(file_path))
+            )
+        progress_messages = [msg for msg in echo_calls if "photos.tar.gz:" in msg]
+        assert progress_messages[-1] == "\rphotos.tar.gz: 3 extracted"
+
+    def test_extract_tar_archive_skips_unsafe_links(self, monkeypatch):
+        """Test links pointing outside the extraction directory are skipped."""
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: None)
+        archive_path = os.path.join(self.temp_dir, "links.tar")
+        with tarfile.open(archive_path, "w") as tar_file:
+            link = tarfile.TarInfo("passwd")
+            link.type = tarfile.SYMTYPE
+            link.linkname = "/etc/passwd"
+            tar_file.addfile(link)
+            tar_file.add(self.test_files[0], arcname="photo.jpg")
+        extract_dir = os.path.join(self.temp_dir, "links")
+
+        extract_archive(archive_path, extract_dir)
+
+        assert os.listdir(extract_dir) == ["photo.jpg"]
+
+    @pytest.mark.skipif(shutil.which("gzip") is None, reason="gzip not installed")
+    def test_extract_tar_archive_with_decompressor(self, monkeypatch):
+        """Test compressed tar archives are read from an external decompressor."""
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: None)
+        monkeypatch.setitem(PARALLEL_DECOMPRESSORS, ".gz", ("gzip", "-dc"))
+        archive_path = os.path.join(self.temp_dir, "photos.tar.gz")
+        with tarfile.open(archive_path, "w:gz") as tar_file:
+            for file_path in self.test_files:
+                tar_file.add(file_path, arcname=os.path.basename(file_path))
+        extract_dir = os.path.join(self.temp_dir, "photos")
+
+        with patch("tarfile.open", wraps=tarfile.open) as tar_open:
+            extract_archive(archive_path, extract_dir)
+
+        assert tar_open.call_args.kwargs["mode"] == "r|"
+        for i, file_path in enumerate(self.test_files):
+            with open(os.path.join(extract_dir, os.path.basename(file_path))) as f:
+                assert f.read() == f"Test content {i}"
+
+    @pytest.mark.skipif(shutil.which("gzip") is None, reason="gzip not installed")
+    def test_extract_tar_archive_decompressor_failure(self, monkeypatch):
+        """Test a failing decompressor is reported as an unreadable archive."""
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: None)
+        monkeypatch.setitem(PARALLEL_DECOMPRESSORS, ".gz", ("gzip", "-dc"))
+        archive_path = os.path.join(self.temp_dir, "broken.tar.gz")
+        with open(archive_path, "wb") as f:
+            f.write(b"not gzip data")
+
+        with pytest.raises(tarfile.ReadError):
+            extract_archive(archive_path, os.path.join(self.temp_dir, "broken"))
+
     def test_process_directory(self):
         """Test process_directory function."""
         # Create a mock upload function
@@ -123,6 +237,239 @@ class TestUploadUtils:
         for call in upload_func.call_args_list:
             assert call[1]["test_arg"] == "test_value"
 
+    def test_process_directory_passes_file_stat(self):
+        """Test process_directory hands each file's stat to the upload function."""
+        os.mkdir(os.path.join(self.temp_dir, "nested"))
+        nested_file = os.path.join(self.temp_dir, "nested", "nested.jpg")
+        with open(nested_file, "w") as f:
+            f.write("Nested content")
+        with open(os.path.join(self.temp_dir, ".hidden.jpg"), "w") as f:
+            f.write("Hidden content")
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        process_directory(self.temp_dir, upload_func)
+
+        sizes = {
+            str(call.args[0]): call.kwargs["file_stat"].st_size
+            for call in upload_func.call_args_list
+        }
+        assert sizes == {
+            path: os.path.getsize(path) for path in [*self.test_files, nested_file]
+        } | {self.archive_path: os.path.getsize(self.archive_path)}
+
+    def test_process_directory_allowed_suffixes(self):
+        """Test process_directory skips files without an allowed suffix."""
+        with open(os.path.join(self.temp_dir, "notes.TXT"), "w") as f:
+            f.write("Notes")
+        with open(os.path.join(self.temp_dir, "upper.JPG"), "w") as f:
+            f.write("Upper")
+        with open(os.path.join(self.temp_dir, "jpg"), "w") as f:
+            f.write("No suffix")
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        process_directory(self.temp_dir, upload_func, allowed_suffixes={".jpg"})
+
+        uploaded = {str(call.args[0]) for call in upload_func.call_args_list}
+        assert uploaded == {
+            *self.test_files,
+            os.path.join(self.temp_dir, "upper.JPG"),
+        }
+
+    def test_process_directory_skips_unreadable_subdirectory(self):
+        """Test a subdirectory that cannot be read does not stop the walk."""
+        locked_dir = os.path.join(self.temp_dir, "locked")
+        os.mkdir(locked_dir)
+        with open(os.path.join(locked_dir, "locked.jpg"), "w") as f:
+            f.write("Locked content")
+        original_scandir = os.scandir
+
+        def scandir(path):
+            if os.fspath(path) == locked_dir:
+                raise PermissionError(13, "Permission denied", path)
+            return original_scandir(path)
+
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        with patch("os.scandir", side_effect=scandir):
+            results = process_directory(self.temp_dir, upload_func)
+
+        uploaded = {str(call.args[0]) for call in upload_func.call_args_list}
+        assert uploaded == {*self.test_files, self.archive_path}
+        assert len(results) == len(uploaded)
+
+    def test_process_directory_skips_unreadable_file(self):
+        """Test a file that cannot be stat()ed does not stop the walk."""
+        unreadable = self.test_files[0]
+        scandir = os.scandir
+
+        class Entry:
+            def __init__(self, entry):
+                self._entry = entry
+
+            def __getattr__(self, name):
+                return getattr(self._entry, name)
+
+            def stat(self, **kwargs):
+                if self._entry.path == unreadable:
+                    raise FileNotFoundError(2, "No such file", self._entry.path)
+                return self._entry.stat(**kwargs)
+
+        class Entries(contextlib.AbstractContextManager):
+            def __init__(self, path):
+                self._entries = scandir(path)
+
+            def __iter__(self):
+                return (Entry(entry) for entry in self._entries)
+
+            def __exit__(self, *exc_info):
+                self._entries.close()
+
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        with patch("os.scandir", side_effect=Entries):
+            process_directory(self.temp_dir, upload_func)
+
+        uploaded = {str(call.args[0]) for call in upload_func.call_args_list}
+        assert uploaded == {*self.test_files[1:], self.archive_path}
+
+    def test_upload_files_async_cancel_stops_walk(self, monkeypatch):
+        """Test cancelled uploads release the walk blocked on a full queue."""
+        monkeypatch.setattr("immich_py.api.upload_utils.WALK_POLL_INTERVAL", 0.01)
+        file_path = Path(self.test_files[0])
+        file_stat = file_path.stat()
+        walk_done = threading.Event()
+
+        def files():
+            try:
+                while True:
+                    yield file_path, file_stat
+            finally:
+                walk_done.set()
+
+        async def upload_func(path, **kwargs):
+            await asyncio.Event().wait()
+
+        async def run():
+            task = asyncio.create_task(
+                _upload_files_async(
+                    files(),
+                    "album",
+                    upload_func,
+                    max_workers=1,
+                    session=None,
+                    kwargs={},
+                )
+            )
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+        runner = threading.Thread(target=asyncio.run, args=(run(),), daemon=True)
+        runner.start()
+        runner.join(timeout=5)
+
+        assert not runner.is_alive()
+        assert walk_done.is_set()
+
+    def test_process_directory_max_workers(self):
+        """Test process_directory bounds the number of concurrent uploads."""
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        with patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as executor:
+            results = process_directory(self.temp_dir, upload_func, max_workers=2)
+
+        executor.assert_called_once_with(2)
+        assert len(results) == len(self.test_files) + 1
+        assert all("max_workers" not in call.kwargs for call in upload_func.mock_calls)
+
+    def test_process_directory_streams_files(self):
+        """Test uploads start before the directory walk has finished."""
+        walk_done = False
+        seen_during_walk = []
+
+        def fake_iter_files(directory_path, allowed_suffixes=None):
+            nonlocal walk_done
+            for i in range(10):
+                yield Path(directory_path) / f"file_{i}.jpg", os.stat(self.temp_dir)
+            walk_done = True
+
+        def upload_func(file_path, **kwargs):
+            seen_during_walk.append(not walk_done)
+            return {"id": file_path.name}
+
+        with patch("immich_py.api.upload_utils._iter_files", fake_iter_files):
+            results = process_directory(self.temp_dir, upload_func, max_workers=1)
+
+        assert len(results) == 10
+        assert seen_during_walk[0]
+
+    def test_process_directory_default_max_workers(self):
+        """Test process_directory caps concurrent uploads by default."""
+        upload_func = MagicMock(return_value={"id": "test-id", "status": "created"})
+
+        with patch(
+            "concurrent.futures.ThreadPoolExecutor",
+            wraps=concurrent.futures.ThreadPoolExecutor,
+        ) as executor:
+            process_directory(self.temp_dir, upload_func)
+
+        executor.assert_called_once_with(DEFAULT_MAX_WORKERS)
+
+    def test_process_directory_async_upload_func(self):
+        """Test a coroutine upload function shares one client on an event loop."""
+        http_client = object()
+        sessions = []
+        in_flight = 0
+        peak = 0
+
+        @contextlib.asynccontextmanager
+        async def session():
+            await asyncio.sleep(0)
+            sessions.append(http_client)
+            yield http_client
+
+        async def upload_func(file_path, *, http_client, file_stat, test_arg):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if Path(file_path).name == "test_file_1.jpg":
+                msg = "Upload failed"
+                raise RuntimeError(msg)
+            return {"client": http_client, "size": file_stat.st_size}
+
+        results = process_directory(
+            self.temp_dir,
+            upload_func,
+            max_workers=2,
+            session=session,
+            test_arg="test_value",
+        )
+
+        # One file fails and is left out; the others share the one client
+        assert len(results) == len(self.test_files)
+        assert all(result["client"] is http_client for result in results)
+        assert sessions == [http_client]
+        assert peak == 2
+
+    def test_process_upload_path_async_file(self):
+        """Test a single file is uploaded with a coroutine upload function."""
+
+        async def upload_func(file_path, **kwargs):
+            await asyncio.sleep(0)
+            return {"path": file_path, **kwargs}
+
+        result = process_upload_path(
+            self.test_files[0], upload_func, test_arg="test_value"
+        )
+
+        assert result == {"path": Path(self.test_files[0]), "test_arg": "test_value"}
+
     def test_process_archive(self, monkeypatch):
         """Test process_archive function."""
         # Create a mock upload function
@@ -153,6 +500,77 @@ class TestUploadUtils:
             for call in echo_calls
         )
 
+    def test_process_archive_skips_hidden_files(self, monkeypatch):
+        """Test hidden archive members are neither extracted nor uploaded."""
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: None)
+        archive_path = os.path.join(self.temp_dir, "mac.zip")
+        with zipfile.ZipFile(archive_path, "w") as zip_file:
+            zip_file.writestr("photo.jpg", b"photo")
+            zip_file.writestr("__MACOSX/._photo.jpg", b"fork")
+        extracted = []
+        original_extract = zipfile.ZipFile.extract
+
+        def extract(zip_ref, member, path=None, pwd=None):
+            extracted.append(member.filename)
+            return original_extract(zip_ref, member, path, pwd)
+
+        monkeypatch.setattr(zipfile.ZipFile, "extract", extract)
+        upload_func = MagicMock(return_value={"id": "test-id"})
+
+        results = process_archive(archive_path, upload_func)
+
+        assert len(results) == 1
+        assert upload_func.call_args.args[0].name == "photo.jpg"
+        assert extracted == ["photo.jpg"]
+
+    def test_process_archive_allowed_suffixes(self, monkeypatch):
+        """Test archive members without an allowed suffix are not extracted."""
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: None)
+        archive_path = os.path.join(self.temp_dir, "mixed.tar")
+        with tarfile.open(archive_path, "w") as tar_file:
+            tar_file.add(self.test_files[0], arcname="album/photo.jpg")
+            tar_file.add(self.test_files[1], arcname="album/readme.txt")
+        extracted = []
+        original_extract = tarfile.TarFile.extract
+
+        def extract(tar_ref, member, path="", **kwargs):
+            extracted.append(member.name)
+            return original_extract(tar_ref, member, path, **kwargs)
+
+        monkeypatch.setattr(tarfile.TarFile, "extract", extract)
+        upload_func = MagicMock(return_value={"id": "test-id"})
+
+        results = process_archive(
+            archive_path, upload_func, allowed_suffixes=frozenset({".jpg"})
+        )
+
+        assert len(results) == 1
+        assert upload_func.call_args.args[0].name == "photo.jpg"
+        assert "album/readme.txt" not in extracted
+
+    def test_process_archive_streams_extraction(self, monkeypatch):
+        """Test archive files are uploaded during extraction and then deleted."""
+        echo_calls = []
+        monkeypatch.setattr("click.echo", lambda msg, nl=True: echo_calls.append(msg))
+        uploaded = []
+        removed_before_upload = []
+
+        def upload_func(file_path, **kwargs):
+            removed_before_upload.append(sum(not p.exists() for p in uploaded))
+            uploaded.append(file_path)
+            echo_calls.append(f"uploaded {file_path.name}")
+            return {"id": file_path.name}
+
+        results = process_archive(self.archive_path, upload_func, max_workers=1)
+
+        assert len(results) == len(self.test_files)
+        complete = next(
+            i for i, msg in enumerate(echo_calls) if msg.startswith("Extraction of")
+        )
+        assert echo_calls.index(f"uploaded {uploaded[0].name}") < complete
+        # The first file is deleted before the last one is uploaded
+        assert removed_before_upload[-1] >= 1
+
     def test_process_upload_path_file(self):
         """Test process_upload_path with a file."""
         # Create a mock upload function
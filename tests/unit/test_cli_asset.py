@@ -0,0 +1,35 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the asset CLI commands.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from click.testing import CliRunner
+
+from immich_py.cli.commands.asset import asset
+from immich_py.models.asset import Asset
+
+
+def test_list_assets_prints_count_after_assets():
+    """Test asset list streams the assets and prints the count last."""
+    assets = [
+        Asset.from_dict({
+            "id": f"asset-{i}",
+            "originalFileName": f"photo_{i}.jpg",
+            "fileCreatedAt": "2024-01-02T00:00:00.000Z",
+        })
+        for i in range(2)
+    ]
+
+    with patch("immich_py.cli.commands.asset.AssetAPI") as mock_asset_api:
+        mock_asset_api.return_value.iter_assets.return_value = iter(assets)
+        result = CliRunner().invoke(
+            asset, ["list"], obj={"client": MagicMock()}, catch_exceptions=False
+        )
+
+    lines = result.output.splitlines()
+    assert result.exit_code == 0, result.output
+    assert [line.split(" - ")[0] for line in lines[:-1]] == ["asset-0", "asset-1"]
+    assert lines[-1] == "Found 2 assets."
@@ -0,0 +1,63 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the registration of the CLI command modules.
+"""
+
+import importlib
+import pkgutil
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from immich_py.cli import commands
+from immich_py.cli.main import main
+
+COMMAND_MODULES = sorted(
+    module.name for module in pkgutil.iter_modules(commands.__path__)
+)
+
+
+def test_command_modules_registered():
+    """Test each command module is registered once, under its own name."""
+    assert sorted(commands.__all__) == COMMAND_MODULES
+    assert main.list_commands(click.Context(main)) == COMMAND_MODULES
+
+
+@pytest.mark.parametrize("name", COMMAND_MODULES)
+def test_lazy_command_resolves(name):
+    """Test a lazily registered command imports the click command itself."""
+    command = main.get_command(click.Context(main), name)
+
+    assert isinstance(command, click.Command)
+    assert command.name == name
+    module = importlib.import_module(f"immich_py.cli.commands.{name}")
+    assert getattr(module, name) is command
+
+
+@pytest.mark.parametrize("name", COMMAND_MODULES)
+def test_lazy_command_after_module_import(name, monkeypatch):
+    """Test a command resolves once its module has been imported directly."""
+    # Start from a package that has not imported the module yet
+    module_name = f"immich_py.cli.commands.{name}"
+    monkeypatch.delitem(sys.modules, module_name, raising=False)
+    monkeypatch.delattr(commands, name, raising=False)
+    importlib.import_module(module_name)
+
+    command = main.get_command(click.Context(main), name)
+    result = CliRunner().invoke(main, [name, "--help"])
+
+    assert isinstance(command, click.Command)
+    assert result.exit_code == 0, result.output
+    assert f"Usage: main {name}" in result.output
+
+
+def test_executable_spec_lists_command_modules():
+    """Test the PyInstaller spec bundles every lazily imported command module."""
+    spec = (Path(__file__).parents[2] / "immich-py.spec").read_text()
+
+    for name in COMMAND_MODULES:
+        assert f'"immich_py.cli.commands.{name}"' in spec
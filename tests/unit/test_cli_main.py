@@ -0,0 +1,58 @@
+# Copyright (c) 2025. All rights reserved.
+# Licensed under the MIT License. See LICENSE file for details.
+"""
+Tests for the main CLI entry point.
+"""
+
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from immich_py.cli.main import main
+
+
+def test_http2_requires_h2():
+    """Test --http2 is rejected with a usage error when h2 is missing."""
+    with (
+        patch("immich_py.cli.main.HTTP2_AVAILABLE", False),
+        patch("immich_py.cli.main.ImmichClient") as mock_client,
+    ):
+        result = CliRunner().invoke(
+            main,
+            [
+                "-e",
+                "https://immich.example.com",
+                "-k",
+                "key",
+                "--http2",
+                "job",
+                "--help",
+            ],
+        )
+
+    assert result.exit_code == 2
+    assert "--http2 requires the 'h2' package" in result.output
+    mock_client.assert_not_called()
+
+
+def test_http2_with_h2():
+    """Test --http2 is passed to the client when h2 is installed."""
+    with (
+        patch("immich_py.cli.main.HTTP2_AVAILABLE", True),
+        patch("immich_py.cli.main.ImmichClient") as mock_client,
+    ):
+        result = CliRunner().invoke(
+            main,
+            [
+                "-e",
+                "https://immich.example.com",
+                "-k",
+                "key",
+                "--http2",
+                "job",
+                "--help",
+            ],
+        )
+
+    assert result.exit_code == 0, result.output
+    assert mock_client.call_args.kwargs["http2"] is True